@@ -7,43 +7,48 @@ It will try multiple methods to obtain authentication credentials.
 """
 
 import os
+import random
 import sys
 import subprocess
-from typing import List, Tuple, Optional
+import time
+from typing import Iterator, Tuple, Optional
 from urllib.parse import urlparse
 
+# Same pacing and backoff as the gh fallback: GitHub asks clients to create
+# content one request at a time, at most about one per second
+from create_issues_from_todo import MAX_RETRIES, RATE_LIMIT_MARKERS, RETRY_BASE_DELAY, SUBMIT_INTERVAL
+
 # Configuration
 DEFAULT_REPO = "frankvaneykelen/lineup-radar"
+MAX_RESET_WAIT = 15 * 60  # Longest wait (seconds) for the primary rate limit to reset before giving up
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print("Error: requests library not found.")
     print("Please install it with: pip install requests")
     sys.exit(1)
 
 
-def parse_todo_file(todo_path: str) -> List[Tuple[str, int]]:
-    """Parse TODO.md and extract unchecked items."""
-    with open(todo_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    unchecked_items = []
+def parse_todo_file(todo_path: str) -> Iterator[Tuple[str, int]]:
+    """Parse TODO.md and yield (text, line number) for each unchecked item."""
     in_todo_section = False
     
-    for line_num, line in enumerate(lines, start=1):
-        # Check for section headers (any level 1 heading)
-        if line.strip().startswith('# '):
-            in_todo_section = (line.strip() == "# To Do List")
-            continue
-        
-        # Only process unchecked items in the "To Do List" section
-        if in_todo_section and line.strip().startswith('- [ ]'):
-            todo_text = line.strip()[6:].strip()
-            if todo_text:
-                unchecked_items.append((todo_text, line_num))
-    
-    return unchecked_items
+    with open(todo_path, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, start=1):
+            stripped = line.strip()
+            
+            # Check for section headers (any level 1 heading)
+            if stripped.startswith('# '):
+                in_todo_section = (stripped == "# To Do List")
+                continue
+            
+            # Only process unchecked items in the "To Do List" section
+            if in_todo_section and stripped.startswith('- [ ]'):
+                todo_text = stripped[6:].strip()
+                if todo_text:
+                    yield (todo_text, line_num)
 
 
 def get_github_token() -> Optional[str]:
@@ -71,30 +76,8 @@ def get_github_token() -> Optional[str]:
     return None
 
 
-def create_github_issue(repo: str, title: str, body: str, token: str) -> dict:
-    """Create a GitHub issue using the REST API."""
-    url = f"https://api.github.com/repos/{repo}/issues"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28"
-    }
-    data = {
-        "title": title,
-        "body": body,
-        "labels": ["enhancement", "from-todo"]
-    }
-    
-    response = requests.post(url, json=data, headers=headers)
-    response.raise_for_status()
-    return response.json()
-
-
-def main():
-    repo_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    todo_path = os.path.join(repo_path, "documentation", "TODO.md")
-    
-    # Get repository name from git remote
+def get_repo_name(repo_path: str) -> str:
+    """Get the owner/repo name from the git remote, falling back to DEFAULT_REPO."""
     try:
         result = subprocess.run(
             ['git', 'remote', 'get-url', 'origin'],
@@ -124,6 +107,86 @@ def main():
     except Exception:
         repo_name = DEFAULT_REPO
     
+    return repo_name
+
+
+def create_github_session(token: str) -> requests.Session:
+    """Create a requests session that reuses keep-alive connections to the GitHub API."""
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28"
+    })
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    return session
+
+
+class RateLimitExhausted(RuntimeError):
+    """The primary rate limit is used up and resets too late to wait for."""
+
+
+def is_rate_limited(response: requests.Response) -> bool:
+    """Return True if GitHub rejected the request because of a (secondary) rate limit."""
+    if response.status_code == 429:
+        return True
+    if response.status_code != 403:
+        return False
+    if response.headers.get('Retry-After') or response.headers.get('x-ratelimit-remaining') == '0':
+        return True
+    return any(marker in response.text.lower() for marker in RATE_LIMIT_MARKERS)
+
+
+def create_github_issue(repo: str, title: str, body: str, session: requests.Session,
+                        retries: int = MAX_RETRIES) -> dict:
+    """
+    Create a GitHub issue using the REST API.
+    
+    Rate-limited requests are retried after Retry-After. When the primary
+    rate limit is used up (x-ratelimit-remaining: 0), the retry waits until
+    x-ratelimit-reset, or RateLimitExhausted is raised if that is more than
+    MAX_RESET_WAIT away. Other rate limits are retried with exponential
+    backoff. Other errors are not retried, because the issue may already have
+    been created.
+    """
+    url = f"https://api.github.com/repos/{repo}/issues"
+    data = {
+        "title": title,
+        "body": body,
+        "labels": ["enhancement", "from-todo"]
+    }
+    
+    for attempt in range(retries):
+        response = session.post(url, json=data)
+        if is_rate_limited(response) and attempt < retries - 1:
+            retry_after = response.headers.get('Retry-After', '')
+            reset = response.headers.get('x-ratelimit-reset', '')
+            if retry_after.isdigit():
+                delay = float(retry_after)
+            elif response.headers.get('x-ratelimit-remaining') == '0' and reset.isdigit():
+                # Primary limit: backing off for seconds would only burn the retries
+                delay = max(0.0, int(reset) - time.time()) + 1
+                if delay > MAX_RESET_WAIT:
+                    reset_at = time.strftime('%H:%M:%S', time.localtime(int(reset)))
+                    raise RateLimitExhausted(
+                        f"GitHub API rate limit exhausted; it resets at {reset_at} (in {delay / 60:.0f} min)"
+                    )
+            else:
+                delay = RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, 0.5)
+            print(f"    Rate limited, retrying in {delay:.1f}s ({attempt + 1}/{retries - 1})...")
+            time.sleep(delay)
+            continue
+        response.raise_for_status()
+        return response.json()
+
+
+def main():
+    repo_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    todo_path = os.path.join(repo_path, "documentation", "TODO.md")
+    
+    # Get repository name from git remote
+    repo_name = get_repo_name(repo_path)
+    
     # Get GitHub token
     print("Attempting to obtain GitHub authentication...")
     github_token = get_github_token()
@@ -141,10 +204,11 @@ def main():
         sys.exit(1)
     
     print("✓ GitHub token obtained")
+    session = create_github_session(github_token)
     
     # Parse TODO file
     print(f"\nParsing {todo_path}...")
-    unchecked_items = parse_todo_file(todo_path)
+    unchecked_items = list(parse_todo_file(todo_path))
     
     if not unchecked_items:
         print("No unchecked items found in TODO.md")
@@ -157,7 +221,8 @@ def main():
     created_count = 0
     failed_count = 0
     
-    for i, (todo_text, line_num) in enumerate(unchecked_items, start=1):
+    tasks = []
+    for todo_text, line_num in unchecked_items:
         title = todo_text if len(todo_text) <= 100 else todo_text[:97] + "..."
         body = f"""This task was imported from the TODO list.
 
@@ -166,16 +231,26 @@ def main():
 
 **Source:** `documentation/TODO.md` (line {line_num})
 """
-        
-        print(f"\n[{i}/{len(unchecked_items)}] Creating: {title[:60]}...")
-        
+        tasks.append((title, body))
+    
+    # Create issues one at a time, in TODO.md order
+    for i, (title, body) in enumerate(tasks, start=1):
+        if i > 1:
+            time.sleep(SUBMIT_INTERVAL)
+        print(f"\n[{i}/{len(tasks)}] {title[:60]}...")
         try:
-            issue = create_github_issue(repo_name, title, body, github_token)
+            issue = create_github_issue(repo_name, title, body, session)
             print(f"  ✓ Created issue #{issue['number']}: {issue['html_url']}")
             created_count += 1
+        except RateLimitExhausted as e:
+            # Every remaining item would fail the same way
+            print(f"  ✗ {e}")
+            failed_count += len(tasks) - i + 1
+            print(f"    Stopping; the last {len(tasks) - i + 1} item(s) were not created.")
+            break
         except requests.exceptions.HTTPError as e:
             print(f"  ✗ Failed: {e}")
-            if e.response:
+            if e.response is not None:
                 print(f"    Response: {e.response.text[:200]}")
             failed_count += 1
         except Exception as e:
@@ -6,10 +6,34 @@ This script parses the TODO.md file and creates GitHub issues for all
 unchecked items using the GitHub CLI (gh).
 """
 
+import argparse
+import hashlib
+import http.client
+import json
 import os
+import random
+import re
+import shutil
 import subprocess
 import sys
-from typing import List, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+TODO_SECTION_HEADING = "# To Do List"
+HEADING_RE = re.compile(r'^[^\S\n]*# .*$', re.MULTILINE)  # Any level 1 heading
+UNCHECKED_ITEM_RE = re.compile(r'^[^\S\n]*- \[ \](.*)$', re.MULTILINE)
+ISSUE_LABELS = ["enhancement", "from-todo"]
+# GitHub asks clients to create content one request at a time, at most about
+# one per second, so the per-item fallback is serial (and in TODO.md order)
+# unless --concurrency asks for more
+DEFAULT_CONCURRENCY = 1
+MAX_CONCURRENCY = 8
+SUBMIT_INTERVAL = 1.0  # Seconds between serial issue creations
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 1.0  # Seconds; doubles on every retry (1s, 2s, 4s, 8s)
+RATE_LIMIT_MARKERS = ("secondary rate limit", "abuse", "was submitted too quickly")
+GITHUB_API_HOST = "api.github.com"
 
 
 def parse_todo_file(todo_path: str) -> List[Tuple[str, int]]:
@@ -23,62 +47,315 @@ def parse_todo_file(todo_path: str) -> List[Tuple[str, int]]:
         List of tuples (todo_text, line_number)
     """
     with open(todo_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+        text = f.read()
     
     unchecked_items = []
-    in_todo_section = False
+    line_num = 1
+    line_pos = 0
+    headings = list(HEADING_RE.finditer(text))
     
-    for line_num, line in enumerate(lines, start=1):
-        # Check for section headers (any level 1 heading)
-        if line.strip().startswith('# '):
-            in_todo_section = (line.strip() == "# To Do List")
+    for i, heading in enumerate(headings):
+        # Only scan the "To Do List" section, up to the next level 1 heading
+        if heading.group(0).strip() != TODO_SECTION_HEADING:
             continue
+        section_end = headings[i + 1].start() if i + 1 < len(headings) else len(text)
         
-        # Only process unchecked items in the "To Do List" section
-        if in_todo_section and line.strip().startswith('- [ ]'):
+        for match in UNCHECKED_ITEM_RE.finditer(text, heading.end(), section_end):
             # Extract the todo text (remove the checkbox part)
-            todo_text = line.strip()[6:].strip()
+            todo_text = match.group(1).strip()
             if todo_text:  # Only add non-empty items
+                # Count newlines incrementally since the previous match
+                line_num += text.count("\n", line_pos, match.start())
+                line_pos = match.start()
                 unchecked_items.append((todo_text, line_num))
     
     return unchecked_items
 
 
-def create_github_issue_with_gh(title: str, body: str) -> bool:
+def create_github_issue_with_gh(title: str, body: str, gh_path: str, retries: int = MAX_RETRIES) -> Optional[str]:
     """
     Create a GitHub issue using the GitHub CLI (gh).
     
+    Secondary rate-limit errors are retried with exponential backoff.
+    
     Args:
         title: Issue title
         body: Issue body/description
+        gh_path: Absolute path to the gh executable
+        retries: Maximum number of attempts
+        
+    Returns:
+        URL of the created issue, or None on failure
+    """
+    for attempt in range(retries):
+        try:
+            # Use gh CLI to create issue (prints the new issue URL)
+            result = subprocess.run(
+                [gh_path, "issue", "create", 
+                 "--title", title,
+                 "--body", body,
+                 "--label", ",".join(ISSUE_LABELS)],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            return result.stdout.strip()
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr or ""
+            is_rate_limited = any(marker in stderr.lower() for marker in RATE_LIMIT_MARKERS)
+            if is_rate_limited and attempt < retries - 1:
+                delay = RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, 0.5)
+                print(f"    Rate limited, retrying in {delay:.1f}s ({attempt + 1}/{retries - 1})...")
+                time.sleep(delay)
+                continue
+            print(f"    Error: {stderr}")
+            return None
+    return None
+
+
+def build_issue(todo_text: str, line_num: int) -> Tuple[str, str]:
+    """
+    Build the issue title and body for a TODO item.
+    
+    Args:
+        todo_text: Text of the unchecked TODO item
+        line_num: Line number in TODO.md
+        
+    Returns:
+        Tuple of (title, body)
+    """
+    # Create a concise title (first 100 chars)
+    title = todo_text
+    if len(title) > 100:
+        title = title[:97] + "..."
+    
+    # Create issue body with context
+    body = f"""This task was imported from the TODO list.
+
+**Original TODO item:**
+{todo_text}
+
+**Source:** `documentation/TODO.md` (line {line_num})
+"""
+    return title, body
+
+
+def todo_cache_key(todo_text: str) -> str:
+    """Cache key for a TODO item (edited items get a new key and are re-created)."""
+    return hashlib.sha256(todo_text.encode('utf-8')).hexdigest()
+
+
+def load_issue_cache(cache_path: str) -> Dict[str, str]:
+    """
+    Load the cache of TODO items that were already turned into issues.
+    
+    Args:
+        cache_path: Path to the JSON cache file
+        
+    Returns:
+        Dict mapping todo_cache_key() to issue URL
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_issue_cache(cache_path: str, cache: Dict[str, str]):
+    """Write the issue cache atomically (temp file + os.replace)."""
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, cache_path)
+
+
+def get_github_token(gh_path: str) -> str:
+    """Get a GitHub token from GH_TOKEN/GITHUB_TOKEN, or ask gh once."""
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    result = subprocess.run(
+        [gh_path, "auth", "token"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return result.stdout.strip()
+
+
+class BatchOutcomeUnknown(RuntimeError):
+    """The batched mutation was sent but no usable response came back; issues may exist."""
+
+
+class GitHubGraphQLClient:
+    """GitHub GraphQL client that reuses one keep-alive HTTPS connection."""
+    
+    def __init__(self, token: str):
+        self.token = token
+        self.connection = None
+    
+    def execute(self, query: str, variables: Dict, resend: bool = True) -> Dict:
+        """
+        Run a GraphQL request over the shared connection.
+        
+        Args:
+            query: GraphQL query or mutation document
+            variables: GraphQL variables
+            resend: Reconnect and send again when a reused connection fails.
+                Pass False for mutations, which may already have been applied.
+            
+        Returns:
+            Parsed JSON response (may contain both "data" and "errors")
+        """
+        payload = json.dumps({"query": query, "variables": variables}).encode('utf-8')
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+            "User-Agent": "lineup-radar-todo-issues",
+        }
+        
+        while True:
+            # A reused connection may have been closed by the server; reconnect once
+            reused = self.connection is not None
+            if self.connection is None:
+                self.connection = http.client.HTTPSConnection(GITHUB_API_HOST, timeout=60)
+            try:
+                self.connection.request("POST", "/graphql", body=payload, headers=headers)
+                response = self.connection.getresponse()
+                body = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                self.close()
+                if not reused or not resend:
+                    raise
+        
+        try:
+            return json.loads(body)
+        except ValueError:
+            raise RuntimeError(f"HTTP {response.status} from GitHub GraphQL API")
+    
+    def close(self):
+        """Close the underlying connection."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+def get_repo_name(gh_path: str) -> str:
+    """Get the owner/name of the current repository."""
+    repo = os.environ.get("GITHUB_REPOSITORY")
+    if repo:
+        return repo
+    result = subprocess.run(
+        [gh_path, "repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return result.stdout.strip()
+
+
+def create_issues_batch(repo: str, issues: List[Tuple[str, str]], client: GitHubGraphQLClient) -> List[Optional[str]]:
+    """
+    Create all issues with a single batched GraphQL request.
+    
+    The repository and label node IDs are resolved once, then one document
+    with an aliased createIssue mutation per item is sent in one request.
+    
+    Args:
+        repo: Repository as owner/name
+        issues: List of (title, body) tuples
+        client: GraphQL client to send the requests with
         
     Returns:
-        True if successful, False otherwise
+        List with the issue URL for each item, or None where creation failed
+        
+    Raises:
+        BatchOutcomeUnknown: If the mutation was sent but the response was lost
+            or unreadable, so some issues may have been created
     """
+    owner, name = repo.split("/", 1)
+    label_fields = " ".join(
+        f'l{i}: label(name: {json.dumps(label)}) {{ id }}' for i, label in enumerate(ISSUE_LABELS)
+    )
+    response = client.execute(
+        f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ id {label_fields} }} }}",
+        {"owner": owner, "name": name}
+    )
+    repository = (response.get("data") or {}).get("repository")
+    if not repository:
+        raise RuntimeError(f"could not resolve repository {repo}: {response.get('errors')}")
+    
+    label_ids = []
+    for i, label in enumerate(ISSUE_LABELS):
+        if repository.get(f"l{i}"):
+            label_ids.append(repository[f"l{i}"]["id"])
+        else:
+            print(f"  ⚠ Label '{label}' does not exist in {repo}; issues are created without it")
+    
+    params = ["$rid: ID!", "$labels: [ID!]"]
+    mutations = []
+    variables = {"rid": repository["id"], "labels": label_ids}
+    for i, (title, body) in enumerate(issues):
+        params.append(f"$t{i}: String!, $b{i}: String!")
+        mutations.append(
+            f"i{i}: createIssue(input: {{repositoryId: $rid, title: $t{i}, body: $b{i}, labelIds: $labels}}) "
+            f"{{ issue {{ number url }} }}"
+        )
+        variables[f"t{i}"] = title
+        variables[f"b{i}"] = body
+    
     try:
-        # Use gh CLI to create issue
-        result = subprocess.run(
-            ["gh", "issue", "create", 
-             "--title", title,
-             "--body", body,
-             "--label", "enhancement,from-todo"],
-            capture_output=True,
-            text=True,
-            check=True
+        response = client.execute(
+            f"mutation({', '.join(params)}) {{ {' '.join(mutations)} }}",
+            variables,
+            resend=False
         )
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"    Error: {e.stderr}")
-        return False
-    except FileNotFoundError:
-        print("    Error: 'gh' command not found. Please install GitHub CLI.")
-        return False
+    except (http.client.HTTPException, OSError, RuntimeError) as e:
+        raise BatchOutcomeUnknown(str(e)) from e
+    data = response.get("data") or {}
+    if response.get("errors"):
+        print(f"  ⚠ Batch returned errors: {response['errors']}")
+    
+    urls = []
+    for i in range(len(issues)):
+        created = data.get(f"i{i}") or {}
+        issue = created.get("issue") or {}
+        urls.append(issue.get("url"))
+    return urls
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Create GitHub issues from unchecked items in documentation/TODO.md"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Parallel gh issue create calls for the per-item fallback (default: {DEFAULT_CONCURRENCY}, "
+             f"max: {MAX_CONCURRENCY}); more than 1 can hit GitHub's secondary rate limits and "
+             f"creates issues out of TODO.md order"
+    )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Create fallback issues one at a time (the default; overrides --concurrency)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only print the issues that would be created (no gh or network calls)"
+    )
+    args = parser.parse_args()
+    workers = 1 if args.serial else max(1, min(args.concurrency, MAX_CONCURRENCY))
+    
     # Configuration
     repo_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     todo_path = os.path.join(repo_path, "documentation", "TODO.md")
+    cache_path = os.path.join(repo_path, ".cache", "todo-issues.json")
     
     # Parse TODO file
     print(f"Parsing {todo_path}...")
@@ -91,10 +368,19 @@ def main():
     print(f"\nFound {len(unchecked_items)} unchecked TODO items")
     print("=" * 80)
     
-    # Check if gh CLI is available
-    try:
-        subprocess.run(["gh", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if args.dry_run:
+        cache = load_issue_cache(cache_path)
+        for i, (todo_text, line_num) in enumerate(unchecked_items, start=1):
+            title, body = build_issue(todo_text, line_num)
+            status = " (already created)" if todo_cache_key(todo_text) in cache else ""
+            print(f"\n[{i}/{len(unchecked_items)}] {title}{status}")
+            print(f"  {body.splitlines()[0]}")
+        print("\nDry run: no issues were created")
+        return
+    
+    # Resolve the gh CLI once; every call below uses the absolute path
+    gh_path = shutil.which("gh")
+    if gh_path is None:
         print("\nError: GitHub CLI (gh) is not installed or not in PATH.")
         print("Please install it from: https://cli.github.com/")
         print("\nAlternatively, you can manually create issues from the list below:")
@@ -104,39 +390,101 @@ def main():
             print(f"   (Source: documentation/TODO.md, line {line_num})")
         sys.exit(1)
     
-    # Create issues
+    # Skip items that were already turned into issues on a previous run
+    cache = load_issue_cache(cache_path)
+    skipped_count = 0
+    
+    # Build issue titles and bodies
+    issues = []
+    for todo_text, line_num in unchecked_items:
+        key = todo_cache_key(todo_text)
+        if key in cache:
+            print(f"  ↷ Already created at {cache[key]}: {todo_text[:60]}")
+            skipped_count += 1
+            continue
+        
+        title, body = build_issue(todo_text, line_num)
+        issues.append((key, title, body))
+    
     created_count = 0
     failed_count = 0
     
-    for i, (todo_text, line_num) in enumerate(unchecked_items, start=1):
-        # Create a concise title (first 100 chars)
-        title = todo_text
-        if len(title) > 100:
-            title = title[:97] + "..."
-        
-        # Create issue body with context
-        body = f"""This task was imported from the TODO list.
-
-**Original TODO item:**
-{todo_text}
-
-**Source:** `documentation/TODO.md` (line {line_num})
-"""
-        
-        print(f"\n[{i}/{len(unchecked_items)}] Creating issue: {title[:60]}...")
-        
-        if create_github_issue_with_gh(title, body):
-            print(f"  ✓ Created successfully")
-            created_count += 1
-        else:
-            print(f"  ✗ Failed to create issue")
-            failed_count += 1
+    try:
+        if issues:
+            # Create all issues in one batched GraphQL request
+            client = None
+            try:
+                print(f"\nCreating {len(issues)} issues in one batched request...")
+                client = GitHubGraphQLClient(get_github_token(gh_path))
+                urls = create_issues_batch(
+                    get_repo_name(gh_path), [(title, body) for _, title, body in issues], client
+                )
+            except BatchOutcomeUnknown as e:
+                # Retrying could create every issue twice; let the user check first
+                print(f"  ✗ No response to the batched request ({e})")
+                print("    Some issues may have been created. Check them with: gh issue list --label from-todo")
+                print("    Then re-run this script; it does not retry on its own.")
+                sys.exit(1)
+            except Exception as e:
+                # Nothing was sent to createIssue yet, so the fallback cannot create duplicates
+                print(f"  ⚠ Batched creation failed ({e}), falling back to one request per issue")
+                urls = [None] * len(issues)
+            finally:
+                if client is not None:
+                    client.close()
+            
+            pending = []
+            for i, ((key, title, body), url) in enumerate(zip(issues, urls), start=1):
+                if url:
+                    print(f"\n[{i}/{len(issues)}] ✓ Created: {url}")
+                    cache[key] = url
+                    created_count += 1
+                else:
+                    pending.append((i, key, title, body))
+            
+            # Fall back to gh issue create for aliases that came back null or with errors
+            if pending and workers == 1:
+                print(f"\nCreating {len(pending)} remaining issues with gh issue create (one at a time)...")
+                for n, (i, key, title, body) in enumerate(pending):
+                    if n:
+                        time.sleep(SUBMIT_INTERVAL)
+                    print(f"\n[{i}/{len(issues)}] {title[:60]}...")
+                    url = create_github_issue_with_gh(title, body, gh_path)
+                    if url:
+                        print(f"  ✓ Created successfully: {url}")
+                        cache[key] = url
+                        created_count += 1
+                    else:
+                        print(f"  ✗ Failed to create issue")
+                        failed_count += 1
+            elif pending:
+                print(f"\nCreating {len(pending)} remaining issues with gh issue create ({workers} parallel)...")
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(create_github_issue_with_gh, title, body, gh_path): (i, key, title)
+                        for i, key, title, body in pending
+                    }
+                    for future in as_completed(futures):
+                        i, key, title = futures[future]
+                        print(f"\n[{i}/{len(issues)}] {title[:60]}...")
+                        url = future.result()
+                        if url:
+                            print(f"  ✓ Created successfully: {url}")
+                            cache[key] = url
+                            created_count += 1
+                        else:
+                            print(f"  ✗ Failed to create issue")
+                            failed_count += 1
+    finally:
+        # Persist progress even when interrupted
+        save_issue_cache(cache_path, cache)
     
     # Summary
     print("\n" + "=" * 80)
     print(f"Summary:")
     print(f"  - Created: {created_count} issues")
     print(f"  - Failed: {failed_count} issues")
+    print(f"  - Skipped (already created): {skipped_count} issues")
     print(f"  - Total: {len(unchecked_items)} items")
     
     if created_count > 0:
@@ -12,17 +12,99 @@ from pathlib import Path
 # Add scripts directory to sys.path to import helpers
 sys.path.insert(0, str(Path(__file__).parent))
 
+import concurrent.futures
 import csv
-from typing import Dict, List
+import logging
+import os
+import queue
+import re
+import subprocess
+from typing import Dict, List, Optional, Tuple
 import json
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from operator import itemgetter
+import requests
+from requests.adapters import HTTPAdapter
 from helpers.config import get_festival_config
+from helpers.json_utils import dumps_compact, loads_json
 from helpers.genre_utils import normalize_genre_row, normalize_genre_value, audit_genre_separators
+from helpers.llm_cache import make_cache_key, get_cached_response, store_response, disable_llm_cache
+from helpers.rate_limiter import RateLimiter, parse_duration
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever create_enrichment_prompt() changes so
+# cached AI responses from older prompts are not reused.
+PROMPT_VERSION = "3"
+
+# Default concurrent AI requests in --parallel mode (GitHub Models is heavily
+# rate limited); --workers overrides these up to MAX_WORKERS_LIMIT
+AZURE_MAX_WORKERS = 5
+GITHUB_MODELS_MAX_WORKERS = 2
+MAX_WORKERS_LIMIT = 20
+
+# Proactive request-rate ceilings, shared by all workers of a provider
+AZURE_RATE_LIMITER = RateLimiter(45, 1.0)
+GITHUB_MODELS_RATE_LIMITER = RateLimiter(2.9, 1.0)
+MAX_RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_DEFAULT_WAIT = 60  # Seconds to wait after a 429 without Retry-After
+
+# Artists per AI request in --parallel mode; the static prompt is sent once per batch
+BATCH_SIZE = 10
+
+# Output budget per artist: the JSON answer (including an echoed bio and the
+# bio_extraction object) is typically 250-450 tokens
+MAX_TOKENS_PER_ARTIST = 600
+
+# Save the CSV after this many newly enriched artists, so an interrupted run keeps its progress
+CHECKPOINT_INTERVAL = 10
+
+# JSON wrapped in a ```json (or bare ```) code fence; an unterminated fence runs to the end
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|\Z)", re.DOTALL)
+
+# Cheap, deterministic bio facts for columns that never trigger an AI call
+_GROUP_SIZE_RE = re.compile(r"\b(duo|trio|quartet|quintet|sextet)\b", re.IGNORECASE)
+_GROUP_SIZES = {"duo": "2", "trio": "3", "quartet": "4", "quintet": "5", "sextet": "6"}
+_MALE_PRONOUN_RE = re.compile(r"\b(?:he|his|him|himself)\b", re.IGNORECASE)
+_FEMALE_PRONOUN_RE = re.compile(r"\b(?:she|her|hers|herself)\b", re.IGNORECASE)
+# "formerly half of the duo X", "ex-member of the trio Y": the group is not the act itself
+_FORMER_GROUP_RE = re.compile(r"\b(?:half of|former(?:ly)?|member of|part of|one of|with)\s+(?:the\s+|a\s+)?$", re.IGNORECASE)
+MIN_PRONOUN_COUNT = 3  # Pronoun hits needed before trusting the gender heuristic
+
+# Columns that must be filled for an artist to count as enriched
+ESSENTIAL_FIELDS = ("Tagline", "Genre", "Country", "Bio", "AI Summary", "AI Rating")
+
+# JSON mode: the model must return a single valid JSON object (batch answers are
+# wrapped in {"artists": [...]} for this reason)
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+ENRICHMENT_SYSTEM_MESSAGE = "You are a music expert providing accurate, factual information about artists. Return only valid JSON."
+
+
+def start_log_listener() -> QueueListener:
+    """
+    Send this module's log output through a queue drained by one background thread.
+    
+    Worker threads only enqueue records; a single listener thread writes them
+    to stdout, so parallel workers never block on or interleave console output.
+    Call stop() on the returned listener to flush the remaining messages.
+    """
+    log_queue = queue.Queue(-1)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, handler)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
 
 
 def load_csv(csv_path: Path) -> tuple[List[str], List[Dict]]:
     """Load CSV file and return headers and rows."""
     if not csv_path.exists():
-        print(f"✗ CSV file not found: {csv_path}")
+        logger.error(f"✗ CSV file not found: {csv_path}")
         sys.exit(1)
     
     with open(csv_path, 'r', encoding='utf-8-sig') as f:
@@ -33,56 +115,101 @@ def load_csv(csv_path: Path) -> tuple[List[str], List[Dict]]:
 
 
 def save_csv(csv_path: Path, headers: List[str], rows: List[Dict]):
-    """Save CSV file with UTF-8 encoding."""
+    """
+    Save CSV file with UTF-8 encoding.
+    
+    Writes to a temporary file first and atomically replaces the CSV, so an
+    interrupted save never leaves a truncated file behind.
+    """
     for row in rows:
         normalize_genre_row(row)
 
     offenders = audit_genre_separators(rows)
     if offenders:
-        print(f"  ⚠️  Normalized genre separators for {len(offenders)} artist(s) before saving")
+        logger.warning(f"  ⚠️  Normalized genre separators for {len(offenders)} artist(s) before saving")
 
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+    tmp_path = csv_path.with_name(csv_path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
         writer = csv.DictWriter(f, fieldnames=headers)
         writer.writeheader()
         writer.writerows(rows)
+    os.replace(tmp_path, csv_path)
 
 
 def needs_enrichment(row: Dict, force: bool = False) -> bool:
     """Check if artist row needs data enrichment."""
     if force:
         return True  # Enrich all fields regardless of current values
-    essential_fields = ["Tagline", "Genre", "Country", "Bio", "AI Summary", "AI Rating"]
-    return any(not row.get(field, "").strip() for field in essential_fields)
+    for field in ESSENTIAL_FIELDS:
+        value = row.get(field)
+        # Empty/None values skip the strip() call; stop at the first empty field
+        if not value or not value.strip():
+            return True
+    return False
 
 
-def create_enrichment_prompt(artist_name: str, existing_bio: str = "") -> str:
-    """Create a prompt for AI to enrich artist data."""
-    bio_instruction = ""
-    context_note = ""
+def select_rows_to_enrich(headers: List[str], rows: List[Dict], force: bool = False,
+                          artist_name_filter: str = None) -> List[int]:
+    """
+    Return the indices of the rows that need enrichment, in a single pass.
     
-    if existing_bio:
-        bio_instruction = f'\n    "Bio": "{existing_bio}" (PRESERVE THIS EXACT BIO - do not change or rewrite it),'
-        context_note = f"\n\nCONTEXT: The artist's bio is: \"{existing_bio}\"\nUse this bio as the primary source of truth. Base your critical assessment on the information in this bio, not on speculation or generic statements."
+    Rows without an artist name are skipped. When the CSV has every essential
+    column, the fields of a row are fetched with one itemgetter call instead
+    of a dict lookup per field.
+    """
+    name_filter = artist_name_filter.lower() if artist_name_filter else None
+    if force or not all(field in headers for field in ESSENTIAL_FIELDS):
+        def is_incomplete(row):
+            return needs_enrichment(row, force)
     else:
-        bio_instruction = '\n    "Bio": "concise 1-2 sentence biography focusing on their music style and achievements",'
-    
-    return f"""Provide comprehensive information about the musical artist "{artist_name}" in JSON format with these exact fields:{context_note}
+        get_essential_fields = itemgetter(*ESSENTIAL_FIELDS)
+
+        def is_incomplete(row):
+            return not all((value or "").strip() for value in get_essential_fields(row))
+
+    selected = []
+    for index, row in enumerate(rows):
+        artist_name = (row.get("Artist") or "").strip()
+        if not artist_name or (name_filter and artist_name.lower() != name_filter):
+            continue
+        if is_incomplete(row):
+            selected.append(index)
+    return selected
 
-{{
+
+# Static instructions go first so every request shares a byte-identical prefix;
+# Azure OpenAI / OpenAI cache long prompt prefixes automatically, so only the
+# artist-specific tail appended by create_enrichment_prompt() is billed in full.
+STATIC_PROMPT_PREFIX = """Provide comprehensive information about the musical artist named at the end of this message in JSON format with these exact fields:
+
+{
     "Tagline": "A single-sentence tagline or hook that summarizes the artist, REQUIRED if you are able to generate an AI Summary and AI Rating (do not leave empty if those are present)",
     "Genre": "primary genre(s), separated by /",
-    "Country": "country of origin (use short names: UK, USA, DR Congo, etc.)",{bio_instruction}
+    "Country": "country of origin (use short names: UK, USA, DR Congo, etc.)",
+    "Bio": "if a BIO is given at the end of this message, PRESERVE THAT EXACT BIO - do not change or rewrite it; otherwise a concise 1-2 sentence biography focusing on their music style and achievements",
     "AI Summary": "brief critical assessment based on the bio provided or from reviews/consensus - BE SPECIFIC about their sound/style, avoid generic phrases like 'emerging artist' or 'shows promise' (or empty string if no bio and insufficient public info)",
     "AI Rating": "rating from 1-10 based on critical acclaim, live reputation, and artistic significance (or empty string if insufficient info)",
     "Spotify Link": "full Spotify artist URL (https://open.spotify.com/artist/...)",
     "Number of People in Act": "number as integer, or empty if solo/varies",
     "Gender of Front Person": "Male/Female/Mixed/Non-binary. Do not guess - leave empty if uncertain. Only use this list, do not use other terms like pronouns.",
-    "Front Person of Color?": "Yes/No"
-}}
+    "Front Person of Color?": "Yes/No",
+    "bio_extraction": "see FESTIVAL BIO EXTRACTION below"
+}
+
+FESTIVAL BIO EXTRACTION:
+If a FESTIVAL BIO (English or Dutch) is given at the end of this message, set "bio_extraction" to an object with ONLY explicitly stated factual information from that festival bio, using these exact keys (empty string if not found):
+{
+    "Genre": "musical style/genre explicitly mentioned (e.g., \"jazz\", \"indie rock\", \"psychedelia\")",
+    "Country": "country explicitly mentioned; accept city names only if they clearly indicate the country (e.g., \"Amsterdam\" → Netherlands, \"Berlin\" → Germany, \"Istanbul\" → Turkey)",
+    "Number of People in Act": "group size if stated (e.g., \"trio\" = 3, \"quartet\" = 4, \"duo\" = 2, \"solo\" = 1)",
+    "Gender of Front Person": "only if pronouns (he/his, she/her, they/them) are used consistently or gender is explicitly stated; \"Mixed\" if multiple genders are mentioned",
+    "Front Person of Color?": "\"Yes\" ONLY if the festival bio explicitly mentions ethnicity, heritage, or cultural background that clearly indicates it (e.g., \"Turkish-German\", \"Nigerian\", \"Brazilian\"); otherwise empty"
+}
+Be extremely conservative in "bio_extraction" - if information is ambiguous or not stated, use an empty string. If no FESTIVAL BIO is given, set "bio_extraction" to null.
 
 CRITICAL GUIDELINES:
 - If you generate an AI Summary and AI Rating, you MUST also generate a Tagline. Only leave Tagline empty if those fields are also empty or you have no reliable information about the artist.
-- If a bio is provided in the context, use it as your PRIMARY source - extract genre, country, and style details from it
+- If a bio is provided in the context, use it as your PRIMARY source of truth - extract genre, country, and style details from it. Base your critical assessment on the information in this bio, not on speculation or generic statements.
 - For "AI Summary": If bio is provided, write a specific assessment based on the bio's content (their sound, influences, achievements mentioned)
 - AVOID generic phrases like "emerging artist with growing following" or "shows promise" - be specific about their musical style
 - Example good "AI Summary": "Their blend of Anatolian psychedelia with modern electronic beats creates a hypnotic sound; strong stage presence"
@@ -110,28 +237,108 @@ RATING SCALE (USE THE FULL RANGE - aim for a realistic bell curve):
 PREVENT MISTAKES:
 - ex_libris on the Rewire Festival is not a metal band - he is a solo electronic artist from the Netherlands
 
-Return ONLY valid JSON, no additional text."""
+Return ONLY valid JSON, no additional text.
+"""
+
+
+def create_ai_session(pool_size: int) -> requests.Session:
+    """Create a requests session whose keep-alive connections are shared by all workers."""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+    return session
+
 
+# Default session for all AI requests, so sequential runs also keep their
+# TLS connection alive between artists; sized for the largest worker pool.
+_SESSION = create_ai_session(MAX_WORKERS_LIMIT)
 
-def enrich_artist_with_ai(artist_name: str, existing_bio: str = "", rating_boost: float = 0.0) -> Dict[str, str]:
+
+def post_chat_completion(endpoint: str, headers: Dict[str, str], payload: Dict, limiter: RateLimiter,
+                         session: Optional[requests.Session] = None) -> Dict:
     """
-    Use Azure OpenAI or GitHub Models API to enrich artist data.
+    POST a chat completion request, staying under the provider's rate limit.
+
+    Every request first waits for the limiter, so 429 responses should be rare.
+    When one still happens the limiter is paused for the Retry-After delay, so
+    all workers sharing it hold back (instead of collecting more 429s while
+    only this one sleeps), and the request is retried.
+
+    Returns:
+        Parsed JSON response
+
+    Raises:
+        requests.exceptions.RequestException: On HTTP or connection errors
+    """
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        limiter.acquire()
+        response = (session or _SESSION).post(endpoint, headers=headers, json=payload, timeout=30)
+        limiter.update_from_headers(response.headers)
+        if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+            break
+        wait = parse_duration(response.headers.get("Retry-After", "")) or RATE_LIMIT_DEFAULT_WAIT
+        logger.warning(f"  ⏳ Rate limited (429), pausing all requests for {wait:.0f}s...")
+        limiter.pause(wait)
+    response.raise_for_status()
+    return loads_json(response.content)
+
+
+# Artist-specific tails; only these are formatted per call
+_PROMPT_TAIL = '\nARTIST: "{artist_name}"'
+_PROMPT_TAIL_WITH_BIO = _PROMPT_TAIL + '\nBIO: "{existing_bio}"'
+_FESTIVAL_BIO_TAIL = '\nFESTIVAL BIO: "{festival_bio}"'
+
+
+def create_enrichment_prompt(artist_name: str, existing_bio: str = "", festival_bio: str = "") -> str:
+    """Create a prompt for AI to enrich artist data.
+
+    The artist name and bios are appended after STATIC_PROMPT_PREFIX so the
+    rubric stays cacheable across requests.
+    """
+    if existing_bio:
+        prompt = STATIC_PROMPT_PREFIX + _PROMPT_TAIL_WITH_BIO.format(artist_name=artist_name, existing_bio=existing_bio)
+    else:
+        prompt = STATIC_PROMPT_PREFIX + _PROMPT_TAIL.format(artist_name=artist_name)
+    if festival_bio:
+        prompt += _FESTIVAL_BIO_TAIL.format(festival_bio=festival_bio)
+    return prompt
+
+
+BATCH_PROMPT_INSTRUCTIONS = """
+BATCH MODE: Instead of a single artist, apply all of the instructions above to EACH of the {count} artists in the JSON array below. Each entry has an "artist" name, a "bio" and a "festival_bio"; a non-empty "bio" is that artist's BIO and a non-empty "festival_bio" is that artist's FESTIVAL BIO.
+Return ONLY a JSON object of the form {{"artists": [...]}} containing exactly {count} objects with the fields above, in the same order as the input. Add an "Artist" field with the input name to each object.
+"""
+
+
+def create_batch_enrichment_prompt(artists: List[Tuple[str, str, str]]) -> str:
+    """Create a prompt that enriches several (artist_name, existing_bio, festival_bio) tuples at once."""
+    artist_list = json.dumps(
+        [
+            {"artist": artist_name, "bio": existing_bio, "festival_bio": festival_bio}
+            for artist_name, existing_bio, festival_bio in artists
+        ],
+        ensure_ascii=False,
+        indent=2
+    )
+    return STATIC_PROMPT_PREFIX + BATCH_PROMPT_INSTRUCTIONS.format(count=len(artists)) + artist_list
+
+
+@lru_cache(maxsize=1)
+def resolve_ai_credentials() -> Optional[Tuple[str, Dict[str, str], str, bool]]:
+    """
+    Resolve which AI endpoint to use for enrichment.
     
-    Args:
-        artist_name: Name of the artist to enrich
-        existing_bio: Existing bio to preserve (if any)
-        rating_boost: Rating adjustment for discovery/curated festivals (default 0.0)
+    Cached: environment variables are read and `gh auth token` is run only
+    once per process instead of once per artist.
     
     Priority order:
     1. Azure OpenAI (if AZURE_OPENAI_KEY and AZURE_OPENAI_ENDPOINT are set)
     2. GitHub Models (if GITHUB_TOKEN is set)
     3. OpenAI (if OPENAI_API_KEY is set)
-    """
-    import os
-    import requests
-    import subprocess
-    import time
     
+    Returns:
+        Tuple of (endpoint, headers, model_name, use_azure), or None if no
+        authentication was found
+    """
     # Check for Azure OpenAI first (recommended for pay-as-you-go)
     azure_key = os.getenv("AZURE_OPENAI_KEY")
     azure_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
@@ -145,53 +352,135 @@ def enrich_artist_with_ai(artist_name: str, existing_bio: str = "", rating_boost
             "Content-Type": "application/json",
             "api-key": azure_key
         }
-        model_name = azure_deployment
-        use_azure = True
+        return endpoint, headers, azure_deployment, True
+    
+    # Try GitHub token
+    api_key = None
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode == 0:
+            api_key = result.stdout.strip()
+    except:
+        pass
+    
+    if not api_key:
+        api_key = os.getenv("GITHUB_TOKEN") or os.getenv("OPENAI_API_KEY")
+    
+    if not api_key:
+        return None
+    
+    endpoint = "https://models.github.ai/inference/chat/completions"
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28"
+    }
+    return endpoint, headers, "openai/gpt-4o", False
+
+
+def log_missing_auth(label: str):
+    """Log setup hints when no AI credentials were found."""
+    logger.error(f"  ✗ {label}: No authentication found")
+    logger.info(f"     Option 1 (Recommended): Azure OpenAI with your credits:")
+    logger.info(f"       Set: $env:AZURE_OPENAI_KEY = 'your-key'")
+    logger.info(f"            $env:AZURE_OPENAI_ENDPOINT = 'https://your-resource.openai.azure.com'")
+    logger.info(f"     Option 2: GitHub Models (free, rate limited):")
+    logger.info(f"       Set: $env:GITHUB_TOKEN = 'your-token'")
+
+
+def parse_ai_json(content: str) -> str:
+    """
+    Return the JSON text of an AI response, without ``` code fences or surrounding whitespace.
+    
+    Requests use JSON mode, so fences should not occur; this only guards
+    against deployments that ignore response_format.
+    """
+    match = _FENCE_RE.search(content)
+    return (match.group(1) if match else content).strip()
+
+
+def finalize_artist_data(artist_name: str, artist_data: Dict, rating_boost: float, provider: str) -> Dict:
+    """Normalize genre, validate the rating and apply the festival rating boost."""
+    if "Genre" in artist_data:
+        original_genre = str(artist_data.get("Genre", "") or "")
+        normalized_genre = normalize_genre_value(original_genre)
+        if normalized_genre != original_genre.strip():
+            logger.warning(f"  ⚠️  {artist_name}: Normalized Genre separator to slash format")
+        artist_data["Genre"] = normalized_genre
+
+    # Validate and log rating issues
+    rating = artist_data.get("AI Rating", "")
+    my_take = artist_data.get("AI Summary", "")
+
+    # Convert rating to string and handle edge cases
+    if rating == 0 or rating == "0":
+        logger.warning(f"  ⚠️  {artist_name}: AI returned rating 0 (not enough publicly available critical reviews or performance data) - setting to empty")
+        artist_data["AI Rating"] = ""
+    elif not str(rating).strip():
+        logger.warning(f"  ⚠️  {artist_name}: AI returned empty rating (not enough publicly available critical reviews or performance data)")
+        artist_data["AI Rating"] = ""
     else:
-        # Try GitHub token
-        api_key = None
-        try:
-            result = subprocess.run(
-                ["gh", "auth", "token"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                api_key = result.stdout.strip()
-        except:
-            pass
-        
-        if not api_key:
-            api_key = os.getenv("GITHUB_TOKEN") or os.getenv("OPENAI_API_KEY")
-        
-        if not api_key:
-            print(f"  ✗ {artist_name}: No authentication found")
-            print(f"     Option 1 (Recommended): Azure OpenAI with your credits:")
-            print(f"       Set: $env:AZURE_OPENAI_KEY = 'your-key'")
-            print(f"            $env:AZURE_OPENAI_ENDPOINT = 'https://your-resource.openai.azure.com'")
-            print(f"     Option 2: GitHub Models (free, rate limited):")
-            print(f"       Set: $env:GITHUB_TOKEN = 'your-token'")
-            return {}
-        
-        endpoint = "https://models.github.ai/inference/chat/completions"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}",
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28"
-        }
-        model_name = "openai/gpt-4o"
-        use_azure = False
+        # Apply rating boost for discovery/curated festivals
+        if rating_boost != 0.0:
+            try:
+                original_rating = float(rating)
+                boosted_rating = original_rating + rating_boost
+                # Clamp to 1-10 range and round to nearest integer
+                boosted_rating = max(1, min(10, round(boosted_rating)))
+                artist_data["AI Rating"] = str(boosted_rating)
+                if boosted_rating != original_rating:
+                    logger.info(f"  📊 {artist_name}: Rating adjusted {original_rating:.1f} → {boosted_rating} (boost: +{rating_boost})")
+            except (ValueError, TypeError):
+                # Keep original rating if conversion fails
+                pass
+
+    if not my_take.strip():
+        logger.warning(f"  ⚠️  {artist_name}: AI returned empty 'AI Summary' (not enough publicly available critical reviews or performance data)")
+
+    logger.info(f"  ✓ {artist_name}: Enriched with AI ({provider})")
+    return artist_data
+
+
+def enrich_artist_with_ai(artist_name: str, existing_bio: str = "", rating_boost: float = 0.0,
+                          session: Optional[requests.Session] = None, festival_bio: str = "",
+                          force: bool = False) -> Dict[str, str]:
+    """
+    Use Azure OpenAI or GitHub Models API to enrich artist data.
+    
+    Args:
+        artist_name: Name of the artist to enrich
+        existing_bio: Existing bio to preserve (if any)
+        rating_boost: Rating adjustment for discovery/curated festivals (default 0.0)
+        session: Optional session to use instead of the shared module-level one
+        festival_bio: Festival bio to extract metadata from in the same request (if any)
+        force: Ignore a cached response and ask the API again (the new answer is cached)
+    
+    Returns:
+        Enriched fields, plus a "bio_extraction" dict (or None) with the facts
+        stated in the festival bio
+    
+    See resolve_ai_credentials() for the provider priority order.
+    """
+    credentials = resolve_ai_credentials()
+    if credentials is None:
+        log_missing_auth(artist_name)
+        return {}
+    endpoint, headers, model_name, use_azure = credentials
     
-    prompt = create_enrichment_prompt(artist_name, existing_bio)
-    print(f"\n--- AI PROMPT for {artist_name} ---\n{prompt}\n--- END PROMPT ---\n")
+    prompt = create_enrichment_prompt(artist_name, existing_bio, festival_bio)
+    logger.info(f"\n--- AI PROMPT for {artist_name} ---\n{prompt}\n--- END PROMPT ---\n")
 
     payload = {
         "messages": [
             {
                 "role": "system",
-                "content": "You are a music expert providing accurate, factual information about artists. Return only valid JSON."
+                "content": ENRICHMENT_SYSTEM_MESSAGE
             },
             {
                 "role": "user",
@@ -200,182 +489,278 @@ def enrich_artist_with_ai(artist_name: str, existing_bio: str = "", rating_boost
         ],
         "model": model_name,
         "temperature": 0.3,
-        "max_tokens": 1000
+        "max_tokens": MAX_TOKENS_PER_ARTIST,
+        "response_format": JSON_RESPONSE_FORMAT
     }
 
-    try:
-        response = requests.post(endpoint, headers=headers, json=payload, timeout=30)
-        response.raise_for_status()
+    cache_key = make_cache_key(model_name, PROMPT_VERSION, "enrich", artist_name, existing_bio, festival_bio)
 
-        result = response.json()
-        content = result["choices"][0]["message"]["content"]
+    try:
+        content = None if force else get_cached_response(cache_key)
+        if content is None:
+            limiter = AZURE_RATE_LIMITER if use_azure else GITHUB_MODELS_RATE_LIMITER
+            result = post_chat_completion(endpoint, headers, payload, limiter, session)
+            content = result["choices"][0]["message"]["content"]
+        else:
+            logger.info(f"  ↷ {artist_name}: Using cached AI response")
 
-        print(f"--- AI RAW RESULT for {artist_name} ---\n{content}\n--- END RESULT ---\n")
+        logger.info(f"--- AI RAW RESULT for {artist_name} ---\n{content}\n--- END RESULT ---\n")
 
         # Extract JSON from response
-        content = content.strip()
-        if content.startswith("```json"):
-            content = content.split("```json")[1].split("```", 1)[0].strip()
-        elif content.startswith("```"):
-            content = content.split("```", 1)[1].split("```", 1)[0].strip()
+        content = parse_ai_json(content)
 
         if not content:
-            print(f"  ⚠️  {artist_name}: AI returned no content!\n")
+            logger.warning(f"  ⚠️  {artist_name}: AI returned no content!\n")
             return {}
 
-        artist_data = json.loads(content)
-        if "Genre" in artist_data:
-            original_genre = str(artist_data.get("Genre", "") or "")
-            normalized_genre = normalize_genre_value(original_genre)
-            if normalized_genre != original_genre.strip():
-                print(f"  ⚠️  {artist_name}: Normalized Genre separator to slash format")
-            artist_data["Genre"] = normalized_genre
+        artist_data = loads_json(content)
+        store_response(cache_key, content)
         provider = "Azure OpenAI" if use_azure else "GitHub Models"
 
-        # Validate and log rating issues
-        rating = artist_data.get("AI Rating", "")
-        my_take = artist_data.get("AI Summary", "")
-
-        # Convert rating to string and handle edge cases
-        if rating == 0 or rating == "0":
-            print(f"  ⚠️  {artist_name}: AI returned rating 0 (not enough publicly available critical reviews or performance data) - setting to empty")
-            artist_data["AI Rating"] = ""
-        elif not str(rating).strip():
-            print(f"  ⚠️  {artist_name}: AI returned empty rating (not enough publicly available critical reviews or performance data)")
-            artist_data["AI Rating"] = ""
-        else:
-            # Apply rating boost for discovery/curated festivals
-            if rating_boost != 0.0:
-                try:
-                    original_rating = float(rating)
-                    boosted_rating = original_rating + rating_boost
-                    # Clamp to 1-10 range and round to nearest integer
-                    boosted_rating = max(1, min(10, round(boosted_rating)))
-                    artist_data["AI Rating"] = str(boosted_rating)
-                    if boosted_rating != original_rating:
-                        print(f"  📊 {artist_name}: Rating adjusted {original_rating:.1f} → {boosted_rating} (boost: +{rating_boost})")
-                except (ValueError, TypeError):
-                    # Keep original rating if conversion fails
-                    pass
-
-        if not my_take.strip():
-            print(f"  ⚠️  {artist_name}: AI returned empty 'AI Summary' (not enough publicly available critical reviews or performance data)")
-
-        print(f"  ✓ {artist_name}: Enriched with AI ({provider})")
-
         # No delay needed with Azure OpenAI
-        return artist_data
+        return finalize_artist_data(artist_name, artist_data, rating_boost, provider)
 
     except requests.exceptions.RequestException as e:
         error_msg = str(e)
-        print(f"  ✗ {artist_name}: API error - {e}")
+        logger.error(f"  ✗ {artist_name}: API error - {e}")
         return {}
     except (json.JSONDecodeError, KeyError) as e:
-        print(f"  ✗ {artist_name}: Invalid response - {e}")
+        logger.error(f"  ✗ {artist_name}: Invalid response - {e}")
         return {}
 
 
-def extract_metadata_from_bio(artist_name: str, festival_bio: str) -> Dict[str, str]:
+def enrich_artists_batch(artists: List[Tuple[str, str, str]], rating_boost: float = 0.0,
+                         session: Optional[requests.Session] = None, force: bool = False) -> List[Dict[str, str]]:
     """
-    Extract metadata from festival bio using AI.
-    Only extracts factual information that is explicitly stated in the bio.
+    Enrich several artists with a single AI request.
+    
+    The static prompt is sent once for the whole batch instead of once per
+    artist. Cached artists are skipped, and any artist the batch response does
+    not cover (request error, unparseable JSON, wrong number of results) falls
+    back to an individual enrich_artist_with_ai() call.
     
     Args:
-        artist_name: Name of the artist
-        festival_bio: Festival bio text (English or Dutch)
-        
+        artists: List of (artist_name, existing_bio, festival_bio) tuples
+        rating_boost: Rating adjustment for discovery/curated festivals (default 0.0)
+        session: Optional session to use instead of the shared module-level one
+        force: Ignore cached responses and ask the API again (new answers are cached)
+    
     Returns:
-        Dictionary with extracted metadata (only fields with high confidence)
+        List of enriched data dicts in the same order as artists ({} on failure)
     """
-    prompt = f"""Extract ONLY explicitly stated factual information from this festival bio for artist "{artist_name}". 
-Be extremely conservative - only include information that is clearly stated. If not explicitly mentioned, return empty string.
-
-Festival Bio:
-{festival_bio}
-
-Extract the following if explicitly stated:
-1. Genre: Musical style/genre explicitly mentioned (e.g., "jazz", "indie rock", "psychedelia")
-2. Country: Country explicitly mentioned (look for country names or city names that clearly indicate country)
-3. Number of People in Act: Group size if stated (e.g., "trio" = 3, "quartet" = 4, "duo" = 2, "solo" = 1)
-4. Gender of Front Person: If pronouns (he/his, she/her, they/them) clearly indicate gender, or if explicitly stated
-5. Person of Color: ONLY if bio explicitly mentions ethnicity, heritage, or cultural background that clearly indicates (e.g., "Turkish-German", "Nigerian", "Brazilian"). Leave empty if uncertain.
-
-IMPORTANT RULES:
-- Country: Accept city names only if they clearly indicate the country (e.g., "Amsterdam" → Netherlands, "Berlin" → Germany, "Istanbul" → Turkey)
-- Gender: Only extract if pronouns are used consistently OR if explicitly stated. "Mixed" if multiple genders mentioned.
-- Person of Color: Be very cautious. Only mark "Yes" if ethnicity/heritage is explicitly mentioned. Default to empty if unsure.
-- If information is ambiguous or not stated, return empty string for that field
-
-Return valid JSON with these exact keys (use empty string if not found):
-{{
-  "Genre": "...",
-  "Country": "...",
-  "Number of People in Act": "...",
-  "Gender of Front Person": "...",
-  "Front Person of Color?": ""
-}}"""
-
-    import os
-    import requests
-    import json
-    
-    # Check for Azure OpenAI credentials
-    azure_key = os.getenv("AZURE_OPENAI_KEY")
-    azure_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-    azure_deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4o")
-    
-    if azure_key and azure_endpoint:
-        endpoint = f"{azure_endpoint.rstrip('/')}/openai/deployments/{azure_deployment}/chat/completions?api-version=2024-02-15-preview"
-        headers = {
-            "Content-Type": "application/json",
-            "api-key": azure_key
+    credentials = resolve_ai_credentials()
+    if credentials is None:
+        log_missing_auth(f"Batch of {len(artists)} artists")
+        return [{} for _ in artists]
+    endpoint, headers, model_name, use_azure = credentials
+    provider = "Azure OpenAI" if use_azure else "GitHub Models"
+
+    results: List[Optional[Dict[str, str]]] = [None] * len(artists)
+    pending = []
+    for index, (artist_name, existing_bio, festival_bio) in enumerate(artists):
+        cached = None if force else get_cached_response(
+            make_cache_key(model_name, PROMPT_VERSION, "enrich", artist_name, existing_bio, festival_bio)
+        )
+        if cached is not None:
+            try:
+                artist_data = loads_json(parse_ai_json(cached))
+                logger.info(f"  ↷ {artist_name}: Using cached AI response")
+                results[index] = finalize_artist_data(artist_name, artist_data, rating_boost, provider)
+                continue
+            except json.JSONDecodeError:
+                pass
+        pending.append(index)
+
+    if len(pending) > 1:
+        batch = [artists[index] for index in pending]
+        names = ", ".join(artist_name for artist_name, _, _ in batch)
+        prompt = create_batch_enrichment_prompt(batch)
+        logger.info(f"\n--- AI BATCH PROMPT for {names} ---\n{prompt}\n--- END PROMPT ---\n")
+
+        payload = {
+            "messages": [
+                {
+                    "role": "system",
+                    "content": ENRICHMENT_SYSTEM_MESSAGE
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "model": model_name,
+            "temperature": 0.3,
+            "max_tokens": MAX_TOKENS_PER_ARTIST * len(batch),
+            "response_format": JSON_RESPONSE_FORMAT
         }
-        model_name = azure_deployment
-    else:
-        print(f"  ℹ️  Skipping bio extraction (requires Azure OpenAI credentials)")
-        return {}
+
+        try:
+            limiter = AZURE_RATE_LIMITER if use_azure else GITHUB_MODELS_RATE_LIMITER
+            result = post_chat_completion(endpoint, headers, payload, limiter, session)
+            content = result["choices"][0]["message"]["content"]
+            logger.info(f"--- AI RAW BATCH RESULT for {names} ---\n{content}\n--- END RESULT ---\n")
+
+            batch_data = loads_json(parse_ai_json(content))
+            if isinstance(batch_data, dict):
+                batch_data = batch_data.get("artists")
+            if isinstance(batch_data, list) and len(batch_data) == len(batch):
+                for index, artist_data in zip(pending, batch_data):
+                    if not isinstance(artist_data, dict) or not artist_data:
+                        continue
+                    artist_name, existing_bio, festival_bio = artists[index]
+                    # Answers are matched by position; the echoed name catches a reordered,
+                    # skipped or merged entry before it is cached under the wrong artist.
+                    # It is never written back to the row.
+                    echoed_name = str(artist_data.pop("Artist", "") or "")
+                    if echoed_name.strip().casefold() != artist_name.strip().casefold():
+                        logger.warning(f"  ⚠️  {artist_name}: Batch answer is for '{echoed_name}' - falling back to a single request")
+                        continue
+                    store_response(
+                        make_cache_key(model_name, PROMPT_VERSION, "enrich", artist_name, existing_bio, festival_bio),
+                        dumps_compact(artist_data)
+                    )
+                    results[index] = finalize_artist_data(artist_name, artist_data, rating_boost, provider)
+            else:
+                logger.warning(f"  ⚠️  Batch response did not contain {len(batch)} artists - falling back to single requests")
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"  ⚠️  Batch API error - {e} - falling back to single requests")
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"  ⚠️  Invalid batch response - {e} - falling back to single requests")
+
+    for index, artist_data in enumerate(results):
+        if artist_data is None:
+            artist_name, existing_bio, festival_bio = artists[index]
+            results[index] = enrich_artist_with_ai(artist_name, existing_bio, rating_boost, session, festival_bio, force)
+    return results
+
+
+def extract_bio_facts(bio: str) -> Dict[str, str]:
+    """
+    Extract group size and front person gender from an English bio with regexes.
     
-    payload = {
-        "messages": [
-            {
-                "role": "system",
-                "content": "You are a precise data extraction assistant. Extract only explicitly stated facts. Return valid JSON."
-            },
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ],
-        "model": model_name,
-        "temperature": 0.1,  # Very low temperature for conservative extraction
-        "max_tokens": 300
-    }
+    Only unambiguous cases are returned: a single group-size word ("trio" = 3;
+    "solo" is ignored because solo acts leave the column empty) that is not
+    about another group ("formerly half of the duo X"), and at least
+    MIN_PRONOUN_COUNT pronouns that all point to one gender.
+    """
+    facts = {}
+    sizes = set()
+    for match in _GROUP_SIZE_RE.finditer(bio):
+        if _FORMER_GROUP_RE.search(bio[max(0, match.start() - 30):match.start()]):
+            sizes.add(None)  # Another group is mentioned, so the size is ambiguous
+        else:
+            sizes.add(match.group(1).lower())
+    if len(sizes) == 1 and None not in sizes:
+        facts["Number of People in Act"] = _GROUP_SIZES[sizes.pop()]
+
+    male = len(_MALE_PRONOUN_RE.findall(bio))
+    female = len(_FEMALE_PRONOUN_RE.findall(bio))
+    if male >= MIN_PRONOUN_COUNT and not female:
+        facts["Gender of Front Person"] = "Male"
+    elif female >= MIN_PRONOUN_COUNT and not male:
+        facts["Gender of Front Person"] = "Female"
+    return facts
+
+
+def fill_facts_from_bio(rows: List[Dict]) -> int:
+    """
+    Fill empty group size / gender columns from each row's Bio without an AI call.
     
-    try:
-        response = requests.post(endpoint, headers=headers, json=payload, timeout=30)
-        response.raise_for_status()
-        
-        result = response.json()
-        content = result["choices"][0]["message"]["content"]
-        
-        # Extract JSON from response
-        content = content.strip()
-        if content.startswith("```json"):
-            content = content.split("```json")[1].split("```")[0].strip()
-        elif content.startswith("```"):
-            content = content.split("```")[1].split("```")[0].strip()
-        
-        extracted_data = json.loads(content)
-        
-        # Filter out empty values
-        return {k: v for k, v in extracted_data.items() if v and str(v).strip()}
-        
-    except Exception as e:
-        print(f"  ⚠️  {artist_name}: Bio extraction failed - {e}")
-        return {}
+    Only used with --facts-from-bio; existing values are never overwritten.
+    
+    Returns:
+        Number of rows that were updated
+    """
+    updated = 0
+    for row in rows:
+        bio = (row.get("Bio") or "").strip()
+        if not bio or bio.startswith("[using festival bio"):  # Festival bios may be Dutch
+            continue
+        changed = False
+        for key, value in extract_bio_facts(bio).items():
+            if key in row and not (row.get(key) or "").strip():
+                row[key] = value
+                changed = True
+                logger.info(f"    ✓ {row.get('Artist', '').strip()}.{key}: {value} (from bio)")
+        updated += changed
+    return updated
 
 
-def enrich_csv(csv_path: Path, use_ai: bool = False, parallel: bool = False, rating_boost: float = 0.0, artist_name_filter: str = None, force: bool = False):
+def get_festival_bio(row: Dict) -> str:
+    """Return the festival bio of a row, preferring English over Dutch."""
+    return row.get("Festival Bio (EN)", "").strip() or row.get("Festival Bio (NL)", "").strip()
+
+
+def enrichment_inputs(row: Dict, force: bool = False) -> Tuple[str, str, str]:
+    """
+    Return (artist_name, existing_bio, festival_bio) to send to the AI for a row.
+    
+    In force mode the existing bio is not passed so AI generates a fresh one.
+    The festival bio is only needed (for the Bio fallback and metadata
+    extraction) when there is no existing bio to preserve.
+    """
+    existing_bio = "" if force else row.get("Bio", "").strip()
+    festival_bio = "" if existing_bio else get_festival_bio(row)
+    return row.get("Artist", "").strip(), existing_bio, festival_bio
+
+
+def group_rows_by_inputs(indexed_rows: List[Tuple[int, Dict]], force: bool = False) -> Dict[Tuple[str, str, str], List[Tuple[int, Dict]]]:
+    """Group (index, row) pairs by their enrichment_inputs(), keeping first-seen order."""
+    groups = {}
+    for i, row in indexed_rows:
+        groups.setdefault(enrichment_inputs(row, force), []).append((i, row))
+    return groups
+
+
+def apply_enriched_data(row: Dict, enriched_data: Dict, force: bool = False):
+    """
+    Copy AI-enriched fields into a CSV row.
+    
+    Fields are only filled if currently empty (or in force mode), so user edits
+    are preserved. When the AI has no Bio, the festival bio is used as fallback
+    together with the metadata the AI extracted from it ("bio_extraction").
+    """
+    artist_name = row.get("Artist", "").strip()
+    bio_extraction = enriched_data.get("bio_extraction") or {}
+    for key, value in enriched_data.items():
+        if key in row and (force or not row.get(key, "").strip()):
+            # Use festival bio as fallback for Bio when AI has no data
+            if key == "Bio" and not str(value).strip():
+                festival_bio = get_festival_bio(row)
+                if festival_bio:
+                    row[key] = f"[using festival bio due to a lack of publicly available data] {festival_bio}"
+                    logger.info(f"    ℹ️  {artist_name}.{key}: Using festival bio as fallback")
+                    
+                    # Metadata extracted from the festival bio in the same AI request
+                    if isinstance(bio_extraction, dict):
+                        for meta_key, meta_value in bio_extraction.items():
+                            if not meta_value or not str(meta_value).strip():
+                                continue
+                            if meta_key in row and not row.get(meta_key, "").strip():
+                                row[meta_key] = meta_value
+                                logger.info(f"    ✓ Extracted {meta_key}: {meta_value}")
+                else:
+                    logger.info(f"    ℹ️  {artist_name}.{key}: Left empty (AI had insufficient data, no festival bio)")
+            # Log if we're filling with empty value and always update the field
+            elif key in ["AI Rating", "AI Summary"] and not str(value).strip():
+                logger.info(f"    ℹ️  {artist_name}.{key}: Left empty (AI had insufficient data)")
+                row[key] = value
+            elif key == "Genre":
+                row[key] = normalize_genre_value(value)
+            else:
+                row[key] = value
+
+
+def save_interrupted_run(csv_path: Path, headers: List[str], rows: List[Dict]):
+    """Save the rows enriched so far after Ctrl+C and exit."""
+    logger.warning("\n⚠️  Interrupted - saving progress before exiting...")
+    save_csv(csv_path, headers, rows)
+    logger.info("✓ Progress saved. Re-run the same command to continue.")
+    sys.exit(130)
+
+
+def enrich_csv(csv_path: Path, use_ai: bool = False, parallel: bool = False, rating_boost: float = 0.0, artist_name_filter: str = None, force: bool = False, batch_size: int = BATCH_SIZE,
+               facts_from_bio: bool = False, max_workers: Optional[int] = None):
     """
     Enrich CSV with artist data.
     
@@ -386,164 +771,149 @@ def enrich_csv(csv_path: Path, use_ai: bool = False, parallel: bool = False, rat
         rating_boost: Rating adjustment for discovery/curated festivals (default 0.0)
         artist_name_filter: If provided, only enrich this specific artist
         force: If True, overwrite existing non-empty fields
+        batch_size: Artists per AI request in parallel mode (1 disables batching)
+        facts_from_bio: Fill empty group size / gender of rows that are not
+            sent to the AI from their bio with regexes
+        max_workers: Concurrent AI requests in parallel mode (default:
+            AZURE_MAX_WORKERS or GITHUB_MODELS_MAX_WORKERS)
     """
-    print(f"\n=== Enriching Artist Data ===\n")
+    logger.info(f"\n=== Enriching Artist Data ===\n")
     
     if artist_name_filter:
-        print(f"ℹ️  Filtering for artist: {artist_name_filter}\n")
+        logger.info(f"ℹ️  Filtering for artist: {artist_name_filter}\n")
     
     if force:
-        print(f"⚠️  Force mode enabled: Will overwrite existing fields\n")
+        logger.warning(f"⚠️  Force mode enabled: Will overwrite existing fields\n")
     
     if rating_boost != 0.0:
-        print(f"ℹ️  Rating boost enabled: +{rating_boost}\n")
+        logger.info(f"ℹ️  Rating boost enabled: +{rating_boost}\n")
     
     headers, rows = load_csv(csv_path)
     enriched_count = 0
     
+    if facts_from_bio:
+        # Rows that go to the AI get group size / gender from the AI instead
+        to_enrich = set(select_rows_to_enrich(headers, rows, force, artist_name_filter)) if use_ai else set()
+        complete_rows = [
+            row for i, row in enumerate(rows)
+            if i not in to_enrich
+            and (not artist_name_filter or (row.get("Artist") or "").strip().lower() == artist_name_filter.lower())
+        ]
+        filled_count = fill_facts_from_bio(complete_rows)
+        if filled_count:
+            save_csv(csv_path, headers, rows)
+            logger.info(f"✓ Filled group size/gender for {filled_count} artist(s) from their bio (no AI call)")
+            logger.warning("⚠️  Please review these values; they are regex guesses\n")
+        else:
+            logger.info("ℹ️  No group size/gender could be filled from bios\n")
+    
     # Note: User edits are preserved by not overwriting non-empty fields (unless --force is used)
     # Fields are only enriched if they are currently empty (or if --force is used)
     
     if use_ai and parallel:
         # Parallel processing for faster completion
-        import concurrent.futures
-        import os
-        
         # Determine if we're using Azure (no rate limits) or GitHub Models (rate limited)
         use_azure = bool(os.getenv("AZURE_OPENAI_KEY") and os.getenv("AZURE_OPENAI_ENDPOINT"))
-        max_workers = 5 if use_azure else 2  # More parallelism with Azure
+        if max_workers is None:
+            max_workers = AZURE_MAX_WORKERS if use_azure else GITHUB_MODELS_MAX_WORKERS  # More parallelism with Azure
+        max_workers = max(1, min(max_workers, MAX_WORKERS_LIMIT))
         
-        artists_to_enrich = [
-            (i, row) for i, row in enumerate(rows)
-            if (not artist_name_filter or row.get("Artist", "").strip().lower() == artist_name_filter.lower())
-            and needs_enrichment(row, force)
-        ]
+        artists_to_enrich = [(i, rows[i]) for i in select_rows_to_enrich(headers, rows, force, artist_name_filter)]
         
         if artists_to_enrich:
-            print(f"Processing {len(artists_to_enrich)} artists in parallel (max {max_workers} workers)...)\n")
+            # Rows with identical AI inputs (duplicate artist entries) share one request
+            rows_by_inputs = group_rows_by_inputs(artists_to_enrich, force)
+            unique_inputs = list(rows_by_inputs)
+            batch_size = max(1, batch_size)
+            batches = [
+                unique_inputs[start:start + batch_size]
+                for start in range(0, len(unique_inputs), batch_size)
+            ]
+            logger.info(f"Processing {len(artists_to_enrich)} artists in parallel ({len(batches)} batch(es) of up to {batch_size}, max {max_workers} workers)...\n")
+            if len(unique_inputs) < len(artists_to_enrich):
+                logger.info(f"ℹ️  {len(artists_to_enrich) - len(unique_inputs)} duplicate artist row(s) will reuse the same AI response\n")
             
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_artist = {
-                    executor.submit(
-                        enrich_artist_with_ai, 
-                        row.get("Artist", "").strip(), 
-                        "" if force else row.get("Bio", "").strip(),  # Don't pass existing bio in force mode
-                        rating_boost
-                    ): (i, row)
-                    for i, row in artists_to_enrich
+            saved_count = 0
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                future_to_batch = {
+                    executor.submit(enrich_artists_batch, batch, rating_boost, force=force): batch
+                    for batch in batches
                 }
                 
-                for future in concurrent.futures.as_completed(future_to_artist):
-                    i, row = future_to_artist[future]
-                    artist_name = row.get("Artist", "").strip()
+                for future in concurrent.futures.as_completed(future_to_batch):
+                    batch = future_to_batch[future]
                     try:
-                        enriched_data = future.result()
-                        if enriched_data:
-                            enriched_count += 1
-                            # Update row with enriched data (only if field is currently empty or force mode)
-                            for key, value in enriched_data.items():
-                                if key in row and (force or not row.get(key, "").strip()):
-                                    # Use festival bio as fallback for Bio when AI has no data
-                                    if key == "Bio" and not str(value).strip():
-                                        festival_bio_en = row.get("Festival Bio (EN)", "").strip()
-                                        festival_bio_nl = row.get("Festival Bio (NL)", "").strip()
-                                        festival_bio = festival_bio_en or festival_bio_nl
-                                        if festival_bio:
-                                            row[key] = f"[using festival bio due to a lack of publicly available data] {festival_bio}"
-                                            print(f"    ℹ️  {artist_name}.{key}: Using festival bio as fallback")
-                                            
-                                            # Try to extract metadata from festival bio
-                                            print(f"    → Attempting to extract metadata from festival bio...")
-                                            bio_metadata = extract_metadata_from_bio(artist_name, festival_bio)
-                                            if bio_metadata:
-                                                for meta_key, meta_value in bio_metadata.items():
-                                                    if meta_key in row and not row.get(meta_key, "").strip():
-                                                        row[meta_key] = meta_value
-                                                        print(f"    ✓ Extracted {meta_key}: {meta_value}")
-                                        else:
-                                            print(f"    ℹ️  {artist_name}.{key}: Left empty (AI had insufficient data, no festival bio)")
-                                    # Log if we're filling with empty value and always update the field
-                                    elif key in ["AI Rating", "AI Summary"] and not str(value).strip():
-                                        print(f"    ℹ️  {artist_name}.{key}: Left empty (AI had insufficient data)")
-                                        row[key] = value
-                                    elif key == "Genre":
-                                        row[key] = normalize_genre_value(value)
-                                    else:
-                                        row[key] = value
+                        batch_results = future.result()
                     except Exception as e:
-                        print(f"  ✗ {artist_name}: Unexpected error - {e}")
+                        names = ", ".join(artist_name for artist_name, _, _ in batch)
+                        logger.error(f"  ✗ {names}: Unexpected error - {e}")
+                        continue
+                    for inputs, enriched_data in zip(batch, batch_results):
+                        if enriched_data:
+                            for i, row in rows_by_inputs[inputs]:
+                                enriched_count += 1
+                                apply_enriched_data(row, enriched_data, force)
+                    if enriched_count - saved_count >= CHECKPOINT_INTERVAL:
+                        save_csv(csv_path, headers, rows)
+                        saved_count = enriched_count
+                        logger.info(f"  💾 Progress saved ({enriched_count}/{len(artists_to_enrich)} artists)")
+            except KeyboardInterrupt:
+                executor.shutdown(wait=False, cancel_futures=True)
+                save_interrupted_run(csv_path, headers, rows)
+            finally:
+                executor.shutdown(wait=True)
         
         # Save after parallel processing
         if enriched_count > 0:
             save_csv(csv_path, headers, rows)
-            print(f"\n✓ Enriched {enriched_count} artist(s) with AI")
-            print("⚠️  Please review and verify AI-generated content")
+            logger.info(f"\n✓ Enriched {enriched_count} artist(s) with AI")
+            logger.warning("⚠️  Please review and verify AI-generated content")
         return
     
     # Sequential processing (original logic)
-    for row in rows:
-        artist_name = row.get("Artist", "").strip()
-        if not artist_name:
-            continue
-        
-        # Skip if filtering for specific artist
-        if artist_name_filter and artist_name.lower() != artist_name_filter.lower():
-            continue
-        
-        if needs_enrichment(row, force):
+    # AI results by (artist_name, existing_bio, festival_bio), so duplicate rows are enriched once
+    results_by_inputs = {}
+    try:
+        for i in select_rows_to_enrich(headers, rows, force, artist_name_filter):
+            row = rows[i]
+            artist_name = row.get("Artist", "").strip()
             enriched_count += 1
             
             if use_ai:
                 # AI enrichment (requires API integration)
-                # In force mode, don't pass existing bio so AI generates a fresh one
-                existing_bio = "" if force else row.get("Bio", "").strip()
-                enriched_data = enrich_artist_with_ai(artist_name, existing_bio, rating_boost)
+                inputs = enrichment_inputs(row, force)
+                enriched_data = results_by_inputs.get(inputs)
+                if enriched_data is None:
+                    _, existing_bio, festival_bio = inputs
+                    enriched_data = enrich_artist_with_ai(artist_name, existing_bio, rating_boost, festival_bio=festival_bio,
+                                                          force=force)
+                    results_by_inputs[inputs] = enriched_data
+                else:
+                    logger.info(f"  ↷ {artist_name}: Duplicate row, reusing AI response")
                 
                 # Update row with enriched data (don't overwrite existing data unless force mode)
-                for field, value in enriched_data.items():
-                    if field in row:
-                        # Only fill if empty or force mode (preserves user edits unless --force)
-                        if force or not row[field].strip():
-                            # Use festival bio as fallback for Bio when AI has no data
-                            if field == "Bio" and not str(value).strip():
-                                festival_bio_en = row.get("Festival Bio (EN)", "").strip()
-                                festival_bio_nl = row.get("Festival Bio (NL)", "").strip()
-                                festival_bio = festival_bio_en or festival_bio_nl
-                                if festival_bio:
-                                    row[field] = f"[using festival bio due to a lack of publicly available data] {festival_bio}"
-                                    print(f"    ℹ️  {artist_name}.{field}: Using festival bio as fallback")
-                                    
-                                    # Try to extract metadata from festival bio
-                                    print(f"    → Attempting to extract metadata from festival bio...")
-                                    bio_metadata = extract_metadata_from_bio(artist_name, festival_bio)
-                                    if bio_metadata:
-                                        for meta_key, meta_value in bio_metadata.items():
-                                            if meta_key in row and not row.get(meta_key, "").strip():
-                                                row[meta_key] = meta_value
-                                                print(f"    ✓ Extracted {meta_key}: {meta_value}")
-                                else:
-                                    print(f"    ℹ️  {artist_name}.{field}: Left empty (AI had insufficient data, no festival bio)")
-                            # Log if we're filling with empty value and always update the field
-                            elif field in ["AI Rating", "AI Summary"] and not str(value).strip():
-                                print(f"    ℹ️  {artist_name}.{field}: Left empty (AI had insufficient data)")
-                                row[field] = value
-                            elif field == "Genre":
-                                row[field] = normalize_genre_value(value)
-                            else:
-                                row[field] = value
+                apply_enriched_data(row, enriched_data, force)
+                if enriched_count % CHECKPOINT_INTERVAL == 0:
+                    save_csv(csv_path, headers, rows)
+                    logger.info(f"  💾 Progress saved ({enriched_count} artists)")
             else:
-                print(f"  ⚠️  {artist_name}: Missing data - please fill manually")
-    
+                logger.warning(f"  ⚠️  {artist_name}: Missing data - please fill manually")
+    except KeyboardInterrupt:
+        if not use_ai:
+            raise
+        save_interrupted_run(csv_path, headers, rows)
+
     if enriched_count > 0:
         if use_ai:
             save_csv(csv_path, headers, rows)
-            print(f"\n✓ Enriched {enriched_count} artist(s) with AI-generated data")
-            print("⚠️  Please review and verify AI-generated content")
+            logger.info(f"\n✓ Enriched {enriched_count} artist(s) with AI-generated data")
+            logger.warning("⚠️  Please review and verify AI-generated content")
         else:
-            print(f"\n⚠️  {enriched_count} artist(s) need manual data entry")
-            print("💡 Tip: Use --ai flag to enable automatic enrichment (requires API setup)")
+            logger.warning(f"\n⚠️  {enriched_count} artist(s) need manual data entry")
+            logger.info("💡 Tip: Use --ai flag to enable automatic enrichment (requires API setup)")
     else:
-        print("✓ All artists have complete data!")
+        logger.info("✓ All artists have complete data!")
 
 
 def setup_ai_instructions():
@@ -557,12 +927,12 @@ OPTION 1: Azure OpenAI (Recommended - Better Rate Limits)
    Windows (PowerShell):
      $env:AZURE_OPENAI_KEY = "your-azure-key"
      $env:AZURE_OPENAI_ENDPOINT = "https://your-resource.cognitiveservices.azure.com/"
-     $env:AZURE_OPENAI_DEPLOYMENT = "gpt-4o"
+     $env:AZURE_OPENAI_DEPLOYMENT = "gpt-4o-mini"
    
    Linux/Mac:
      export AZURE_OPENAI_KEY="your-azure-key"
      export AZURE_OPENAI_ENDPOINT="https://your-resource.cognitiveservices.azure.com/"
-     export AZURE_OPENAI_DEPLOYMENT="gpt-4o"
+     export AZURE_OPENAI_DEPLOYMENT="gpt-4o-mini"
 
 2. Run with --ai flag (add --parallel for faster processing):
    python enrich_artists.py --ai --parallel
@@ -644,6 +1014,28 @@ def main():
         action="store_true",
         help="Overwrite existing non-empty fields (use with caution)"
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help=f"Artists per AI request with --parallel (default: {BATCH_SIZE}, 1 disables batching)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=f"Concurrent AI requests with --parallel (default: {AZURE_MAX_WORKERS} for Azure OpenAI, "
+             f"{GITHUB_MODELS_MAX_WORKERS} for GitHub Models, max: {MAX_WORKERS_LIMIT})"
+    )
+    parser.add_argument(
+        "--facts-from-bio",
+        action="store_true",
+        help="Fill empty group size/gender from the existing bio with regexes (no AI call)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached AI responses and always call the API"
+    )
     
     args = parser.parse_args()
     
@@ -651,6 +1043,9 @@ def main():
         setup_ai_instructions()
         return
     
+    if args.no_cache:
+        disable_llm_cache()
+    
     # Use festival-specific CSV path
     # Try multiple locations
     csv_locations = [
@@ -667,10 +1062,15 @@ def main():
         sys.exit(1)
     
     # Get festival config for rating boost
-    festival_config = get_festival_config(args.festival)
+    festival_config = get_festival_config(args.festival, args.year)
     rating_boost = festival_config.rating_boost if festival_config else 0.0
     
-    enrich_csv(csv_path, use_ai=args.ai, parallel=args.parallel, rating_boost=rating_boost, artist_name_filter=args.artist, force=args.force)
+    listener = start_log_listener()
+    try:
+        enrich_csv(csv_path, use_ai=args.ai, parallel=args.parallel, rating_boost=rating_boost, artist_name_filter=args.artist, force=args.force, batch_size=args.batch_size,
+                   facts_from_bio=args.facts_from_bio, max_workers=args.workers)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
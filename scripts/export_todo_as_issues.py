@@ -9,11 +9,23 @@ This script parses the TODO.md file and exports unchecked items in various forma
 """
 
 import os
+import re
 import csv
 import sys
 import shlex
 from typing import List, Tuple
 
+# Level 1 headings and unchecked checklist items (leading/trailing whitespace allowed)
+_TODO_LINE_RE = re.compile(r'^[ \t]*(?:# (?P<heading>.*?)|- \[ \](?P<item>.*?))[ \t]*$', re.MULTILINE)
+
+# GitHub issue title limit used for the exports, and the shared issue body
+TITLE_MAX_LENGTH = 100
+ISSUE_BODY_TEMPLATE = (
+    "This task was imported from the TODO list.\n\n"
+    "**Original TODO item:**\n{todo_text}\n\n"
+    "**Source:** `documentation/TODO.md` (line {line_num})"
+)
+
 
 def parse_todo_file(todo_path: str) -> List[Tuple[str, int]]:
     """
@@ -26,28 +38,56 @@ def parse_todo_file(todo_path: str) -> List[Tuple[str, int]]:
         List of tuples (todo_text, line_number)
     """
     with open(todo_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+        text = f.read()
     
     unchecked_items = []
     in_todo_section = False
+    line_num = 1
+    pos = 0
     
-    for line_num, line in enumerate(lines, start=1):
+    # One regex scan over the file; only headings and unchecked items match,
+    # line numbers are counted incrementally between matches
+    for match in _TODO_LINE_RE.finditer(text):
+        line_num += text.count('\n', pos, match.start())
+        pos = match.start()
+        
         # Check for section headers (any level 1 heading)
-        if line.strip().startswith('# '):
-            in_todo_section = (line.strip() == "# To Do List")
+        heading = match.group('heading')
+        if heading is not None:
+            in_todo_section = (heading == "To Do List")
             continue
         
         # Only process unchecked items in the "To Do List" section
-        if in_todo_section and line.strip().startswith('- [ ]'):
-            # Extract the todo text (remove the checkbox part)
-            todo_text = line.strip()[6:].strip()
+        if in_todo_section:
+            # Extract the todo text (drop the separator after the checkbox)
+            todo_text = match.group('item')[1:].strip()
             if todo_text:  # Only add non-empty items
                 unchecked_items.append((todo_text, line_num))
     
     return unchecked_items
 
 
-def export_as_shell_script(items: List[Tuple[str, int]], output_path: str):
+def prepare_issues(items: List[Tuple[str, int]]) -> List[Tuple[str, str, int]]:
+    """
+    Build the issue title and body for each TODO item once, for all exporters.
+    
+    Args:
+        items: List of tuples (todo_text, line_number)
+        
+    Returns:
+        List of tuples (title, body, line_number)
+    """
+    return [
+        (
+            todo_text if len(todo_text) <= TITLE_MAX_LENGTH else todo_text[:TITLE_MAX_LENGTH - 3] + "...",
+            ISSUE_BODY_TEMPLATE.format(todo_text=todo_text, line_num=line_num),
+            line_num
+        )
+        for todo_text, line_num in items
+    ]
+
+
+def export_as_shell_script(issues: List[Tuple[str, str, int]], output_path: str):
     """Export as a shell script with gh CLI commands"""
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write('#!/bin/bash\n')
@@ -55,10 +95,7 @@ def export_as_shell_script(items: List[Tuple[str, int]], output_path: str):
         f.write('# Run this script to create all issues at once\n\n')
         f.write('set -e  # Exit on error\n\n')
         
-        for todo_text, line_num in items:
-            title = todo_text if len(todo_text) <= 100 else todo_text[:97] + "..."
-            body = f"This task was imported from the TODO list.\n\n**Original TODO item:**\n{todo_text}\n\n**Source:** `documentation/TODO.md` (line {line_num})"
-            
+        for title, body, _ in issues:
             # Use shlex.quote for safe shell escaping
             title_escaped = shlex.quote(title)
             body_escaped = shlex.quote(body)
@@ -70,25 +107,20 @@ def export_as_shell_script(items: List[Tuple[str, int]], output_path: str):
     print(f"  Run with: bash {output_path}")
 
 
-def export_as_markdown(items: List[Tuple[str, int]], output_path: str):
+def export_as_markdown(issues: List[Tuple[str, str, int]], output_path: str):
     """Export as markdown with formatted issue descriptions"""
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write('# GitHub Issues from TODO.md\n\n')
-        f.write(f'Found {len(items)} unchecked TODO items to convert into issues.\n\n')
+        f.write(f'Found {len(issues)} unchecked TODO items to convert into issues.\n\n')
         f.write('---\n\n')
         
-        for i, (todo_text, line_num) in enumerate(items, start=1):
-            title = todo_text if len(todo_text) <= 100 else todo_text[:97] + "..."
-            
+        for i, (title, body, _) in enumerate(issues, start=1):
             f.write(f'## Issue {i}: {title}\n\n')
             f.write('**Title:**\n')
             f.write(f'```\n{title}\n```\n\n')
             f.write('**Body:**\n')
             f.write('```markdown\n')
-            f.write(f'This task was imported from the TODO list.\n\n')
-            f.write(f'**Original TODO item:**\n')
-            f.write(f'{todo_text}\n\n')
-            f.write(f'**Source:** `documentation/TODO.md` (line {line_num})\n')
+            f.write(f'{body}\n')
             f.write('```\n\n')
             f.write('**Labels:** `enhancement`, `from-todo`\n\n')
             f.write('---\n\n')
@@ -97,18 +129,16 @@ def export_as_markdown(items: List[Tuple[str, int]], output_path: str):
     print(f"  Review and copy-paste issue details from this file")
 
 
-def export_as_csv(items: List[Tuple[str, int]], output_path: str):
+def export_as_csv(issues: List[Tuple[str, str, int]], output_path: str):
     """Export as CSV for bulk import tools"""
     with open(output_path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
         writer.writerow(['Title', 'Body', 'Labels', 'Source Line'])
         
-        for todo_text, line_num in items:
-            title = todo_text if len(todo_text) <= 100 else todo_text[:97] + "..."
-            body = f"This task was imported from the TODO list.\n\n**Original TODO item:**\n{todo_text}\n\n**Source:** `documentation/TODO.md` (line {line_num})"
-            labels = "enhancement,from-todo"
-            
-            writer.writerow([title, body, labels, line_num])
+        writer.writerows(
+            [title, body, "enhancement,from-todo", line_num]
+            for title, body, line_num in issues
+        )
     
     print(f"✓ CSV file created: {output_path}")
     print(f"  Import using GitHub's bulk import tools or scripts")
@@ -134,10 +164,11 @@ def main():
     print(f"\nFound {len(unchecked_items)} unchecked TODO items")
     print("=" * 80)
     
-    # Export in different formats
-    export_as_shell_script(unchecked_items, os.path.join(output_dir, "create_issues.sh"))
-    export_as_markdown(unchecked_items, os.path.join(output_dir, "issues_to_create.md"))
-    export_as_csv(unchecked_items, os.path.join(output_dir, "issues.csv"))
+    # Export in different formats (titles and bodies are built once for all three)
+    issues = prepare_issues(unchecked_items)
+    export_as_shell_script(issues, os.path.join(output_dir, "create_issues.sh"))
+    export_as_markdown(issues, os.path.join(output_dir, "issues_to_create.md"))
+    export_as_csv(issues, os.path.join(output_dir, "issues.csv"))
     
     print("\n" + "=" * 80)
     print("Export complete! You can now:")
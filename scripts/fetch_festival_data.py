@@ -16,22 +16,106 @@ import sys
 from pathlib import Path
 
 # Add parent directory to sys.path to import festival_helpers
-import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
+import concurrent.futures
 import csv
 import json
 import argparse
 import hashlib
-import urllib.request
+import html as html_module
+import os
+import re
+import threading
+import time
 from typing import Dict, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from helpers import (
     FestivalScraper,
     get_festival_config,
-    artist_name_to_slug,
-    translate_text
+    artist_name_to_slug
 )
+from helpers.ai_client import translate_texts
 from helpers.genre_utils import normalize_genre_row, audit_genre_separators
+from helpers.llm_cache import disable_llm_cache
+from helpers.page_cache import disable_page_cache
+from helpers.rate_limiter import RateLimiter
+
+# Columns that must be filled before an artist's festival data counts as complete
+FESTIVAL_DATA_FIELDS = (
+    'Festival Bio (NL)',
+    'Festival Bio (EN)',
+    'Festival URL',
+    'Date',
+    'Start Time',
+    'End Time',
+    'Stage'
+)
+
+# Festival sites are polite-crawled at about one artist page per second by
+# default (--max-rps), shared across all worker threads.
+DEFAULT_MAX_RPS = 1.0
+FESTIVAL_PAGE_RATE_LIMITER = RateLimiter(DEFAULT_MAX_RPS, 1.0)
+
+# Save progress every N updated artists, so a crash or Ctrl+C mid-run keeps the fetched data
+CHECKPOINT_INTERVAL = 25
+
+# Held while a worker writes fetched data into its row and while a progress
+# checkpoint is saved, so a checkpoint never contains a half-updated row
+_ROW_UPDATE_LOCK = threading.Lock()
+
+
+def create_download_session(pool_size: int = 20) -> requests.Session:
+    """Create a requests session that keeps connections to image hosts alive between downloads."""
+    session = requests.Session()
+    session.headers.update({'User-Agent': 'Mozilla/5.0'})
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504)),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared by all workers, so the TLS handshake with an image host is paid once per run
+_HTTP = create_download_session()
+
+# Image extraction patterns
+_OG_IMAGE_RE = re.compile(r'<meta\s+property=["\']og:image["\']\s+content=["\']([^"\']+)["\']')
+_SRCSET_RE = re.compile(r'srcset=["\']([^"\']+)["\']')
+_IMG_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>')
+_YEAR_DEFAULT_RE = re.compile(r'/20\d{2}/[^/]*\.(jpg|png|webp)$')
+
+# Substrings that mark an image URL as a thumbnail or a non-artist image
+_THUMBNAIL_TOKENS = ('/thumbs/', '/thumb/', 'thumbnail')
+_NON_ARTIST_TOKENS = ('logo', 'icon', 'brand', 'sponsor', 'default', 'placeholder')
+_SRCSET_NON_ARTIST_TOKENS = ('rabobank', 'sponsor', 'woordmerk', 'rgb', 'logo', 'brand', 'default', 'placeholder')
+
+# Social link extraction patterns
+_LINKS_SECTION_RE = re.compile(r'<div[^>]*id="links"[^>]*>(.*?)</div>', re.DOTALL | re.IGNORECASE)
+_ANCHOR_RE = re.compile(r'<a[^>]*href="([^"]+)"[^>]*>(.*?)</a>', re.DOTALL | re.IGNORECASE)
+_BANDCAMP_SECTION_RE = re.compile(r'<div[^>]*id="bandcamp"[^>]*>(.*?)</div>', re.DOTALL | re.IGNORECASE)
+_IFRAME_SRC_RE = re.compile(r'<iframe[^>]*src="([^"]+)"')
+_ALBUM_ID_RE = re.compile(r'album=(\d+)')
+_TRACK_ID_RE = re.compile(r'track=(\d+)')
+_BANDCAMP_ALBUM_LINK_RE = re.compile(r'<a[^>]+href="(https://[a-z0-9\-]+\.bandcamp\.com/album/[^"\s]+)"', re.IGNORECASE)
+_BANDCAMP_ALBUM_PATH_RE = re.compile(r'/album/.*$')
+_BANDCAMP_TRACK_PATH_RE = re.compile(r'/track/.*$')
+_BANDCAMP_SUBDOMAIN_RE = re.compile(r'https://([a-z0-9\-]+)\.bandcamp\.com')
+_BANDCAMP_ARTIST_URL_RE = re.compile(r'https://([a-z0-9\-]+)\.bandcamp\.com/')
+_LEGACY_SECTION_RE = re.compile(r'<div[^>]*class="[^"]*border p-8 mt-8[^"]*"[^>]*>(.*?)</div>', re.DOTALL | re.IGNORECASE)
+_BLANK_TARGET_LINK_RE = re.compile(r'<a[^>]*target="_blank"[^>]*href="([^"]+)"[^>]*>')
+
+# Festival, promoter and newsletter links in the legacy "Meer weten over" section
+# ('dtrh_fest' also covers 'dtrh_festival')
+_EXCLUDED_LINK_TOKENS = (
+    'dtrh_fest', 'downtherabbithole',
+    'mojo.nl', 'livenation', 'list-manage.com'
+)
 
 
 def load_csv(csv_path: Path) -> tuple[List[str], List[Dict]]:
@@ -48,7 +132,12 @@ def load_csv(csv_path: Path) -> tuple[List[str], List[Dict]]:
 
 
 def save_csv(csv_path: Path, headers: List[str], rows: List[Dict]):
-    """Save CSV file with UTF-8 encoding."""
+    """
+    Save CSV file with UTF-8 encoding.
+
+    Writes to a temporary file first and atomically replaces the CSV, so an
+    interrupted save never leaves a truncated file behind.
+    """
     for row in rows:
         normalize_genre_row(row)
 
@@ -56,26 +145,28 @@ def save_csv(csv_path: Path, headers: List[str], rows: List[Dict]):
     if offenders:
         print(f"  ⚠️  Normalized genre separators for {len(offenders)} artist(s) before saving")
 
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+    tmp_path = csv_path.with_name(csv_path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
         writer = csv.DictWriter(f, fieldnames=headers)
         writer.writeheader()
         writer.writerows(rows)
+    os.replace(tmp_path, csv_path)
+
+
+def save_interrupted_run(csv_path: Path, headers: List[str], rows: List[Dict]):
+    """Save the rows fetched so far after Ctrl+C and exit."""
+    print("\n⚠️  Interrupted - saving progress before exiting...")
+    save_csv(csv_path, headers, rows)
+    print("✓ Progress saved. Re-run the same command to continue.")
+    sys.exit(130)
 
 
 def needs_festival_data(row: Dict) -> bool:
     """Check if artist needs festival data fetched."""
     # Check if any festival data columns are missing or empty, or if images have not been scraped
-    festival_fields = [
-        'Festival Bio (NL)',
-        'Festival Bio (EN)',
-        'Festival URL',
-        'Date',
-        'Start Time',
-        'End Time',
-        'Stage'
-    ]
-    images_scraped = row.get('Images Scraped', '').strip().lower() != 'yes'
-    return any(not row.get(field, '').strip() for field in festival_fields) or images_scraped
+    if any(not (row.get(field) or '').strip() for field in FESTIVAL_DATA_FIELDS):
+        return True
+    return (row.get('Images Scraped') or '').strip().lower() != 'yes'
 
 
 def fetch_artist_festival_data(
@@ -98,7 +189,10 @@ def fetch_artist_festival_data(
         schedule_only: Re-fetch only schedule fields (Date/Start Time/End Time/End Date/Stage)
 
     Returns:
-        Dict with festival bio (NL/EN), URL, and social links
+        Dict with festival bio (NL/EN), URL, social links, schedule and
+        (when the row has none yet) the Spotify link found on the page.
+        A Dutch bio is returned untranslated; translate_missing_bios()
+        translates all new bios in one batch afterwards.
     """
     if existing_row is None:
         existing_row = {}
@@ -150,11 +244,6 @@ def fetch_artist_festival_data(
                 print(f"  ✓ Fetched bio ({len(bio)} chars)")
                 if config.bio_language == 'Dutch':
                     result['Festival Bio (NL)'] = bio
-                    print(f"  → Translating bio to English...")
-                    bio_en = translate_text(bio, "Dutch", "English")
-                    if bio_en:
-                        result['Festival Bio (EN)'] = bio_en
-                        print(f"  ✓ Translated bio ({len(bio_en)} chars)")
                 elif config.bio_language == 'English':
                     result['Festival Bio (EN)'] = bio
                 else:
@@ -173,6 +262,14 @@ def fetch_artist_festival_data(
         else:
             print(f"  ✓ Social links already present, skipping")
 
+        # Fill an empty Spotify Link from the page we already have, so
+        # fetch_spotify_links.py --missing-only doesn't download it again
+        if 'Spotify Link' in existing_row and not existing_row['Spotify Link'].strip():
+            spotify_link = scraper.extract_spotify_link(html)
+            if spotify_link:
+                result['Spotify Link'] = spotify_link
+                print(f"  ✓ Found Spotify link")
+
         # Extract schedule info (date, start time, end time, end date, stage) if any are missing
         needs_schedule = (
             refresh_schedule
@@ -210,7 +307,7 @@ def fetch_artist_festival_data(
 
         # Download images only if needed
         if needs_images:
-            image_urls = extract_images_from_html(html, config, artist_name)
+            image_urls = extract_images_from_html(html, config, artist_name, interactive=scraper.interactive)
             if image_urls:
                 print(f"  → Found {len(image_urls)} image URL(s)")
                 for url in image_urls:
@@ -257,12 +354,9 @@ def download_image(img_url: str, output_dir: Path, artist_slug: str) -> Optional
         
         # Download if not already cached
         if not local_path.exists():
-            req = urllib.request.Request(img_url, headers={'User-Agent': 'Mozilla/5.0'})
-            with urllib.request.urlopen(req, timeout=15) as response:
-                img_data = response.read()
-            
-            with open(local_path, 'wb') as f:
-                f.write(img_data)
+            response = _HTTP.get(img_url, timeout=15)
+            response.raise_for_status()
+            local_path.write_bytes(response.content)
         
         # Return filename
         return filename
@@ -272,20 +366,30 @@ def download_image(img_url: str, output_dir: Path, artist_slug: str) -> Optional
         return None
 
 
-def extract_images_from_html(html: str, config, artist_name: str = '') -> List[str]:
-    """Extract artist image URLs from festival page HTML."""
-    import re
-    import html as html_module
+def _absolute_image_url(img_url: str, base_url: str) -> str:
+    """Turn a protocol-relative or root-relative image URL into an absolute one."""
+    if img_url.startswith('//'):
+        return 'https:' + img_url
+    if img_url.startswith('/'):
+        return base_url.rstrip('/') + img_url
+    return img_url
+
 
+def extract_images_from_html(html: str, config, artist_name: str = '', interactive: bool = True) -> List[str]:
+    """
+    Extract artist image URLs from festival page HTML.
+
+    When no image matches the strict rules, the configured image_index is used,
+    or (only if interactive) the user is asked to pick from the candidates.
+    """
     artist_images = []
+    seen = set()  # Same URLs as artist_images, for O(1) duplicate checks
     og_image_found = False
     
     # Load excluded image URLs from config (for festivals with sponsor/logo images)
     excluded_images = getattr(config, 'excluded_image_urls', [])
     if not excluded_images and hasattr(config, 'slug'):
         # Load from settings.json if available
-        from pathlib import Path
-        import json
         settings_path = Path(config.output_dir) / "settings.json"
         if settings_path.exists():
             try:
@@ -294,11 +398,14 @@ def extract_images_from_html(html: str, config, artist_name: str = '') -> List[s
                     excluded_images = settings.get('scraper', {}).get('excluded_image_urls', [])
             except:
                 pass
+    excluded_lower = tuple(excluded.lower() for excluded in excluded_images)
 
     try:
+        # WordPress uploads only count as artist images on Bospop's site
+        is_bospop_site = 'bospopfestival.nl' in config.base_url.lower()
+
         # Try og:image meta tag first (Bospop, many WordPress sites) - HIGHEST PRIORITY
-        og_image_pattern = r'<meta\s+property=["\']og:image["\']\s+content=["\']([^"\']+)["\']'
-        og_images = re.findall(og_image_pattern, html)
+        og_images = _OG_IMAGE_RE.findall(html)
 
         # Process og:image first (highest priority for Bospop)
         for img_url in og_images:
@@ -306,11 +413,11 @@ def extract_images_from_html(html: str, config, artist_name: str = '') -> List[s
             img_lower = img_url.lower()
 
             # Check for Bospop images (WordPress uploads from bospopfestival.nl)
-            is_bospop_image = 'wp-content/uploads' in img_lower and 'bospopfestival.nl' in config.base_url.lower()
+            is_bospop_image = is_bospop_site and 'wp-content/uploads' in img_lower
 
             if is_bospop_image:
                 # Skip logos, default images, and other non-artist images
-                if any(skip in img_lower for skip in ['logo', 'icon', 'brand', 'sponsor', 'default', 'placeholder']):
+                if any(skip in img_lower for skip in _NON_ARTIST_TOKENS):
                     continue
 
                 # Skip thumbnails
@@ -318,10 +425,11 @@ def extract_images_from_html(html: str, config, artist_name: str = '') -> List[s
                     continue
 
                 # Skip images with generic year-only paths (likely defaults)
-                if re.search(r'/20\d{2}/[^/]*\.(jpg|png|webp)$', img_lower):
+                if _YEAR_DEFAULT_RE.search(img_lower):
                     continue
 
-                if img_url not in artist_images:
+                if img_url not in seen:
+                    seen.add(img_url)
                     artist_images.append(img_url)
                     og_image_found = True
 
@@ -331,15 +439,20 @@ def extract_images_from_html(html: str, config, artist_name: str = '') -> List[s
 
         # Only continue to other sources if og:image wasn't found
         # Try srcset (DTRH, Pinkpop)
-        srcset_pattern = r'srcset=["\']([^"\']+)["\']'
-        all_srcsets = re.findall(srcset_pattern, html)
+        all_srcsets = _SRCSET_RE.findall(html)
 
-        # Also try regular img src (Rock Werchter, Bospop)
-        img_pattern = r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>'
-        all_imgs = re.findall(img_pattern, html)
+        # Also try regular img src (Rock Werchter, Bospop); unescaped and
+        # lowercased once, since up to three passes below look at them
+        all_imgs = []
+        for img_url in _IMG_RE.findall(html):
+            img_url = html_module.unescape(img_url)
+            all_imgs.append((img_url, img_url.lower()))
 
-        # Process srcset
+        # Process srcset. Only the first two images matter for the pick at the
+        # end, so this pass and the img pass stop once two have been found.
         for srcset in all_srcsets:
+            if len(artist_images) >= 2:
+                break
             # Parse srcset - it contains multiple URLs separated by commas
             urls = [url.strip().split()[0] for url in srcset.split(',') if url.strip()]
             if not urls:
@@ -349,7 +462,7 @@ def extract_images_from_html(html: str, config, artist_name: str = '') -> List[s
             img_lower = img_url.lower()
 
             # Skip thumbnails
-            if '/thumbs/' in img_lower or '/thumb/' in img_lower or 'thumbnail' in img_lower:
+            if any(thumb in img_lower for thumb in _THUMBNAIL_TOKENS):
                 continue
 
             # Check for Down The Rabbit Hole images
@@ -359,97 +472,76 @@ def extract_images_from_html(html: str, config, artist_name: str = '') -> List[s
             is_pinkpop_image = 'wp-content/uploads' in img_lower and 'acts-header' in img_lower
 
             # Check for Bospop images (WordPress uploads from bospopfestival.nl)
-            is_bospop_image = 'wp-content/uploads' in img_lower and 'bospopfestival.nl' in config.base_url.lower()
+            is_bospop_image = is_bospop_site and 'wp-content/uploads' in img_lower
 
             # Check for Rock Werchter images (cache/default_band or media/cache)
             is_rock_werchter_image = 'cache/default_band' in img_lower or ('media/cache' in img_lower and 'rockwerchter' in img_lower)
 
             if is_dtrh_image or is_pinkpop_image or is_bospop_image or is_rock_werchter_image:
                 # Skip sponsor/logo images
-                if any(skip in img_lower for skip in ['rabobank', 'sponsor', 'woordmerk', 'rgb', 'logo', 'brand', 'default', 'placeholder']):
+                if any(skip in img_lower for skip in _SRCSET_NON_ARTIST_TOKENS):
                     continue
                 
                 # Skip excluded images
-                if any(excluded.lower() in img_url.lower() for excluded in excluded_images):
+                if any(excluded in img_lower for excluded in excluded_lower):
                     continue
 
-                if img_url.startswith('//'):
-                    img_url = 'https:' + img_url
-                elif img_url.startswith('/'):
-                    img_url = config.base_url.rstrip('/') + img_url
-
-                if img_url not in artist_images:
+                img_url = _absolute_image_url(img_url, config.base_url)
+                if img_url not in seen:
+                    seen.add(img_url)
                     artist_images.append(img_url)
 
 
         # Special strict rule for Rewire: always use first non-thumbnail, non-logo image from all_imgs
         if config.slug == "rewire" and all_imgs:
-            for img_url in all_imgs:
-                orig_img_url = img_url
-                img_url = html_module.unescape(img_url)
-                img_lower = img_url.lower()
+            for img_url, img_lower in all_imgs:
                 # Skip thumbnails and obvious non-artist images
-                if any(skip in img_lower for skip in ['thumb', 'logo', 'icon', 'brand', 'sponsor', 'default', 'placeholder']):
+                if 'thumb' in img_lower or any(skip in img_lower for skip in _NON_ARTIST_TOKENS):
                     continue
-                if img_url.startswith('//'):
-                    img_url = 'https:' + img_url
-                elif img_url.startswith('/'):
-                    img_url = config.base_url.rstrip('/') + img_url
-                if img_url not in artist_images:
+                img_url = _absolute_image_url(img_url, config.base_url)
+                if img_url not in seen:
+                    seen.add(img_url)
                     artist_images.append(img_url)
                 break
 
         # Process regular img tags for Rock Werchter and Bospop
-        for img_url in all_imgs:
-            orig_img_url = img_url
-            img_url = html_module.unescape(img_url)
-            img_lower = img_url.lower()
+        for img_url, img_lower in all_imgs:
+            if len(artist_images) >= 2:
+                break
 
             # Skip thumbnails
-            if '/thumbs/' in img_lower or '/thumb/' in img_lower or 'thumbnail' in img_lower:
+            if any(thumb in img_lower for thumb in _THUMBNAIL_TOKENS):
                 continue
 
             # Check for Rock Werchter images
-            is_rock_werchter_image = ('/media/cache/default_band/upload/' in img_lower or 
-                                     'cache/default_band/upload/' in img_lower)
+            is_rock_werchter_image = 'cache/default_band/upload/' in img_lower
 
             # Check for Bospop images in regular img tags (WordPress uploads)
-            is_bospop_image = ('wp-content/uploads' in img_lower and 'bospopfestival.nl' in config.base_url.lower())
+            is_bospop_image = is_bospop_site and 'wp-content/uploads' in img_lower
 
             if is_rock_werchter_image or is_bospop_image:
                 # Skip logos and other non-artist images
-                if any(skip in img_lower for skip in ['logo', 'icon', 'brand', 'sponsor', 'default', 'placeholder']):
+                if any(skip in img_lower for skip in _NON_ARTIST_TOKENS):
                     continue
 
-                if img_url.startswith('//'):
-                    img_url = 'https:' + img_url
-                elif img_url.startswith('/'):
-                    img_url = config.base_url.rstrip('/') + img_url
-
-                if img_url not in artist_images:
+                img_url = _absolute_image_url(img_url, config.base_url)
+                if img_url not in seen:
+                    seen.add(img_url)
                     artist_images.append(img_url)
 
         # Fallback: If no images found by strict rules, interactively ask user to select from all_imgs
         if not artist_images and all_imgs:
-            import html as html_module
             candidate_imgs = []
-            for img_url in all_imgs:
-                orig_img_url = img_url
-                img_url = html_module.unescape(img_url)
-                img_lower = img_url.lower()
+            for img_url, img_lower in all_imgs:
                 # Skip thumbnails and obvious non-artist images
-                if any(skip in img_lower for skip in ['thumb', 'logo', 'icon', 'brand', 'sponsor', 'default', 'placeholder']):
+                if 'thumb' in img_lower or any(skip in img_lower for skip in _NON_ARTIST_TOKENS):
                     continue
                 
                 # Skip excluded images
-                if any(excluded.lower() in img_url.lower() for excluded in excluded_images):
+                if any(excluded in img_lower for excluded in excluded_lower):
                     continue
                 
-                if img_url.startswith('//'):
-                    img_url = 'https:' + img_url
-                elif img_url.startswith('/'):
-                    img_url = config.base_url.rstrip('/') + img_url
-                candidate_imgs.append(img_url)
+                candidate_imgs.append(_absolute_image_url(img_url, config.base_url))
 
             if candidate_imgs:
                 # Use configured image_index if available — avoids interactive prompts
@@ -462,7 +554,11 @@ def extract_images_from_html(html: str, config, artist_name: str = '') -> List[s
                         print(f"  ⚠ Configured image_index={configured_index} out of range (0–{len(candidate_imgs)-1}), falling back to prompt")
                         configured_index = None  # fall through to interactive
                 
-                if configured_index is None:
+                if configured_index is None and not interactive:
+                    # A prompt would block every worker; leave the images for a --workers 1 run
+                    print(f"  ⚠ No artist image found by strict rules ({len(candidate_imgs)} candidate(s)); "
+                          f"re-run with --workers 1 to choose one")
+                elif configured_index is None:
                     print("\n[USER INPUT REQUIRED] No artist image found by strict rules.")
                     print(f"Artist: {artist_name}")
                     print("Select which image(s) to use (comma-separated indices, or leave blank to skip):")
@@ -494,15 +590,13 @@ def extract_images_from_html(html: str, config, artist_name: str = '') -> List[s
 
 def extract_social_links(html: str) -> Dict[str, str]:
     """Extract social media links from festival page HTML."""
-    import re
-
     social_links = {}
 
     # Special handling for Rewire: scrape all <a> tags in #links and Bandcamp iframe in #bandcamp
-    links_section = re.search(r'<div[^>]*id="links"[^>]*>(.*?)</div>', html, re.DOTALL | re.IGNORECASE)
+    links_section = _LINKS_SECTION_RE.search(html)
     if links_section:
         links_html = links_section.group(1)
-        a_tags = re.findall(r'<a[^>]*href="([^"]+)"[^>]*>(.*?)</a>', links_html, re.DOTALL | re.IGNORECASE)
+        a_tags = _ANCHOR_RE.findall(links_html)
         for href, text in a_tags:
             href_lower = href.lower()
             text_lower = text.lower()
@@ -525,14 +619,14 @@ def extract_social_links(html: str) -> Dict[str, str]:
                 social_links['Website'] = href.strip()
 
     # Bandcamp player iframe: try to extract the Bandcamp artist URL from the embedded player
-    bandcamp_section = re.search(r'<div[^>]*id="bandcamp"[^>]*>(.*?)</div>', html, re.DOTALL | re.IGNORECASE)
+    bandcamp_section = _BANDCAMP_SECTION_RE.search(html)
     if bandcamp_section:
-        iframe_match = re.search(r'<iframe[^>]*src="([^"]+)"', bandcamp_section.group(1))
+        iframe_match = _IFRAME_SRC_RE.search(bandcamp_section.group(1))
         if iframe_match:
             bandcamp_iframe = iframe_match.group(1).strip()
             # Try to extract album= or track= from the iframe src
-            album_match = re.search(r'album=(\d+)', bandcamp_iframe)
-            track_match = re.search(r'track=(\d+)', bandcamp_iframe)
+            album_match = _ALBUM_ID_RE.search(bandcamp_iframe)
+            track_match = _TRACK_ID_RE.search(bandcamp_iframe)
             album_id = album_match.group(1) if album_match else None
             track_id = track_match.group(1) if track_match else None
 
@@ -540,29 +634,28 @@ def extract_social_links(html: str) -> Dict[str, str]:
             artist_url = None
             if album_id:
                 # Match any Bandcamp album link containing the album_id, regardless of query string
-                album_link = re.search(r'<a[^>]+href="(https://[a-z0-9\-]+\.bandcamp\.com/album/[^"\s]+)"', html, re.IGNORECASE)
+                album_link = _BANDCAMP_ALBUM_LINK_RE.search(html)
                 if album_link:
-                    artist_url = re.sub(r'/album/.*$', '', album_link.group(1))
+                    artist_url = _BANDCAMP_ALBUM_PATH_RE.sub('', album_link.group(1))
             elif track_id:
                 track_link = re.search(r'<a[^>]+href="(https://[a-z0-9\-]+\.bandcamp\.com/track/[^"\?]+)[^>]*track=' + track_id + r'[^>]*"', html, re.IGNORECASE)
                 if track_link:
-                    artist_url = re.sub(r'/track/.*$', '', track_link.group(1))
+                    artist_url = _BANDCAMP_TRACK_PATH_RE.sub('', track_link.group(1))
 
             # Fallback: try to extract artist subdomain from iframe src
             if not artist_url:
-                subdomain_match = re.search(r'https://([a-z0-9\-]+)\.bandcamp\.com', bandcamp_iframe)
+                subdomain_match = _BANDCAMP_SUBDOMAIN_RE.search(bandcamp_iframe)
                 if subdomain_match:
                     artist_url = f'https://{subdomain_match.group(1)}.bandcamp.com/'
 
             # NEW: Fetch and parse the iframe src URL for more robust extraction
             if not artist_url:
-                import urllib.request
                 try:
-                    req = urllib.request.Request(bandcamp_iframe, headers={'User-Agent': 'Mozilla/5.0'})
-                    with urllib.request.urlopen(req, timeout=10) as response:
-                        iframe_html = response.read().decode('utf-8')
+                    response = _HTTP.get(bandcamp_iframe, timeout=10)
+                    response.raise_for_status()
+                    iframe_html = response.content.decode('utf-8')
                     # Look for the first https://<artist>.bandcamp.com/ URL in the iframe HTML
-                    url_match = re.search(r'https://([a-z0-9\-]+)\.bandcamp\.com/', iframe_html)
+                    url_match = _BANDCAMP_ARTIST_URL_RE.search(iframe_html)
                     if url_match:
                         artist_url = f'https://{url_match.group(1)}.bandcamp.com/'
                 except Exception as e:
@@ -575,19 +668,14 @@ def extract_social_links(html: str) -> Dict[str, str]:
 
     # Fallback: Look for links in the "Meer weten over" section (legacy)
     if not social_links:
-        section_pattern = r'<div[^>]*class="[^"]*border p-8 mt-8[^"]*"[^>]*>(.*?)</div>'
-        section_match = re.search(section_pattern, html, re.DOTALL | re.IGNORECASE)
+        section_match = _LEGACY_SECTION_RE.search(html)
         if section_match:
             section_content = section_match.group(1)
-            link_pattern = r'<a[^>]*target="_blank"[^>]*href="([^"]+)"[^>]*>'
-            potential_links = re.findall(link_pattern, section_content)
+            potential_links = _BLANK_TARGET_LINK_RE.findall(section_content)
             for link in potential_links:
                 link_lower = link.lower()
                 # Exclude festival/mojo/livenation/newsletter links
-                if any(exclude in link_lower for exclude in [
-                    'dtrh_festival', 'dtrh_fest', 'downtherabbithole',
-                    'mojo.nl', 'livenation', 'list-manage.com'
-                ]):
+                if any(exclude in link_lower for exclude in _EXCLUDED_LINK_TOKENS):
                     continue
                 # Categorize social media links
                 if 'facebook.com' in link_lower:
@@ -611,6 +699,97 @@ def extract_social_links(html: str) -> Dict[str, str]:
     return social_links
 
 
+def translate_missing_bios(rows: List[Dict]) -> int:
+    """
+    Translate Festival Bio (NL) to Festival Bio (EN) for rows that have no
+    English bio yet, batching several bios per AI request.
+
+    Returns:
+        Number of bios translated
+    """
+    pending = [
+        row for row in rows
+        if row.get('Festival Bio (NL)', '').strip() and not row.get('Festival Bio (EN)', '').strip()
+    ]
+    if not pending:
+        return 0
+
+    print(f"→ Translating {len(pending)} bio(s) to English...")
+    translations = translate_texts([row['Festival Bio (NL)'] for row in pending], "Dutch", "English")
+    translated_count = 0
+    for row, bio_en in zip(pending, translations):
+        if bio_en:
+            row['Festival Bio (EN)'] = bio_en
+            translated_count += 1
+    print(f"✓ Translated {translated_count} bio(s)\n")
+    return translated_count
+
+
+def fetch_row(
+    row: Dict,
+    position: int,
+    total: int,
+    scraper: FestivalScraper,
+    config,
+    force: bool = False,
+    schedule_only: bool = False,
+    limiter: RateLimiter = FESTIVAL_PAGE_RATE_LIMITER,
+) -> Optional[bool]:
+    """
+    Fetch festival data for one CSV row and update it in place.
+
+    Args:
+        row: CSV row dict (updated in place)
+        position: 1-based position of the row, for progress output
+        total: Number of rows being processed
+        scraper: FestivalScraper instance
+        config: Festival configuration
+        force: Re-fetch data even if already present
+        schedule_only: Re-fetch only schedule fields
+        limiter: Rate limiter shared by all workers for page fetches
+
+    Returns:
+        True if the row was fetched, False if it was skipped, None if it has no artist name
+    """
+    artist_name = row.get('Artist', '').strip()
+    if not artist_name:
+        return None
+
+    print(f"[{position}/{total}] {artist_name}")
+
+    # Check if needs data
+    if not force and not schedule_only and not needs_festival_data(row):
+        print(f"  ✓ Already has festival data (use --force to re-fetch)")
+        return False
+
+    # Rate limit page fetches across all workers
+    limiter.acquire()
+
+    # Fetch festival data (pass full row so function skips already-complete sections)
+    festival_data = fetch_artist_festival_data(
+        artist_name,
+        scraper,
+        config,
+        row,
+        force=force,
+        schedule_only=schedule_only,
+    )
+
+    with _ROW_UPDATE_LOCK:
+        # A changed Dutch bio needs a fresh translation in translate_missing_bios()
+        new_bio_nl = festival_data.get('Festival Bio (NL)', '')
+        if new_bio_nl and new_bio_nl != row.get('Festival Bio (NL)', '') and not festival_data.get('Festival Bio (EN)'):
+            row['Festival Bio (EN)'] = ''
+
+        # Update row
+        for key, value in festival_data.items():
+            if value:  # Only update if we got data
+                row[key] = value
+
+    print()
+    return True
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -643,12 +822,42 @@ def main():
         type=str,
         help="Fetch data for a single artist only"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of artists to fetch concurrently (default: 1). "
+             "Page requests stay limited by --max-rps."
+    )
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        default=DEFAULT_MAX_RPS,
+        help=f"Maximum festival page requests per second across all workers (default: {DEFAULT_MAX_RPS})"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show which artists would be fetched without fetching or saving anything"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the page and translation caches (always download and translate)"
+    )
     
     args = parser.parse_args()
+    if not args.max_rps > 0:  # Also rejects nan
+        parser.error("--max-rps must be greater than 0")
+
+    if args.no_cache:
+        disable_page_cache()
+        disable_llm_cache()
     
     # Get festival config and scraper
     config = get_festival_config(args.festival, args.year)
-    scraper = FestivalScraper(config)
+    # Selector prompts can't be answered sensibly while several workers are printing
+    scraper = FestivalScraper(config, interactive=args.workers <= 1)
     
     # CSV file path - use festival-specific path
     # Try multiple locations
@@ -662,6 +871,10 @@ def main():
             csv_path = loc
             break
     
+    if not csv_path and args.dry_run:
+        print(f"CSV not found. Would scrape the lineup from {config.lineup_url} (dry run)")
+        return
+
     # If CSV doesn't exist, create it with scraped lineup
     if not csv_path:
         csv_path = Path(f"docs/{config.slug}/{args.year}/{args.year}.csv")
@@ -718,9 +931,11 @@ def main():
         'Images Scraped'
     ]
     
+    columns_added = False
     for col in new_columns:
         if col not in headers:
             headers.append(col)
+            columns_added = True
             print(f"✓ Added column: {col}")
             # Initialize empty values for existing rows
             for row in rows:
@@ -738,59 +953,113 @@ def main():
     # Filter to single artist if specified
     all_rows = rows  # Keep reference to all rows for saving
     if args.artist:
-        filtered_rows = [row for row in rows if row.get('Artist', '').strip().lower() == args.artist.lower()]
-        if not filtered_rows:
+        # Case-insensitive name index; the first row wins for duplicate names
+        rows_by_name = {}
+        for row in rows:
+            rows_by_name.setdefault(row.get('Artist', '').strip().casefold(), row)
+        match = rows_by_name.get(args.artist.strip().casefold())
+        if match is None:
             print(f"✗ Artist '{args.artist}' not found in CSV")
             sys.exit(1)
-        print(f"Processing 1 artist: {filtered_rows[0].get('Artist')}\n")
-        rows_to_process = filtered_rows
+        print(f"Processing 1 artist: {match.get('Artist')}\n")
+        rows_to_process = [match]
     else:
         print(f"Processing {len(rows)} artists...\n")
         rows_to_process = rows
+
+    if args.dry_run:
+        would_fetch = 0
+        for idx, row in enumerate(rows_to_process, start=1):
+            artist_name = row.get('Artist', '').strip()
+            if not artist_name or not (args.force or args.schedule_only or needs_festival_data(row)):
+                continue
+            missing = [field for field in FESTIVAL_DATA_FIELDS if not (row.get(field) or '').strip()]
+            if (row.get('Images Scraped') or '').strip().lower() != 'yes':
+                missing.append('Images Scraped')
+            print(f"[{idx}/{len(rows_to_process)}] {artist_name}: would fetch (missing: {', '.join(missing) or 'none, forced'})")
+            would_fetch += 1
+        print(f"\n✓ Dry run: {would_fetch} of {len(rows_to_process)} artist(s) would be fetched")
+        return
+
+    limiter = RateLimiter(args.max_rps, 1.0)
     
-    updated_count = 0
-    skipped_count = 0
-    
-    for idx, row in enumerate(rows_to_process):
-        artist_name = row.get('Artist', '').strip()
-        if not artist_name:
-            continue
-        
-        print(f"[{idx+1}/{len(rows_to_process)}] {artist_name}")
-        
-        # Check if needs data
-        if not args.force and not args.schedule_only and not needs_festival_data(row):
-            print(f"  ✓ Already has festival data (use --force to re-fetch)")
-            skipped_count += 1
-            continue
-        
-        # Fetch festival data (pass full row so function skips already-complete sections)
-        festival_data = fetch_artist_festival_data(
-            artist_name,
+    def snapshot():
+        return [tuple(row.get(h, '') for h in headers) for row in rows_to_process]
+
+    # Rows as last written to disk, so checkpoints and the final save are
+    # skipped when nothing changed since then
+    saved_state = {'rows': snapshot(), 'columns_added': columns_added, 'saved': False}
+
+    def save_if_changed() -> bool:
+        if not saved_state['columns_added'] and snapshot() == saved_state['rows']:
+            return False
+        save_csv(csv_path, headers, all_rows)
+        saved_state.update(rows=snapshot(), columns_added=False, saved=True)
+        return True
+
+    def process(item):
+        idx, row = item
+        return fetch_row(
+            row,
+            idx + 1,
+            len(rows_to_process),
             scraper,
             config,
-            row,
             force=args.force,
             schedule_only=args.schedule_only,
+            limiter=limiter,
         )
-        
-        # Update row
-        for key, value in festival_data.items():
-            if value:  # Only update if we got data
-                row[key] = value
-        
-        updated_count += 1
-        
-        # Rate limit
-        scraper.rate_limit_delay(1.0)
-        print()
+
+    started = time.monotonic()
+    outcomes = []
+
+    def record(outcome):
+        outcomes.append(outcome)
+        updated = outcomes.count(True)
+        if outcome and updated % CHECKPOINT_INTERVAL == 0:
+            with _ROW_UPDATE_LOCK:
+                saved = save_if_changed()
+            if saved:
+                print(f"  💾 Progress saved ({updated} artists)")
+
+    try:
+        if args.workers > 1:
+            print(f"Fetching with {args.workers} workers...\n")
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=args.workers)
+            try:
+                futures = [executor.submit(process, item) for item in enumerate(rows_to_process)]
+                for future in concurrent.futures.as_completed(futures):
+                    record(future.result())
+            finally:
+                # After Ctrl+C the queued artists are dropped and the running ones finish,
+                # so no worker is still writing to a row while it is saved
+                executor.shutdown(wait=True, cancel_futures=True)
+        else:
+            for item in enumerate(rows_to_process):
+                record(process(item))
+    except KeyboardInterrupt:
+        # Rows are updated in place, so everything fetched so far is saved
+        save_interrupted_run(csv_path, headers, all_rows)
+
+    updated_count = outcomes.count(True)
+    skipped_count = outcomes.count(False)
+    elapsed = time.monotonic() - started
+
+    # Dutch bios are translated afterwards in batches instead of one request per artist
+    if config.bio_language == 'Dutch':
+        translate_missing_bios(rows_to_process)
     
-    # Save updated CSV (save all rows, not just filtered)
-    save_csv(csv_path, headers, all_rows)
+    # Save updated CSV (save all rows, not just filtered). An unchanged CSV is
+    # left untouched so its modification time doesn't trigger page regeneration.
+    if not save_if_changed() and not saved_state['saved']:
+        print(f"\n✓ No changes, CSV left untouched")
     
     print(f"\n✓ Festival data fetching complete!")
     print(f"  Updated: {updated_count} artist(s)")
     print(f"  Skipped: {skipped_count} artist(s)")
+    if updated_count and elapsed > 0:
+        print(f"  Throughput: {updated_count / elapsed:.2f} artist(s)/s over {elapsed:.1f}s "
+              f"({args.workers} worker(s), max {args.max_rps:g} page request(s)/s)")
     print(f"\nNext steps:")
     print(f"  1. Run: python enrich_artists.py --ai  (if needed)")
     print(f"  2. Run: python generate_html.py --year {args.year}")
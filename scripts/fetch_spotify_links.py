@@ -13,13 +13,26 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
 import csv
-from typing import Optional
-import urllib.request
-import urllib.parse
-import json
-import base64
+import concurrent.futures
+from typing import Dict, Optional
+import unicodedata
+import requests
+from requests.adapters import HTTPAdapter
 
 from helpers import FestivalScraper, get_festival_config
+from helpers.llm_cache import disable_llm_cache, get_cached_response, make_cache_key, store_response
+from helpers.rate_limiter import RateLimiter
+
+# Replaces the old fixed 0.5 s pause between artists; shared by all workers (--max-rps)
+DEFAULT_MAX_RPS = 2.0
+
+# Artists that were not found on Spotify are searched again after 30 days
+NOT_FOUND_CACHE_TTL = 30 * 24 * 3600
+
+# One keep-alive session for all Spotify API calls, so the TLS handshake is
+# paid once per run instead of once per artist
+_SPOTIFY_SESSION = requests.Session()
+_SPOTIFY_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=20))
 
 
 def get_spotify_token() -> Optional[str]:
@@ -36,36 +49,34 @@ def get_spotify_token() -> Optional[str]:
     if not client_id or not client_secret:
         return None
     
-    # Create authorization header
-    auth_str = f"{client_id}:{client_secret}"
-    auth_bytes = auth_str.encode('ascii')
-    auth_base64 = base64.b64encode(auth_bytes).decode('ascii')
-    
-    # Request access token
+    # Request access token (HTTP Basic auth with the client credentials)
     url = "https://accounts.spotify.com/api/token"
-    data = urllib.parse.urlencode({'grant_type': 'client_credentials'}).encode('ascii')
-    headers = {
-        'Authorization': f'Basic {auth_base64}',
-        'Content-Type': 'application/x-www-form-urlencoded'
-    }
     
     try:
-        req = urllib.request.Request(url, data=data, headers=headers, method='POST')
-        with urllib.request.urlopen(req, timeout=10) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            return result.get('access_token')
+        response = _SPOTIFY_SESSION.post(
+            url,
+            data={'grant_type': 'client_credentials'},
+            auth=(client_id, client_secret),
+            timeout=10
+        )
+        response.raise_for_status()
+        return response.json().get('access_token')
     except Exception as e:
         print(f"  ⚠️  Error getting Spotify token: {e}")
         return None
 
 
-def search_spotify_artist(artist_name: str, token: str) -> Optional[str]:
+def search_spotify_artist(artist_name: str, token: str, limiter: Optional[RateLimiter] = None) -> Optional[str]:
     """
     Search for an artist on Spotify and return their profile URL.
     
+    Results are cached on disk (helpers.llm_cache) by normalized artist name,
+    so artists shared between festivals and years are only searched once.
+    
     Args:
         artist_name: Name of the artist to search
         token: Spotify API access token
+        limiter: Optional rate limiter, acquired only when the API is actually called
         
     Returns:
         Spotify artist URL or None if not found
@@ -73,32 +84,93 @@ def search_spotify_artist(artist_name: str, token: str) -> Optional[str]:
     # Clean up artist name for search
     search_query = artist_name.strip()
     
-    # URL encode the query
-    encoded_query = urllib.parse.quote(f'artist:{search_query}')
-    url = f"https://api.spotify.com/v1/search?q={encoded_query}&type=artist&limit=1"
+    cache_key = make_cache_key("spotify-search", unicodedata.normalize('NFKD', search_query).casefold())
+    cached = get_cached_response(cache_key)
+    if cached is not None:
+        return cached or None
+    
+    if limiter:
+        limiter.acquire()
+    
+    url = "https://api.spotify.com/v1/search"
+    params = {'q': f'artist:{search_query}', 'type': 'artist', 'limit': 1}
     
     headers = {
         'Authorization': f'Bearer {token}'
     }
     
     try:
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=10) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            artists = result.get('artists', {}).get('items', [])
-            
-            if artists:
-                artist = artists[0]
-                artist_id = artist.get('id')
-                if artist_id:
-                    return f"https://open.spotify.com/artist/{artist_id}"
+        response = _SPOTIFY_SESSION.get(url, params=params, headers=headers, timeout=10)
+        response.raise_for_status()
+        artists = response.json().get('artists', {}).get('items', [])
+        
+        if artists:
+            artist = artists[0]
+            artist_id = artist.get('id')
+            if artist_id:
+                artist_url = f"https://open.spotify.com/artist/{artist_id}"
+                store_response(cache_key, artist_url)
+                return artist_url
+        store_response(cache_key, "", ttl=NOT_FOUND_CACHE_TTL)
     except Exception as e:
         print(f"  ⚠️  Error searching Spotify for {artist_name}: {e}")
     
     return None
 
 
-def update_spotify_links(csv_path: Path, festival: str = 'down-the-rabbit-hole', year: int = None, use_spotify_api: bool = False):
+def lookup_spotify_link(
+    row: Dict,
+    scraper: FestivalScraper,
+    spotify_token: Optional[str],
+    use_api: bool,
+    limiter: RateLimiter
+) -> Optional[str]:
+    """
+    Look up the Spotify link for one CSV row.
+    
+    Args:
+        row: CSV row dict (not modified)
+        scraper: Festival scraper
+        spotify_token: Spotify API access token, or None
+        use_api: If True, search the Spotify API instead of scraping the festival page
+        limiter: Rate limiter shared by all workers, acquired before every request
+        
+    Returns:
+        Spotify artist URL or None if not found
+    """
+    artist_name = row.get('Artist', '').strip()
+    festival_url = row.get('Festival URL', '').strip()
+    
+    print(f"Fetching: {artist_name}...")
+    if use_api:
+        return search_spotify_artist(artist_name, spotify_token, limiter)
+    
+    # Scrape from festival page using the Festival URL from CSV if available
+    limiter.acquire()
+    if festival_url:
+        html = scraper.fetch_page(festival_url)
+        new_link = scraper.extract_spotify_link(html) if html else None
+    else:
+        # Fall back to constructing URL from artist name
+        new_link = scraper.fetch_spotify_link(artist_name)
+    
+    # If scraping failed and we have Spotify token, try API as fallback
+    if not new_link and spotify_token:
+        print(f"  ℹ️  {artist_name}: trying Spotify API as fallback...")
+        new_link = search_spotify_artist(artist_name, spotify_token, limiter)
+    
+    return new_link
+
+
+def update_spotify_links(
+    csv_path: Path,
+    festival: str = 'down-the-rabbit-hole',
+    year: int = None,
+    use_spotify_api: bool = False,
+    workers: int = 1,
+    max_rps: float = DEFAULT_MAX_RPS,
+    missing_only: bool = False
+):
     """
     Update Spotify links in CSV from festival website or Spotify API.
     
@@ -107,6 +179,9 @@ def update_spotify_links(csv_path: Path, festival: str = 'down-the-rabbit-hole',
         festival: Festival identifier
         year: Festival year
         use_spotify_api: If True, use Spotify API instead of scraping festival pages
+        workers: Number of artists to look up concurrently
+        max_rps: Maximum requests per second across all workers
+        missing_only: If True, only look up artists without a Spotify link
     """
     # Get festival configuration
     if year is None:
@@ -139,44 +214,36 @@ def update_spotify_links(csv_path: Path, festival: str = 'down-the-rabbit-hole',
                 del row[None]
             rows.append(row)
     
-    source = "Spotify API" if (use_spotify_api or (festival == 'footprints' and spotify_token)) else f"{config.name} website"
+    use_api = use_spotify_api or (festival == 'footprints' and bool(spotify_token))
+    source = "Spotify API" if use_api else f"{config.name} website"
     print(f"\n=== Updating Spotify Links from {source} ({year}) ===\n")
     print(f"Processing {len(rows)} artists...\n")
     
+    limiter = RateLimiter(max_rps, 1.0)
+    named_rows = [row for row in rows if row.get('Artist', '').strip()]
+    if missing_only:
+        named_rows = [row for row in named_rows if not row.get('Spotify Link', '').strip()]
+        print(f"Looking up {len(named_rows)} artist(s) without a Spotify link...\n")
+
+    def lookup(row):
+        return lookup_spotify_link(row, scraper, spotify_token, use_api, limiter)
+
+    # Lookups are network-bound, so several can run concurrently; results
+    # are reported in CSV order afterwards.
+    if workers > 1:
+        print(f"Fetching with {workers} workers...\n")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            new_links = list(executor.map(lookup, named_rows))
+    else:
+        new_links = [lookup(row) for row in named_rows]
+    
     updated_count = 0
     added_count = 0
     skipped_count = 0
     
-    for row in rows:
+    for row, new_link in zip(named_rows, new_links):
         artist_name = row.get('Artist', '').strip()
         current_link = row.get('Spotify Link', '').strip()
-        festival_url = row.get('Festival URL', '').strip()
-        
-        if not artist_name:
-            continue
-        
-        print(f"Fetching: {artist_name}...")
-        new_link = None
-        
-        # Decide which method to use
-        if use_spotify_api or (festival == 'footprints' and spotify_token):
-            # Use Spotify API
-            new_link = search_spotify_artist(artist_name, spotify_token)
-        else:
-            # Scrape from festival page using the Festival URL from CSV if available
-            if festival_url:
-                # Fetch directly from the Festival URL in CSV
-                html = scraper.fetch_page(festival_url)
-                if html:
-                    new_link = scraper.extract_spotify_link(html)
-            else:
-                # Fall back to constructing URL from artist name
-                new_link = scraper.fetch_spotify_link(artist_name)
-            
-            # If scraping failed and we have Spotify token, try API as fallback
-            if not new_link and spotify_token:
-                print(f"  ℹ️  Trying Spotify API as fallback...")
-                new_link = search_spotify_artist(artist_name, spotify_token)
         
         if new_link:
             if current_link and current_link != new_link:
@@ -194,9 +261,6 @@ def update_spotify_links(csv_path: Path, festival: str = 'down-the-rabbit-hole',
         else:
             print(f"  ⚠️  Not found: {artist_name}")
             skipped_count += 1
-        
-        # Be nice to the servers
-        scraper.rate_limit_delay(0.5)
     
     # Save updated CSV
     with open(csv_path, 'w', encoding='utf-8', newline='') as f:
@@ -236,8 +300,36 @@ def main():
         action="store_true",
         help="Use Spotify API instead of scraping festival pages (requires SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of artists to look up concurrently (default: 1). "
+             "Requests stay limited by --max-rps."
+    )
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        default=DEFAULT_MAX_RPS,
+        help=f"Maximum requests per second across all workers (default: {DEFAULT_MAX_RPS})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the cached Spotify search results (always search the API)"
+    )
+    parser.add_argument(
+        "--missing-only",
+        action="store_true",
+        help="Only look up artists without a Spotify link (skip verifying existing links)"
+    )
     
     args = parser.parse_args()
+    if not args.max_rps > 0:  # Also rejects nan
+        parser.error("--max-rps must be greater than 0")
+    
+    if args.no_cache:
+        disable_llm_cache()
     
     # Use the docs/{festival}/{year}/{year}.csv file
     csv_path = Path(__file__).parent.parent / "docs" / args.festival / str(args.year) / f"{args.year}.csv"
@@ -246,7 +338,15 @@ def main():
         print(f"✗ CSV file not found: {csv_path}")
         sys.exit(1)
     
-    update_spotify_links(csv_path, festival=args.festival, year=args.year, use_spotify_api=args.api)
+    update_spotify_links(
+        csv_path,
+        festival=args.festival,
+        year=args.year,
+        use_spotify_api=args.api,
+        workers=args.workers,
+        max_rps=args.max_rps,
+        missing_only=args.missing_only
+    )
 
 
 if __name__ == "__main__":
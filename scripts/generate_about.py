@@ -17,6 +17,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
 import csv
+import hashlib
 import json
 import os
 from datetime import datetime, timezone
@@ -24,6 +25,8 @@ import argparse
 
 from helpers import get_festival_config, generate_hamburger_menu
 from helpers.ai_client import enrich_with_ai
+from helpers.json_utils import dumps_compact, dumps_pretty
+from helpers.llm_cache import get_cached_response, make_cache_key, store_response
 from helpers.text_utils import markdown_to_html
 
 
@@ -72,59 +75,53 @@ def compute_stats(artists: list[dict]) -> dict:
     stats = {}
     stats['total_artists'] = len(artists)
 
-    # Genres
+    # All counters are filled in a single pass over the artists
     genre_counts = {}
+    country_counts = {}
+    gender_counts = {}
+    poc_counts = {}
     dj_count = 0
+    spotify_count = 0
+    rated = []
+    # Rating distribution by ranges
+    dist = {
+        '9-10': 0,
+        '8-9': 0,
+        '7-8': 0,
+        '6-7': 0,
+        '5-6': 0
+    }
     for a in artists:
+        # Genres
         g = (a.get('Genre') or '').strip()
         name = (a.get('Artist') or '').lower()
         bio = (a.get('Bio') or '')
-        if 'dj' in (g.lower() if g else '') or 'dj' in name or 'b2b' in name or 'dj' in bio.lower():
+        if 'dj' in g.lower() or 'dj' in name or 'b2b' in name or 'dj' in bio.lower():
             dj_count += 1
         if g:
-            for part in [p.strip() for p in g.split('/') if p.strip()]:
-                genre_counts[part] = genre_counts.get(part, 0) + 1
+            for part in g.split('/'):
+                part = part.strip()
+                if part:
+                    genre_counts[part] = genre_counts.get(part, 0) + 1
 
-    stats['genre_counts'] = dict(sorted(genre_counts.items(), key=lambda kv: -kv[1]))
-    stats['dj_count'] = dj_count
-
-    # Countries
-    country_counts = {}
-    for a in artists:
+        # Countries
         c = (a.get('Country') or '').strip()
         if c:
-            for part in [p.strip() for p in c.split('/') if p.strip()]:
-                country_counts[part] = country_counts.get(part, 0) + 1
-    stats['country_counts'] = dict(sorted(country_counts.items(), key=lambda kv: -kv[1]))
+            for part in c.split('/'):
+                part = part.strip()
+                if part:
+                    country_counts[part] = country_counts.get(part, 0) + 1
 
-    # Gender and POC
-    gender_counts = {}
-    poc_counts = {}
-    for a in artists:
+        # Gender and POC
         gender = (a.get('Gender of Front Person') or 'Unknown').strip() or 'Unknown'
         poc = (a.get('Front Person of Color?') or 'Unknown').strip() or 'Unknown'
         gender_counts[gender] = gender_counts.get(gender, 0) + 1
         poc_counts[poc] = poc_counts.get(poc, 0) + 1
-    stats['gender_counts'] = gender_counts
-    stats['poc_counts'] = poc_counts
 
-    # Ratings
-    ratings = [safe_float(a.get('AI Rating')) for a in artists]
-    rated = [r for r in ratings if r is not None]
-    rated_percentage = (len(rated) / len(artists) * 100) if artists else 0
-    if rated:
-        stats['average_rating'] = round(sum(rated) / len(rated), 2)
-        stats['rated_count'] = len(rated)
-        stats['rated_percentage'] = round(rated_percentage, 1)
-        # Distribution by ranges
-        dist = {
-            '9-10': 0,
-            '8-9': 0,
-            '7-8': 0,
-            '6-7': 0,
-            '5-6': 0
-        }
-        for r in rated:
+        # Ratings
+        r = safe_float(a.get('AI Rating'))
+        if r is not None:
+            rated.append(r)
             if r >= 9:
                 dist['9-10'] += 1
             elif r >= 8:
@@ -135,6 +132,23 @@ def compute_stats(artists: list[dict]) -> dict:
                 dist['6-7'] += 1
             elif r >= 5:
                 dist['5-6'] += 1
+
+        # Spotify
+        spotify = (a.get('Spotify Link') or '').strip()
+        if spotify and spotify != 'NOT ON SPOTIFY':
+            spotify_count += 1
+
+    stats['genre_counts'] = dict(sorted(genre_counts.items(), key=lambda kv: -kv[1]))
+    stats['dj_count'] = dj_count
+    stats['country_counts'] = dict(sorted(country_counts.items(), key=lambda kv: -kv[1]))
+    stats['gender_counts'] = gender_counts
+    stats['poc_counts'] = poc_counts
+
+    rated_percentage = (len(rated) / len(artists) * 100) if artists else 0
+    if rated:
+        stats['average_rating'] = round(sum(rated) / len(rated), 2)
+        stats['rated_count'] = len(rated)
+        stats['rated_percentage'] = round(rated_percentage, 1)
         # Add unrated count
         unrated_count = len(artists) - len(rated)
         if unrated_count > 0:
@@ -147,16 +161,36 @@ def compute_stats(artists: list[dict]) -> dict:
         stats['rated_percentage'] = 0
         stats['rating_counts'] = {'Unrated': len(artists)}
 
-    # Other counts
-    spotify_count = sum(1 for a in artists if (a.get('Spotify Link') or '').strip() and a.get('Spotify Link', '').strip() != 'NOT ON SPOTIFY')
     stats['has_spotify_links'] = spotify_count
     stats['spotify_percentage'] = round((spotify_count / len(artists) * 100), 1) if artists else 0
 
     return stats
 
 
-def compare_with_previous(csv_path: Path, artists: list[dict]) -> dict:
+def csv_digest(csv_file: Path) -> str:
+    """SHA-256 of the CSV contents, stored in about.json to tell which CSV its stats came from."""
+    return hashlib.sha256(csv_file.read_bytes()).hexdigest()
+
+
+def load_previous_stats(prev_file: Path) -> dict:
+    # The previous edition's about.json already holds its stats; reuse them
+    # only if they were computed from this exact CSV (mtimes are reset by
+    # git checkout, so the contents are compared instead)
+    about_file = prev_file.parent / 'about.json'
+    try:
+        about = json.loads(about_file.read_text(encoding='utf-8'))
+        stats = about.get('stats')
+        if (about.get('source_csv_sha256') == csv_digest(prev_file)
+                and isinstance(stats, dict) and 'genre_counts' in stats and 'average_rating' in stats):
+            return stats
+    except (OSError, ValueError, AttributeError):
+        pass
+    return compute_stats(load_artists(prev_file))
+
+
+def compare_with_previous(csv_path: Path, artists: list[dict], current: dict | None = None) -> dict:
     # Try to find previous year file and compute simple deltas for top genres and avg rating
+    # (pass the already computed stats as `current` to avoid counting the artists twice)
     prev_stats = {}
     try:
         year = int(csv_path.stem)
@@ -164,9 +198,9 @@ def compare_with_previous(csv_path: Path, artists: list[dict]) -> dict:
         return {}
     prev_file = csv_path.parent.parent / str(year - 1) / f"{year-1}.csv"
     if prev_file.exists():
-        prev_artists = load_artists(prev_file)
-        prev_stats_calc = compute_stats(prev_artists)
-        current = compute_stats(artists)
+        prev_stats_calc = load_previous_stats(prev_file)
+        if current is None:
+            current = compute_stats(artists)
         deltas = {}
         for g, cnt in list(current['genre_counts'].items())[:5]:
             prev_cnt = prev_stats_calc.get('genre_counts', {}).get(g, 0)
@@ -175,25 +209,39 @@ def compare_with_previous(csv_path: Path, artists: list[dict]) -> dict:
     return prev_stats
 
 
-def generate_profile_text(config, stats: dict, prev: dict, start_date=None, end_date=None, use_ai: bool = False) -> str:
+def format_date_range(start_date, end_date) -> str:
+    """Format festival dates (YYYY-MM-DD) as e.g. 'June 19 - 21, 2026'; '' if missing or invalid."""
+    if not (start_date and end_date):
+        return ''
+    try:
+        start_dt = datetime.strptime(start_date, '%Y-%m-%d')
+        end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+    except ValueError:
+        return ''
+    if start_date == end_date:
+        return start_dt.strftime('%B %d, %Y')
+    if start_dt.month == end_dt.month and start_dt.year == end_dt.year:
+        return f"{start_dt.strftime('%B %d')} - {end_dt.strftime('%d, %Y')}"
+    if start_dt.year == end_dt.year:
+        return f"{start_dt.strftime('%B %d')} - {end_dt.strftime('%B %d, %Y')}"
+    return f"{start_dt.strftime('%B %d, %Y')} - {end_dt.strftime('%B %d, %Y')}"
+
+
+def generate_profile_text(config, stats: dict, prev: dict, start_date=None, end_date=None, use_ai: bool = False,
+                          force_ai: bool = False) -> str:
+    """
+    Write the festival profile, with Azure OpenAI when use_ai is set.
+
+    AI profiles are cached in the LLM cache (helpers.llm_cache) keyed by the
+    deployment and the full prompt, so regenerating a page with unchanged
+    stats does not call the API again. force_ai skips the cached profile and
+    stores the newly generated one.
+    """
     # Format festival dates if available
     date_text = ''
-    if start_date and end_date:
-        from datetime import datetime as dt
-        try:
-            start_dt = dt.strptime(start_date, '%Y-%m-%d')
-            end_dt = dt.strptime(end_date, '%Y-%m-%d')
-            if start_date == end_date:
-                date_text = f"taking place on {start_dt.strftime('%B %d, %Y')}"
-            else:
-                if start_dt.month == end_dt.month and start_dt.year == end_dt.year:
-                    date_text = f"taking place {start_dt.strftime('%B %d')} - {end_dt.strftime('%d, %Y')}"
-                elif start_dt.year == end_dt.year:
-                    date_text = f"taking place {start_dt.strftime('%B %d')} - {end_dt.strftime('%B %d, %Y')}"
-                else:
-                    date_text = f"taking place {start_dt.strftime('%B %d, %Y')} - {end_dt.strftime('%B %d, %Y')}"
-        except ValueError:
-            pass
+    date_display = format_date_range(start_date, end_date)
+    if date_display:
+        date_text = f"taking place on {date_display}" if start_date == end_date else f"taking place {date_display}"
     
     # Build a prompt for AI summarization
     
@@ -226,8 +274,16 @@ def generate_profile_text(config, stats: dict, prev: dict, start_date=None, end_
     
     prompt = "\n\n".join(prompt_lines)
     if use_ai:
+        deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4o")
+        cache_key = make_cache_key("about-profile", deployment, prompt)
+        cached = None if force_ai else get_cached_response(cache_key)
+        if cached is not None:
+            print("↷ Using cached AI profile (stats unchanged)")
+            return cached
         try:
-            return enrich_with_ai(prompt, temperature=0.6)
+            profile = enrich_with_ai(prompt, temperature=0.6)
+            store_response(cache_key, profile)
+            return profile
         except Exception as e:
             print(f"⚠️ AI generation failed: {e}")
 
@@ -266,28 +322,24 @@ def write_outputs(output_dir: Path, about: dict, html_profile: str):
     output_dir.mkdir(parents=True, exist_ok=True)
     json_path = output_dir / 'about.json'
     html_path = output_dir / 'about.html'
-    with json_path.open('w', encoding='utf-8') as f:
-        json.dump(about, f, indent=2, ensure_ascii=False)
+    json_path.write_text(dumps_pretty(about), encoding='utf-8')
     with html_path.open('w', encoding='utf-8') as f:
         f.write(html_profile)
     print(f"✓ Wrote {json_path} and {html_path}")
 
 
-def render_html(config, stats, profile_text, start_date=None, end_date=None, artists=None, map_diagram=None):
+def render_html(config, stats, profile_text, start_date=None, end_date=None, artists=None, map_diagram=None, generated_at=None):
+    if generated_at is None:
+        generated_at = datetime.now(timezone.utc)
+
     # Generate menu HTML (use escaped=False since we'll manually escape in the f-string)
     menu_html = generate_hamburger_menu(path_prefix="../../", escaped=False)
     
-    # Build formatted statistics tables
-    genre_rows = ''.join([f'<tr><td>{genre}</td><td>{count}</td></tr>' 
+    # Build formatted statistics tables (gender, POC and ratings are rendered as charts)
+    genre_rows = ''.join([f'<tr><td>{html.escape(genre, quote=False)}</td><td>{count}</td></tr>' 
                           for genre, count in list(stats.get('genre_counts', {}).items())[:10]])
-    country_rows = ''.join([f'<tr><td>{country}</td><td>{count}</td></tr>' 
+    country_rows = ''.join([f'<tr><td>{html.escape(country, quote=False)}</td><td>{count}</td></tr>' 
                             for country, count in list(stats.get('country_counts', {}).items())[:10]])
-    gender_rows = ''.join([f'<tr><td>{gender}</td><td>{count}</td></tr>' 
-                           for gender, count in stats.get('gender_counts', {}).items()])
-    poc_rows = ''.join([f'<tr><td>{poc}</td><td>{count}</td></tr>' 
-                        for poc, count in stats.get('poc_counts', {}).items()])
-    rating_rows = ''.join([f'<tr><td>{rating}</td><td>{count}</td></tr>' 
-                           for rating, count in sorted(stats.get('rating_distribution', {}).items(), key=lambda x: -int(x[0]))])
     
     # Build rating overview stat HTML conditionally
     rated_percentage = stats.get('rated_percentage', 0)
@@ -490,7 +542,7 @@ def render_html(config, stats, profile_text, start_date=None, end_date=None, art
                 Please verify critical details on official sources.
             </p>
             <p style="margin-bottom: 0;">
-                Generated with ❤️ on {datetime.now(timezone.utc).strftime('%B %d, %Y %H:%M UTC')} • 
+                Generated with ❤️ on {generated_at.strftime('%B %d, %Y %H:%M UTC')} • 
                 <a href="https://github.com/frankvaneykelen/lineup-radar" target="_blank" style="color: #00d9ff; text-decoration: none;">
                     <i class="bi bi-github"></i> View on GitHub
                 </a>
@@ -502,9 +554,9 @@ def render_html(config, stats, profile_text, start_date=None, end_date=None, art
 {mermaid_script_html}
     <script>
         // Prepare data for charts
-        const genderData = {json.dumps(dict(stats.get('gender_counts', {})))};
-        const pocData = {json.dumps(dict(stats.get('poc_counts', {})))};
-        const ratingData = {json.dumps(dict(stats.get('rating_counts', {})))};
+        const genderData = {dumps_compact(dict(stats.get('gender_counts', {})))};
+        const pocData = {dumps_compact(dict(stats.get('poc_counts', {})))};
+        const ratingData = {dumps_compact(dict(stats.get('rating_counts', {})))};
         
         // Color schemes
         const genderColors = {{
@@ -601,27 +653,37 @@ def render_html(config, stats, profile_text, start_date=None, end_date=None, art
     return html_output
 
 
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--festival', required=True)
-    parser.add_argument('--year', type=int, required=True)
-    parser.add_argument('--output', default='docs')
-    parser.add_argument('--ai', action='store_true', help='Use Azure OpenAI to generate profile')
-    args = parser.parse_args()
+def generate_about(festival: str, year: int, output: str = 'docs', use_ai: bool = False,
+                   force_ai: bool = False) -> bool:
+    """
+    Generate about.json and about.html for a festival year.
+
+    Callable from other scripts, so a batch over many festivals can run in
+    one process and reuse the cached settings.json parses.
 
-    config = get_festival_config(args.festival, args.year)
-    csv_file = Path(f"docs/{config.slug}/{args.year}/{args.year}.csv")
+    Args:
+        festival: Festival slug
+        year: Festival year
+        output: Root output directory (default: 'docs')
+        use_ai: Use Azure OpenAI to generate the profile text
+        force_ai: Regenerate the AI profile even if a cached one exists
+
+    Returns:
+        True if the pages were written, False if the CSV was not found
+    """
+    config = get_festival_config(festival, year)
+    csv_file = Path(f"docs/{config.slug}/{year}/{year}.csv")
     if not csv_file.exists():
         print(f"✗ CSV not found: {csv_file}")
-        return
+        return False
 
     artists = load_artists(csv_file)
     stats = compute_stats(artists)
-    stats['year'] = args.year
-    prev = compare_with_previous(csv_file, artists)
+    stats['year'] = year
+    prev = compare_with_previous(csv_file, artists, stats)
 
     # Read settings.json for user-defined properties
-    out_dir = Path(args.output) / config.slug / str(args.year)
+    out_dir = Path(output) / config.slug / str(year)
     settings_file = out_dir / 'settings.json'
     settings = {}
     if settings_file.exists():
@@ -634,46 +696,51 @@ def main():
     # Extract specific settings
     start_date = settings.get('start_date')
     end_date = settings.get('end_date')
-    stages = settings.get('stages')
-    
-    # Build config_properties from settings.json, falling back to config object
-    config_properties = {
-        'name': settings.get('name', config.name),
-        'year': args.year,
-        'base_url': settings.get('base_url', config.base_url),
-        'lineup_url': settings.get('lineup_url', config.lineup_url),
-        'artist_path': settings.get('artist_path', config.artist_path),
-        'slug': config.slug,
-        'bio_language': settings.get('bio_language', config.bio_language),
-        'rating_boost': settings.get('rating_boost', config.rating_boost),
-        'description': settings.get('description', config.description),
-        'official_spotify_playlist': settings.get('official_spotify_playlist', config.official_spotify_playlist),
-        'spotify_playlist_id': settings.get('spotify_playlist_id', config.spotify_playlist_id),
-    }
 
     profile_text = ''
     # Only call the networked AI when --ai is explicitly provided. Otherwise use fallback text.
-    profile_text = generate_profile_text(config, stats, prev, start_date, end_date, use_ai=args.ai)
+    profile_text = generate_profile_text(config, stats, prev, start_date, end_date, use_ai=use_ai,
+                                         force_ai=force_ai)
 
+    # One timestamp for about.json and the about.html footer
+    generated_at = datetime.now(timezone.utc)
     about = {
         'festival': config.slug,
-        'year': args.year,
-        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'year': year,
+        'generated_at': generated_at.isoformat(),
+        'source_csv_sha256': csv_digest(csv_file),
         'stats': stats,
         'previous_year_comparison': prev,
         'ai_profile': profile_text
     }
+    date_display = format_date_range(start_date, end_date)
+    if date_display:
+        about['date_display'] = date_display
 
     map_diagram = extract_map_diagram(out_dir / 'map.md')
-    html = render_html(config, stats, profile_text, start_date, end_date, artists, map_diagram)
+    html = render_html(config, stats, profile_text, start_date, end_date, artists, map_diagram, generated_at)
     write_outputs(out_dir, about, html)
     
     # Generate/update README for this festival edition
     try:
         from generate_festival_readme import generate_readme
-        generate_readme(args.festival, args.year)
+        generate_readme(festival, year)
     except Exception:
         pass  # Silent fail - README is nice to have but not critical
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--festival', required=True)
+    parser.add_argument('--year', type=int, required=True)
+    parser.add_argument('--output', default='docs')
+    parser.add_argument('--ai', action='store_true', help='Use Azure OpenAI to generate profile')
+    parser.add_argument('--force-ai', action='store_true',
+                        help='With --ai, regenerate the profile even if a cached one matches the current stats')
+    args = parser.parse_args()
+
+    generate_about(args.festival, args.year, output=args.output, use_ai=args.ai, force_ai=args.force_ai)
 
 
 if __name__ == '__main__':
@@ -13,21 +13,43 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 import csv
 import os
-import json
 import re
 from helpers import artist_name_to_slug, get_festival_config, generate_hamburger_menu
 from helpers.slug import get_sort_name
+from helpers.json_utils import dumps_compact
+
+# Translation table for escape_html (single pass instead of five replace calls)
+_HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#39;",
+})
+
 
 def escape_html(text):
     """Escape HTML special characters."""
     if not text:
         return ""
-    return (str(text)
-            .replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&#39;"))
+    return str(text).translate(_HTML_ESCAPE_TABLE)
+
+
+# Table row template, filled with a single %-format call per artist
+_ROW_TMPL = """                    <tr data-index="%d">
+                        <td class="%s" onclick="window.location.href='%s'" %s title="%s">
+                            <strong>%s</strong>%s
+                        </td>
+                        <td class="tagline">%s</td>
+                        %s
+                        <td>%s</td>
+                        <td>%s</td>
+                        <td>%s</td>
+                        <td>%s</td>
+                        <td title="%s">%s</td>
+                        <td title="Front Person of Color: %s">%s</td>
+                    </tr>
+"""
 
 
 def is_cancelled(value):
@@ -35,18 +57,22 @@ def is_cancelled(value):
     normalized = str(value or '').strip().lower()
     return normalized in {'yes', 'true', '1', 'y'}
 
+def read_csv_rows(csv_file):
+    """
+    Read a CSV file into (headers, rows).
+
+    Short rows are padded with empty strings, so every row has all headers.
+    """
+    with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f, restval='')
+        return reader.fieldnames or [], list(reader)
+
+
 def generate_html(csv_file, output_dir, config):
     """Generate HTML page from CSV file."""
     
     # Read CSV data
-    artists = []
-    headers = []
-    
-    with open(csv_file, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        headers = reader.fieldnames
-        for row in reader:
-            artists.append(row)
+    headers, artists = read_csv_rows(csv_file)
     
     if not artists:
         print(f"No data found in {csv_file}")
@@ -83,8 +109,21 @@ def generate_html(csv_file, output_dir, config):
     from helpers.slug import get_sort_name
     artists = sorted(artists, key=lambda a: get_sort_name(a.get('Artist', '')))
     
-    # Generate HTML content
-    html_content = f"""<!DOCTYPE html>
+    # Stream HTML to disk: header, one chunk per row, then footer
+    output_file = output_path / "index.html"
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        _write_page(f, artists, config, year, output_dir, has_schedule_data,
+                    title, description, base_url, url, last_updated_str)
+    
+    print(f"✓ Generated {output_file}")
+    print(f"  {len(artists)} artists included")
+    print(f"  Output directory: {output_path}")
+
+
+def _write_page(f, artists, config, year, output_dir, has_schedule_data,
+                title, description, base_url, url, last_updated_str):
+    """Write the lineup page to the open file object f."""
+    f.write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -238,7 +277,7 @@ def generate_html(csv_file, output_dir, config):
                     </tr>
                 </thead>
                 <tbody id="artistTableBody">
-"""
+""")
     
     # Add table rows
     for idx, artist in enumerate(artists):
@@ -394,25 +433,32 @@ def generate_html(csv_file, output_dir, config):
         # Prepare bio tooltip - use the clean bio text without HTML formatting
         bio_tooltip = escape_html(bio_title) if bio_title else ''
         
-        html_content += f"""                    <tr data-index="{idx}">
-                        <td class="{artist_cell_class}" onclick="window.location.href='{artist_page_url}'" {artist_cell_style} title="{bio_tooltip}">
-                            <strong>{artist_name_html}</strong>{cancelled_badge_html}
-                        </td>
-                        <td class="tagline">{tagline}</td>
-                        {schedule_td}
-                        <td>{genre_html}</td>
-                        <td>{country_html}</td>
-                        <td>{rating_html}</td>
-                        <td>{escape_html(artist.get('Number of People in Act', ''))}</td>
-                        <td title="{escape_html(gender)}">{gender_display}</td>
-                        <td title="Front Person of Color: {escape_html(poc)}">{poc_display}</td>
-                    </tr>
-"""
+        f.write(_ROW_TMPL % (
+            idx, artist_cell_class, artist_page_url, artist_cell_style, bio_tooltip,
+            artist_name_html, cancelled_badge_html, tagline, schedule_td,
+            genre_html, country_html, rating_html,
+            escape_html(artist.get('Number of People in Act', '')),
+            escape_html(gender), gender_display, escape_html(poc), poc_display,
+        ))
     
     # Add JavaScript for interactivity
-    artists_json = json.dumps([dict(row) for row in artists])
+    artists_json = dumps_compact([dict(row) for row in artists])
     
-    html_content += f"""                </tbody>
+    # Index genres and countries into integer buckets so the JS filters
+    # compare ints instead of re-splitting strings on every keystroke
+    def split_values(value):
+        return [v.strip() for v in value.split('/')] if value else []
+    
+    artist_genres = [split_values(a.get('Genre', '')) for a in artists]
+    artist_countries = [split_values(a.get('Country', '')) for a in artists]
+    genres_list = sorted({g for gs in artist_genres for g in gs})
+    countries_list = sorted({c for cs in artist_countries for c in cs})
+    genre_id = {g: i for i, g in enumerate(genres_list)}
+    country_id = {c: i for i, c in enumerate(countries_list)}
+    genre_ids_json = dumps_compact([[genre_id[g] for g in gs] for gs in artist_genres])
+    country_ids_json = dumps_compact([[country_id[c] for c in cs] for cs in artist_countries])
+    
+    f.write(f"""                </tbody>
             </table>
         </div>
         
@@ -423,6 +469,12 @@ def generate_html(csv_file, output_dir, config):
     
     <script>
         const artistsData = {artists_json};
+        const GENRES = {dumps_compact(genres_list)};
+        const COUNTRIES = {dumps_compact(countries_list)};
+        const artistGenreIds = {genre_ids_json};
+        const artistCountryIds = {country_ids_json};
+        const genreIndex = new Map(GENRES.map((g, i) => [g, i]));
+        const countryIndex = new Map(COUNTRIES.map((c, i) => [c, i]));
         let currentSort = {{ column: 'Artist', direction: 'asc' }};
         const hasScheduleData = {str(has_schedule_data).lower()};
         
@@ -503,29 +555,19 @@ def generate_html(csv_file, output_dir, config):
             return 'Unknown';
         }}
 
-        // Count genres (split by / to handle multiple genres per artist)
+        // Count genres (precomputed buckets handle multiple genres per artist)
         const genreCounts = {{}};
-        artistsData.forEach(a => {{
-            if (a.Genre) {{
-                a.Genre.split('/').forEach(g => {{
-                    const genre = g.trim();
-                    genreCounts[genre] = (genreCounts[genre] || 0) + 1;
-                }});
-            }}
-        }});
-        const genres = Object.keys(genreCounts).sort();
+        artistGenreIds.forEach(ids => ids.forEach(id => {{
+            genreCounts[GENRES[id]] = (genreCounts[GENRES[id]] || 0) + 1;
+        }}));
+        const genres = GENRES;
         
-        // Count countries (split by / to handle multiple countries per artist)
+        // Count countries (precomputed buckets handle multiple countries per artist)
         const countryCounts = {{}};
-        artistsData.forEach(a => {{
-            if (a.Country) {{
-                a.Country.split('/').forEach(c => {{
-                    const country = c.trim();
-                    countryCounts[country] = (countryCounts[country] || 0) + 1;
-                }});
-            }}
-        }});
-        const countries = Object.keys(countryCounts).sort();
+        artistCountryIds.forEach(ids => ids.forEach(id => {{
+            countryCounts[COUNTRIES[id]] = (countryCounts[COUNTRIES[id]] || 0) + 1;
+        }}));
+        const countries = COUNTRIES;
         
         // Create genre checkboxes
         const genreFilters = document.getElementById('genreFilters');
@@ -636,6 +678,9 @@ def generate_html(csv_file, output_dir, config):
             }}
         }});
         
+        // Visibility per artist (indexed by data-index); all rows start visible
+        const visibleState = new Uint8Array(artistsData.length).fill(1);
+        
         // Search and filter functionality
         function filterTable() {{
             const searchTerm = document.getElementById('searchBox').value.toLowerCase();
@@ -648,8 +693,14 @@ def generate_html(csv_file, output_dir, config):
             const checkedGenders = Array.from(document.querySelectorAll('#genderFilters input:checked')).map(cb => cb.value);
             const checkedPOC = Array.from(document.querySelectorAll('#pocFilters input:checked')).map(cb => cb.value);
             const checkedGenres = Array.from(document.querySelectorAll('#genreFilters input:checked')).map(cb => cb.value);
+            const genreMask = new Uint8Array(GENRES.length);
+            checkedGenres.forEach(g => {{
+                if (genreIndex.has(g)) genreMask[genreIndex.get(g)] = 1;
+            }});
+            const countryFilterId = countryFilter ? (countryIndex.has(countryFilter) ? countryIndex.get(countryFilter) : -1) : -1;
             
             const rows = document.querySelectorAll('#artistTableBody tr');
+            const changedRows = [];
             let visibleCount = 0;
             
             rows.forEach(row => {{
@@ -658,8 +709,8 @@ def generate_html(csv_file, output_dir, config):
                 const searchText = Object.values(artist).join(' ').toLowerCase();
                 
                 const matchesSearch = !searchTerm || searchText.includes(searchTerm);
-                const matchesGenre = checkedGenres.length === 0 || (artist.Genre && artist.Genre.split('/').map(g => g.trim()).some(g => checkedGenres.includes(g)));
-                const matchesCountry = !countryFilter || (artist.Country && artist.Country.split('/').map(c => c.trim()).includes(countryFilter));
+                const matchesGenre = checkedGenres.length === 0 || artistGenreIds[dataIndex].some(id => genreMask[id]);
+                const matchesCountry = !countryFilter || artistCountryIds[dataIndex].includes(countryFilterId);
                 const matchesRating = !ratingFilter || (artist['AI Rating'] && parseFloat(artist['AI Rating']) >= parseFloat(ratingFilter));
                 const matchesDate = !dateFilter || (artist['Date'] && artist['Date'] === dateFilter);
                 const matchesStage = !stageFilter || (artist['Stage'] && artist['Stage'] === stageFilter);
@@ -668,16 +719,24 @@ def generate_html(csv_file, output_dir, config):
                 const matchesGender = checkedGenders.length === 0 || checkedGenders.includes(artistGender);
                 const matchesPOC = checkedPOC.length === 0 || checkedPOC.includes(artistPOC);
                 
-                if (matchesSearch && matchesGenre && matchesCountry && matchesRating && matchesDate && matchesStage && matchesGender && matchesPOC) {{
-                    row.classList.remove('hidden');
-                    visibleCount++;
-                }} else {{
-                    row.classList.add('hidden');
+                const newVisible = (matchesSearch && matchesGenre && matchesCountry && matchesRating && matchesDate && matchesStage && matchesGender && matchesPOC) ? 1 : 0;
+                if (newVisible) visibleCount++;
+                
+                // Only touch rows whose visibility actually changed
+                if (visibleState[dataIndex] !== newVisible) {{
+                    visibleState[dataIndex] = newVisible;
+                    changedRows.push(row);
                 }}
             }});
             
-            document.getElementById('visibleCount').textContent = visibleCount;
-            document.getElementById('visibleCountTop').textContent = visibleCount;
+            // Apply all DOM mutations in a single frame
+            requestAnimationFrame(() => {{
+                changedRows.forEach(row => {{
+                    row.classList.toggle('hidden', !visibleState[parseInt(row.getAttribute('data-index'))]);
+                }});
+                document.getElementById('visibleCount').textContent = visibleCount;
+                document.getElementById('visibleCountTop').textContent = visibleCount;
+            }});
         }}
         
         // Sorting functionality
@@ -854,16 +913,7 @@ def generate_html(csv_file, output_dir, config):
     <script src="overrides.js"></script>
 </body>
 </html>
-"""
-    
-    # Write HTML file
-    output_file = output_path / "index.html"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    
-    print(f"✓ Generated {output_file}")
-    print(f"  {len(artists)} artists included")
-    print(f"  Output directory: {output_path}")
+""")
 
 def main():
     """Main entry point."""
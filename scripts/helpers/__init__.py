@@ -5,11 +5,20 @@ Shared utilities for festival lineup tracking and HTML generation.
 Supports multiple festivals and years.
 """
 
-from .slug import artist_name_to_slug
-from .ai_client import get_azure_openai_client, translate_text, clean_scraped_text
-from .scraper import FestivalScraper
-from .config import FestivalConfig, get_festival_config
-from .menu import generate_hamburger_menu
+import importlib
+
+# Re-exports are imported lazily on first access, so importing a single
+# submodule (e.g. helpers.config) does not pull in bs4 via helpers.scraper.
+_EXPORTS = {
+    'artist_name_to_slug': '.slug',
+    'get_azure_openai_client': '.ai_client',
+    'translate_text': '.ai_client',
+    'clean_scraped_text': '.ai_client',
+    'FestivalScraper': '.scraper',
+    'FestivalConfig': '.config',
+    'get_festival_config': '.config',
+    'generate_hamburger_menu': '.menu',
+}
 
 __all__ = [
     'artist_name_to_slug',
@@ -23,3 +32,15 @@ __all__ = [
 ]
 
 __version__ = '1.0.0'
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
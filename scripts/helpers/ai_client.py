@@ -5,9 +5,29 @@ Azure OpenAI client setup and utilities.
 import os
 import sys
 import json
+import time
 from typing import Optional
 import requests
 
+# Handle both direct execution and package import
+try:
+    from .llm_cache import make_cache_key, get_cached_response, store_response
+    from .rate_limiter import RateLimiter, parse_duration
+except ImportError:
+    from llm_cache import make_cache_key, get_cached_response, store_response
+    from rate_limiter import RateLimiter, parse_duration
+
+# Shared by every thread calling Azure OpenAI through this module (translations,
+# text cleanup), so background and parallel callers stay under the quota together
+AZURE_RATE_LIMITER = RateLimiter(45, 1.0)
+MAX_RETRIES = 3
+RATE_LIMIT_DEFAULT_WAIT = 60  # Seconds to pause on a 429 without Retry-After
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+# Number of texts packed into one translate_texts request. Festival bios are
+# up to a few thousand characters, so larger batches risk truncated output.
+TRANSLATION_BATCH_SIZE = 5
+
 
 def get_azure_openai_credentials() -> tuple[str, str, str]:
     """
@@ -48,7 +68,8 @@ def get_azure_openai_client():
 def call_azure_openai(
     messages: list[dict],
     temperature: float = 0.7,
-    max_tokens: Optional[int] = None
+    max_tokens: Optional[int] = None,
+    response_format: Optional[dict] = None
 ) -> str:
     """
     Call Azure OpenAI Chat Completion API.
@@ -57,10 +78,15 @@ def call_azure_openai(
         messages: List of message dictionaries with 'role' and 'content'
         temperature: Sampling temperature (0.0 to 2.0)
         max_tokens: Maximum tokens in response (optional)
+        response_format: Response format, e.g. {"type": "json_object"} (optional)
         
     Returns:
         Response text from the model
         
+    Requests wait for AZURE_RATE_LIMITER first. A 429 pauses the limiter for
+    the Retry-After delay, so all callers hold back, and transient 5xx
+    responses are retried with exponential backoff (up to MAX_RETRIES times).
+    
     Raises:
         requests.RequestException: If API call fails
     """
@@ -80,13 +106,56 @@ def call_azure_openai(
     if max_tokens:
         payload["max_tokens"] = max_tokens
     
-    response = requests.post(url, headers=headers, json=payload, timeout=60)
+    if response_format:
+        payload["response_format"] = response_format
+    
+    for attempt in range(MAX_RETRIES + 1):
+        AZURE_RATE_LIMITER.acquire()
+        response = requests.post(url, headers=headers, json=payload, timeout=60)
+        AZURE_RATE_LIMITER.update_from_headers(response.headers)
+        if attempt == MAX_RETRIES:
+            break
+        if response.status_code == 429:
+            wait = parse_duration(response.headers.get("Retry-After", "")) or RATE_LIMIT_DEFAULT_WAIT
+            print(f"  ⏳ Rate limited (429), pausing Azure OpenAI requests for {wait:.0f}s...")
+            AZURE_RATE_LIMITER.pause(wait)
+        elif response.status_code in RETRY_STATUS_CODES:
+            wait = 2 ** attempt
+            print(f"  ⏳ Azure OpenAI returned {response.status_code}, retrying in {wait}s...")
+            time.sleep(wait)
+        else:
+            break
     response.raise_for_status()
     
     result = response.json()
     return result['choices'][0]['message']['content']
 
 
+# Translations made by this process, keyed like the LLM cache. Identical bios
+# are translated once per run even when the LLM cache is disabled (--no-cache).
+_translation_memo: dict[str, str] = {}
+
+
+def _translation_cache_key(text: str, from_lang: str, to_lang: str) -> str:
+    """Cache key for a translation, shared by translate_text and translate_texts."""
+    deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4o")
+    return make_cache_key("translate", deployment, from_lang, to_lang, text)
+
+
+def _get_translation(cache_key: str) -> Optional[str]:
+    """Return a known translation from this run or the LLM cache, or None."""
+    translated = _translation_memo.get(cache_key)
+    if translated is None:
+        translated = get_cached_response(cache_key)
+    return translated
+
+
+def _store_translation(cache_key: str, translated: str):
+    """Remember a translation for this run and store it in the LLM cache."""
+    _translation_memo[cache_key] = translated
+    store_response(cache_key, translated)
+
+
 def translate_text(
     text: str,
     from_lang: str = "Dutch",
@@ -95,6 +164,9 @@ def translate_text(
     """
     Translate text using Azure OpenAI.
     
+    Translations are cached in the LLM cache (helpers.llm_cache), so identical
+    bios are only translated once across runs.
+    
     Args:
         text: Text to translate
         from_lang: Source language (default: Dutch)
@@ -106,6 +178,11 @@ def translate_text(
     if not text or not text.strip():
         return ""
     
+    cache_key = _translation_cache_key(text, from_lang, to_lang)
+    cached = _get_translation(cache_key)
+    if cached is not None:
+        return cached
+    
     messages = [
         {
             "role": "system",
@@ -118,10 +195,100 @@ def translate_text(
     ]
     
     try:
-        return call_azure_openai(messages, temperature=0.3)
+        translated = call_azure_openai(messages, temperature=0.3)
     except Exception as e:
         print(f"⚠️  Translation failed: {e}")
         return text  # Return original text if translation fails
+    
+    _store_translation(cache_key, translated)
+    return translated
+
+
+def translate_texts(
+    texts: list[str],
+    from_lang: str = "Dutch",
+    to_lang: str = "English",
+    batch_size: int = TRANSLATION_BATCH_SIZE
+) -> list[str]:
+    """
+    Translate several texts with one Azure OpenAI request per batch.
+    
+    The texts of a batch are sent as a JSON object keyed by index, so the
+    system prompt is paid once per batch instead of once per text. Cached
+    translations are reused, and texts missing from a batch response fall
+    back to translate_text().
+    
+    Args:
+        texts: Texts to translate
+        from_lang: Source language (default: Dutch)
+        to_lang: Target language (default: English)
+        batch_size: Maximum number of texts per request
+        
+    Returns:
+        Translated texts, in the same order as the input
+    """
+    translations = [""] * len(texts)
+    cache_keys = {}
+    first_index = {}  # cache key -> index of the first text with that key
+    duplicates = {}  # index -> index of the first identical text
+    pending = []
+    for i, text in enumerate(texts):
+        if not text or not text.strip():
+            continue
+        cache_keys[i] = _translation_cache_key(text, from_lang, to_lang)
+        if cache_keys[i] in first_index:
+            duplicates[i] = first_index[cache_keys[i]]
+            continue
+        first_index[cache_keys[i]] = i
+        cached = _get_translation(cache_keys[i])
+        if cached is not None:
+            translations[i] = cached
+        else:
+            pending.append(i)
+    
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+        if len(batch) == 1:
+            translations[batch[0]] = translate_text(texts[batch[0]], from_lang, to_lang)
+            continue
+        
+        messages = [
+            {
+                "role": "system",
+                "content": (
+                    f"You are a professional translator. You receive a JSON object whose values are texts in {from_lang}. "
+                    f"Translate every value to {to_lang}, preserving the tone and style. "
+                    f"Return ONLY a JSON object with the same keys and the translated texts as values."
+                )
+            },
+            {
+                "role": "user",
+                "content": json.dumps({str(i): texts[i] for i in batch}, ensure_ascii=False)
+            }
+        ]
+        
+        try:
+            result = json.loads(call_azure_openai(
+                messages,
+                temperature=0.3,
+                response_format={"type": "json_object"}
+            ))
+        except Exception as e:
+            print(f"⚠️  Batch translation failed, translating one by one: {e}")
+            result = {}
+        
+        for i in batch:
+            translated = result.get(str(i)) if isinstance(result, dict) else None
+            if isinstance(translated, str) and translated.strip():
+                translations[i] = translated.strip()
+                _store_translation(cache_keys[i], translations[i])
+            else:
+                translations[i] = translate_text(texts[i], from_lang, to_lang)
+    
+    for i, first in duplicates.items():
+        translations[i] = translations[first]
+    
+    return translations
 
 
 def enrich_with_ai(prompt: str, temperature: float = 0.7) -> str:
@@ -5,6 +5,7 @@ Supports multiple festivals and years with different URL patterns and settings.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 import json
 from pathlib import Path
@@ -83,6 +84,13 @@ def _load_festivals() -> dict:
 FESTIVALS = _load_festivals()
 
 
+@lru_cache(maxsize=32)
+def _read_settings(settings_path: Path, mtime: float) -> dict:
+    """Parse a settings.json file; cached per resolved path and modification time."""
+    with settings_path.open('r', encoding='utf-8') as fh:
+        return json.load(fh)
+
+
 def get_festival_config(
     festival: str = 'down-the-rabbit-hole',
     year: int = 2026
@@ -111,8 +119,7 @@ def get_festival_config(
         settings_path = base / festival / str(year) / "settings.json"
         if settings_path.exists():
             try:
-                with settings_path.open('r', encoding='utf-8') as fh:
-                    s = json.load(fh)
+                s = _read_settings(settings_path.resolve(), settings_path.stat().st_mtime)
                 scraper_cfg = s.get('scraper', {})
                 raw_idx = scraper_cfg.get('image_index')
                 image_index = int(raw_idx) if raw_idx is not None else None
@@ -130,7 +137,7 @@ def get_festival_config(
                     spotify_playlist_id=s.get('spotify_playlist_id', ''),
                     image_index=image_index,
                     bio_selector=scraper_cfg.get('bio_selector', ''),
-                    stages=s.get('stages', []),
+                    stages=list(s.get('stages', [])),
                     map=s.get('map', ''),
                 )
             except Exception:
@@ -0,0 +1,47 @@
+"""JSON serialization utilities (uses orjson when it is installed)."""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_compact(obj) -> str:
+    """
+    Serialize obj to a compact JSON string.
+
+    Non-ASCII characters are kept as-is and no whitespace is emitted, which
+    keeps payloads embedded in HTML pages small. Uses orjson when available
+    and falls back to the standard library otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def dumps_pretty(obj) -> str:
+    """
+    Serialize obj to JSON indented by two spaces, with non-ASCII characters
+    kept as-is.
+
+    The output is identical to json.dumps(obj, indent=2, ensure_ascii=False)
+    for string-keyed data. Uses orjson when available and falls back to the
+    standard library otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def loads_json(data):
+    """
+    Parse JSON from a str or bytes object.
+
+    Uses orjson when available and falls back to the standard library
+    otherwise. Both raise a json.JSONDecodeError subclass on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
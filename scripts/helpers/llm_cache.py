@@ -0,0 +1,89 @@
+"""
+Persistent SQLite cache for AI (LLM) responses.
+
+Responses are stored under a SHA-256 key built from everything that
+influences the output (model, prompt version, inputs), so re-running an
+enrichment on another branch or after manual CSV edits does not pay for
+the same API call twice. fetch_spotify_links.py stores its Spotify artist
+searches here as well.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+LLM_CACHE_PATH = Path.home() / ".cache" / "lineup-radar" / "llm.db"
+
+_connection = None
+_lock = threading.Lock()
+_enabled = True
+
+
+def disable_llm_cache():
+    """Bypass the cache for the rest of the process (reads and writes)."""
+    global _enabled
+    _enabled = False
+
+
+def make_cache_key(*parts: str) -> str:
+    """Build a cache key from the given parts (model, prompt version, inputs...)."""
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Open (and create if needed) the cache database. Caller must hold _lock."""
+    global _connection
+    if _connection is None:
+        LLM_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _connection = sqlite3.connect(str(LLM_CACHE_PATH), check_same_thread=False)
+        # WAL lets concurrent runs (e.g. translating while enriching) read the
+        # cache while another process is writing to it.
+        _connection.execute("PRAGMA journal_mode=WAL")
+        _connection.execute(
+            "CREATE TABLE IF NOT EXISTS calls("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, ts INTEGER NOT NULL, ttl INTEGER)"
+        )
+        _connection.commit()
+    return _connection
+
+
+def get_cached_response(key: str) -> Optional[str]:
+    """
+    Return the cached response text for key, or None on a miss.
+
+    Entries with a TTL (in seconds) are treated as misses once expired.
+    """
+    if not _enabled:
+        return None
+    try:
+        with _lock:
+            row = _get_connection().execute(
+                "SELECT response, ts, ttl FROM calls WHERE key = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    response, ts, ttl = row
+    if ttl is not None and ts + ttl < time.time():
+        return None
+    return response
+
+
+def store_response(key: str, response: str, ttl: Optional[int] = None):
+    """Store a response text under key (ttl in seconds, None = never expires)."""
+    if not _enabled:
+        return
+    try:
+        with _lock:
+            connection = _get_connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO calls(key, response, ts, ttl) VALUES (?, ?, ?, ?)",
+                (key, response, int(time.time()), ttl)
+            )
+            connection.commit()
+    except sqlite3.Error as e:
+        print(f"  ⚠️  Could not write LLM cache: {e}")
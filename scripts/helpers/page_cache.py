@@ -0,0 +1,85 @@
+"""
+Persistent SQLite cache for fetched festival pages.
+
+Pages are stored together with their ETag / Last-Modified validators, so a
+re-fetch can be sent as a conditional request: the festival site answers
+"304 Not Modified" and the cached HTML is reused instead of downloaded again.
+The HTML is stored zlib-compressed; entries written as plain text by older
+versions are still read.
+"""
+
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Optional, Tuple
+
+PAGE_CACHE_PATH = Path.home() / ".cache" / "lineup-radar" / "pages.db"
+
+_connection = None
+_lock = threading.Lock()
+_enabled = True
+
+
+def disable_page_cache():
+    """Bypass the cache for the rest of the process (reads and writes)."""
+    global _enabled
+    _enabled = False
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Open (and create if needed) the cache database. Caller must hold _lock."""
+    global _connection
+    if _connection is None:
+        PAGE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _connection = sqlite3.connect(str(PAGE_CACHE_PATH), check_same_thread=False)
+        _connection.execute(
+            "CREATE TABLE IF NOT EXISTS pages("
+            "url TEXT PRIMARY KEY, html TEXT NOT NULL, etag TEXT, last_modified TEXT, ts INTEGER NOT NULL)"
+        )
+        _connection.commit()
+    return _connection
+
+
+def get_cached_page(url: str) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+    """
+    Return (html, etag, last_modified) for a cached page, or None on a miss.
+    """
+    if not _enabled:
+        return None
+    try:
+        with _lock:
+            row = _get_connection().execute(
+                "SELECT html, etag, last_modified FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    html, etag, last_modified = row
+    if isinstance(html, bytes):
+        try:
+            html = zlib.decompress(html).decode('utf-8')
+        except (zlib.error, UnicodeDecodeError):
+            return None
+    return html, etag, last_modified
+
+
+def store_page(url: str, html: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+    """
+    Store a page with its validators. Pages without an ETag or Last-Modified
+    header cannot be revalidated and are not stored.
+    """
+    if not _enabled or not (etag or last_modified):
+        return
+    try:
+        with _lock:
+            connection = _get_connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO pages(url, html, etag, last_modified, ts) VALUES (?, ?, ?, ?, ?)",
+                (url, zlib.compress(html.encode('utf-8')), etag, last_modified, int(time.time()))
+            )
+            connection.commit()
+    except sqlite3.Error as e:
+        print(f"  ⚠️  Could not write page cache: {e}")
@@ -0,0 +1,90 @@
+"""
+Thread-safe token-bucket rate limiter for outgoing API requests.
+"""
+
+import re
+import threading
+import time
+from typing import Mapping, Optional
+
+_DURATION_PART_RE = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+
+
+class RateLimiter:
+    """
+    Allow at most `rate` requests per `period` seconds across all threads.
+
+    Callers block in acquire() until a token is available, so a pool of
+    workers stays just under the limit instead of being throttled (HTTP 429)
+    and backing off afterwards. The bucket holds at least one token, so rates
+    below one request per period (e.g. 0.5 per second) work too.
+
+    Raises:
+        ValueError: If rate or period is not positive
+    """
+
+    def __init__(self, rate: float, period: float = 1.0):
+        if not (rate > 0 and period > 0):
+            raise ValueError(f"rate and period must be positive (got rate={rate}, period={period})")
+        self.rate = rate
+        self.period = period
+        self._capacity = max(rate, 1.0)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._tokens = min(self._capacity, self._tokens + elapsed * self.rate / self.period)
+                self._updated = now
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) * self.period / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hold back all callers for the given number of seconds."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """
+        Pause until the server-side window resets when the response headers
+        (x-ratelimit-remaining-requests / x-ratelimit-reset-requests) report
+        that no requests are left.
+        """
+        remaining = headers.get('x-ratelimit-remaining-requests')
+        if remaining is None or not remaining.strip().isdigit() or int(remaining) > 0:
+            return
+        reset = parse_duration(headers.get('x-ratelimit-reset-requests', ''))
+        self.pause(reset if reset is not None else self.period)
+
+
+def parse_duration(value: str) -> Optional[float]:
+    """
+    Parse a rate-limit duration such as "20", "1.5s", "6m0s" or "250ms" into seconds.
+
+    Returns:
+        Number of seconds, or None if the value cannot be parsed
+    """
+    value = (value or '').strip()
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART_RE.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
@@ -15,6 +15,7 @@ from bs4 import BeautifulSoup
 from .slug import artist_name_to_slug
 from .config import FestivalConfig
 from .ai_client import clean_scraped_text
+from .page_cache import get_cached_page, store_page
 
 
 # Path to store learned selectors
@@ -163,20 +164,36 @@ class FestivalScraper:
             except Exception as e:
                 print(f"  ⚠️  Selenium error fetching {url}: {e}")
                 return None
-        # Fallback to requests for static pages
+        # Fallback to requests for static pages; revalidate cached copies
+        # with a conditional request so unchanged pages are not downloaded again
+        cached = get_cached_page(url)
+        headers = {'User-Agent': self.user_agent}
+        if cached:
+            _, etag, last_modified = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
         try:
-            req = urllib.request.Request(url, headers={'User-Agent': self.user_agent})
+            req = urllib.request.Request(url, headers=headers)
             with urllib.request.urlopen(req, timeout=timeout) as response:
-                return response.read().decode('utf-8')
+                html = response.read().decode('utf-8')
+                store_page(url, html, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                return html
         except urllib.error.HTTPError as e:
+            if e.code == 304 and cached:
+                return cached[0]
             if e.code == 404:
                 print(f"  ⚠️  Page not found (404): {url}")
-            else:
-                print(f"  ⚠️  HTTP error {e.code}: {url}")
-            return None
+                return None
+            print(f"  ⚠️  HTTP error {e.code}: {url}")
         except Exception as e:
             print(f"  ⚠️  Error fetching {url}: {e}")
-            return None
+        # Server or network error: fall back to the last cached copy, if any
+        if cached:
+            print(f"  ↷ Using cached copy of {url}")
+            return cached[0]
+        return None
     
     def get_artist_page_url(self, artist_name: str) -> str:
         """
@@ -246,11 +263,14 @@ class FestivalScraper:
         Returns:
             Bio text or empty string if not found
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        # Parsing the page with BeautifulSoup is the expensive step, so it is
+        # only done once a CSS selector is needed; the regex heuristics often suffice
+        soup = None
         
         # Try learned selector first
         learned = self.learned_selectors.get(self.festival_key, {}).get('bio_selector')
         if learned:
+            soup = BeautifulSoup(html, 'html.parser')
             try:
                 element = soup.select_one(learned)
                 if element:
@@ -275,7 +295,7 @@ class FestivalScraper:
             selector = prompt_user_for_selector(
                 'artist bio/description',
                 self.config.get_artist_url(artist_name_to_slug(artist_name)) if artist_name else self.config.lineup_url,
-                soup,
+                soup or BeautifulSoup(html, 'html.parser'),
                 hints=[
                     '.artist-bio',
                     '.bio',
@@ -294,7 +314,7 @@ class FestivalScraper:
                 self.session_learned = True
                 
                 # Extract using the new selector
-                element = soup.select_one(selector)
+                element = (soup or BeautifulSoup(html, 'html.parser')).select_one(selector)
                 if element:
                     text = element.get_text(strip=True)
                     # Clean up whitespace issues before returning
@@ -302,8 +322,8 @@ class FestivalScraper:
         
         return ""
     
-    def _try_bio_heuristics(self, html: str, soup: BeautifulSoup) -> str:
-        """Try various heuristic patterns to find bio."""
+    def _try_bio_heuristics(self, html: str, soup: Optional[BeautifulSoup] = None) -> str:
+        """Try various heuristic patterns to find bio (soup is parsed here if not given)."""
         import re
         
         # Try Down The Rabbit Hole specific pattern first (most specific)
@@ -327,6 +347,8 @@ class FestivalScraper:
                 return bio_text
         
         # Try common CSS selectors
+        if soup is None:
+            soup = BeautifulSoup(html, 'html.parser')
         bio_selectors = [
             'div.artist-bio',
             'div.artist-description',
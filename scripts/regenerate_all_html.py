@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Regenerate the lineup index pages for all festivals and years.
+
+Scans docs/<festival>/<year>/<year>.csv and calls generate_html() in-process
+for each CSV file found. Files are processed in parallel since the work is
+mostly independent I/O.
+"""
+
+import sys
+from pathlib import Path
+
+# Add scripts directory to path for helpers module
+sys.path.insert(0, str(Path(__file__).parent))
+
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from helpers import get_festival_config
+
+# Each module falls back on its own, so one failed import doesn't disable the other
+try:
+    from generate_html import generate_html
+except ImportError:
+    generate_html = None
+
+try:
+    from generate_festival_readme import generate_readme
+except ImportError:
+    generate_readme = None
+
+
+def find_csv_files(output_dir):
+    """Return all docs/<festival>/<year>/<year>.csv files, sorted."""
+    csv_files = []
+    for csv_file in sorted(Path(output_dir).glob("*/*/*.csv")):
+        year_dir = csv_file.parent
+        if csv_file.stem.isdigit() and csv_file.stem == year_dir.name:
+            csv_files.append(csv_file)
+    return csv_files
+
+
+def is_up_to_date(csv_file, output_dir):
+    """Return True if index.html is newer than the CSV and its settings.json."""
+    index_file = Path(output_dir) / csv_file.parent.parent.name / csv_file.stem / "index.html"
+    if not index_file.exists():
+        return False
+    sources = [csv_file, csv_file.parent / "settings.json"]
+    newest_source = max(p.stat().st_mtime for p in sources if p.exists())
+    return index_file.stat().st_mtime >= newest_source
+
+
+def regenerate_csv(csv_file, output_dir, config):
+    """Regenerate the lineup page for a single CSV file."""
+    festival = csv_file.parent.parent.name
+    year = csv_file.stem
+
+    if generate_html is not None:
+        # Run in-process to avoid paying interpreter start-up per file
+        generate_html(str(csv_file), output_dir, config)
+        if generate_readme is not None:
+            generate_readme(config.slug, config.year)
+        return
+
+    # Fallback: run generate_html.py as a separate process
+    script = Path(__file__).parent / "generate_html.py"
+    result = subprocess.run(
+        [sys.executable, str(script), "--festival", festival, "--year", year, "--output", output_dir],
+        capture_output=True,
+        text=True,
+        encoding="utf-8"
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or result.stdout.strip())
+
+
+def main():
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Regenerate lineup index pages for all festival CSV files"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="docs",
+        help="Output directory (default: docs)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate pages even if index.html is newer than the CSV"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 4,
+        help="Number of parallel workers (default: CPU count)"
+    )
+
+    args = parser.parse_args()
+
+    csv_files = find_csv_files(args.output)
+    if not csv_files:
+        print(f"No festival CSV files found in {args.output}/")
+        sys.exit(1)
+
+    print(f"\n=== Regenerating {len(csv_files)} lineup page(s) ===\n")
+
+    to_regenerate = []
+    for csv_file in csv_files:
+        label = f"{csv_file.parent.parent.name}/{csv_file.name}"
+        if not args.force and is_up_to_date(csv_file, args.output):
+            print(f"  ⊘ {label} up to date")
+            continue
+        # Only directories with a festival config (settings.json) are lineups
+        try:
+            config = get_festival_config(csv_file.parent.parent.name, int(csv_file.stem))
+        except ValueError:
+            print(f"  ⚠ {label} skipped: no festival config for this directory")
+            continue
+        to_regenerate.append((csv_file, config))
+
+    success_count = 0
+    failure_count = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(regenerate_csv, csv_file, args.output, config): csv_file
+            for csv_file, config in to_regenerate
+        }
+        for future in as_completed(futures):
+            csv_file = futures[future]
+            label = f"{csv_file.parent.parent.name}/{csv_file.name}"
+            try:
+                future.result()
+                print(f"  ✓ {label}")
+                success_count += 1
+            except Exception as e:
+                print(f"  ✗ {label}: {e}")
+                failure_count += 1
+
+    print(f"\n✓ Regenerated {success_count} page(s)" + (f", {failure_count} failed" if failure_count else ""))
+    if failure_count:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -70,3 +70,54 @@ class TestCSVOperations:
         assert loaded_rows[0]['Artist'] == 'Ärtiśt Nãmé'
         assert '€uro' in loaded_rows[0]['Bio']
         assert '日本語' in loaded_rows[0]['Bio']
+
+
+class TestReadCsvRows:
+    """Tests for the CSV reader in generate_html."""
+    
+    def test_quoted_fields_match_csv_module(self, temp_csv_file, sample_csv_data):
+        """Test quoted CSV content is parsed like csv.DictReader."""
+        from generate_html import read_csv_rows
+        
+        headers, rows = read_csv_rows(temp_csv_file)
+        
+        assert headers == sample_csv_data['headers']
+        assert rows == sample_csv_data['rows']
+    
+    def test_bom_crlf_and_short_rows(self, tmp_path):
+        """Test quote-free CSV with BOM, CRLF and short rows."""
+        from generate_html import read_csv_rows
+        
+        csv_file = tmp_path / "plain.csv"
+        csv_file.write_bytes('﻿Artist,Genre\r\nÄrtist,Rock\r\nSolo\r\n'.encode('utf-8'))
+        
+        headers, rows = read_csv_rows(csv_file)
+        
+        assert headers == ['Artist', 'Genre']
+        assert rows == [
+            {'Artist': 'Ärtist', 'Genre': 'Rock'},
+            {'Artist': 'Solo', 'Genre': ''},
+        ]
+    
+    def test_unicode_line_separators_stay_in_field(self, tmp_path):
+        """Test form feeds and U+2028 in a bio do not start a new row."""
+        from generate_html import read_csv_rows
+        
+        csv_file = tmp_path / "separators.csv"
+        csv_file.write_text('Artist,Bio\nA,one\x0ctwo\u2028three\nB,plain\n', encoding='utf-8')
+        
+        headers, rows = read_csv_rows(csv_file)
+        
+        assert rows == [
+            {'Artist': 'A', 'Bio': 'one\x0ctwo\u2028three'},
+            {'Artist': 'B', 'Bio': 'plain'},
+        ]
+    
+    def test_empty_file(self, tmp_path):
+        """Test empty CSV returns no headers and no rows."""
+        from generate_html import read_csv_rows
+        
+        csv_file = tmp_path / "empty.csv"
+        csv_file.write_text('', encoding='utf-8')
+        
+        assert read_csv_rows(csv_file) == ([], [])
@@ -0,0 +1,190 @@
+"""
+Tests for enrich_artists.py
+"""
+import pytest
+import enrich_artists
+from enrich_artists import (
+    ESSENTIAL_FIELDS, STATIC_PROMPT_PREFIX, create_enrichment_prompt, create_batch_enrichment_prompt, enrich_artists_batch,
+    enrichment_inputs,
+    extract_bio_facts, fill_facts_from_bio, needs_enrichment, parse_ai_json, select_rows_to_enrich
+)
+
+
+class TestCreateEnrichmentPrompt:
+    """Tests for the enrichment prompt builders."""
+
+    def test_static_prefix_is_stable(self):
+        """Test that the static rubric ends with exactly one newline."""
+        assert STATIC_PROMPT_PREFIX == STATIC_PROMPT_PREFIX.strip() + "\n"
+
+    def test_prompt_starts_with_static_prefix(self):
+        """Test that prompts only differ after the shared prefix."""
+        without_bio = create_enrichment_prompt("Artist A")
+        with_bio = create_enrichment_prompt("Artist B", "A {curly} bio")
+        assert without_bio.startswith(STATIC_PROMPT_PREFIX)
+        assert with_bio.startswith(STATIC_PROMPT_PREFIX)
+        assert without_bio[len(STATIC_PROMPT_PREFIX):] == '\nARTIST: "Artist A"'
+        assert with_bio[len(STATIC_PROMPT_PREFIX):] == '\nARTIST: "Artist B"\nBIO: "A {curly} bio"'
+
+    def test_festival_bio_is_appended_last(self):
+        """Test that the festival bio for metadata extraction goes at the very end."""
+        prompt = create_enrichment_prompt("Artist A", festival_bio="A Berlin trio")
+        assert prompt[len(STATIC_PROMPT_PREFIX):] == '\nARTIST: "Artist A"\nFESTIVAL BIO: "A Berlin trio"'
+
+    def test_batch_prompt_starts_with_static_prefix(self):
+        """Test that batch prompts share the same prefix and list every artist."""
+        prompt = create_batch_enrichment_prompt([("Artist A", "", ""), ("Artist B", "Bio", "")])
+        assert prompt.startswith(STATIC_PROMPT_PREFIX)
+        assert "EACH of the 2 artists" in prompt
+        assert '"artist": "Artist B"' in prompt
+
+
+class TestEnrichmentInputs:
+    """Tests for enrichment_inputs function."""
+
+    def test_festival_bio_only_without_existing_bio(self):
+        """Test that the festival bio is only sent when there is no bio to preserve."""
+        row = {"Artist": " A ", "Bio": "Bio", "Festival Bio (EN)": "", "Festival Bio (NL)": "NL bio"}
+        assert enrichment_inputs(row) == ("A", "Bio", "")
+        assert enrichment_inputs(row, force=True) == ("A", "", "NL bio")
+
+
+class TestSelectRowsToEnrich:
+    """Tests for select_rows_to_enrich function."""
+
+    HEADERS = ["Artist", "Tagline", "Genre", "Country", "Bio", "AI Summary", "AI Rating"]
+
+    def _row(self, artist, **overrides):
+        row = {field: "x" for field in self.HEADERS}
+        row["Artist"] = artist
+        row.update(overrides)
+        return row
+
+    def test_selects_incomplete_rows(self):
+        """Test that only rows with an empty essential field are selected."""
+        rows = [self._row("A"), self._row("B", Genre=" "), self._row("C", Bio="")]
+        assert select_rows_to_enrich(self.HEADERS, rows) == [1, 2]
+
+    def test_skips_rows_without_artist(self):
+        """Test that rows without an artist name are never selected."""
+        rows = [self._row("", Genre=""), self._row("B", Genre="")]
+        assert select_rows_to_enrich(self.HEADERS, rows) == [1]
+
+    def test_artist_filter_and_force(self):
+        """Test case-insensitive artist filter combined with force mode."""
+        rows = [self._row("Alpha"), self._row("Beta")]
+        assert select_rows_to_enrich(self.HEADERS, rows, force=True, artist_name_filter="beta") == [1]
+
+    def test_missing_columns_fall_back_to_row_lookup(self):
+        """Test CSVs without every essential column."""
+        headers = ["Artist", "Genre"]
+        rows = [{"Artist": "A", "Genre": "rock"}]
+        assert select_rows_to_enrich(headers, rows) == [0]
+
+
+class TestParseAiJson:
+    """Tests for parse_ai_json function."""
+
+    @pytest.mark.parametrize("content", [
+        '{"a": 1}',
+        '  ```json\n{"a": 1}\n```  ',
+        '```\n{"a": 1}\n```',
+        'Here you go:\n```json\n{"a": 1}\n```\nEnjoy!',
+        '```json\n{"a": 1}',
+    ])
+    def test_strips_code_fences(self, content):
+        """Test plain, fenced, prefixed and unterminated responses."""
+        assert parse_ai_json(content) == '{"a": 1}'
+
+
+class TestNeedsEnrichment:
+    """Tests for needs_enrichment function."""
+
+    def test_complete_row(self):
+        """Test that a row with every essential field filled is complete."""
+        row = {field: "x" for field in ESSENTIAL_FIELDS}
+        assert needs_enrichment(row) is False
+        assert needs_enrichment(row, force=True) is True
+
+    @pytest.mark.parametrize("value", ["", "   ", None])
+    def test_empty_field(self, value):
+        """Test empty, whitespace-only and missing (None) values."""
+        row = {field: "x" for field in ESSENTIAL_FIELDS}
+        row["Country"] = value
+        assert needs_enrichment(row) is True
+
+
+class TestExtractBioFacts:
+    """Tests for extract_bio_facts function."""
+
+    def test_group_size(self):
+        """Test that a single group-size word sets the number of people."""
+        assert extract_bio_facts("A Berlin trio making krautrock.") == {"Number of People in Act": "3"}
+
+    def test_ambiguous_group_size_is_skipped(self):
+        """Test that conflicting group-size words are ignored."""
+        assert "Number of People in Act" not in extract_bio_facts("The duo grew into a quartet.")
+
+    def test_consistent_pronouns_set_gender(self):
+        """Test that consistent pronouns set the front person gender."""
+        bio = "She writes her songs at night, alone in her studio."
+        assert extract_bio_facts(bio) == {"Gender of Front Person": "Female"}
+
+    def test_mixed_or_sparse_pronouns_are_skipped(self):
+        """Test that mixed or single pronouns do not set a gender."""
+        assert extract_bio_facts("He met her in Paris; his band followed.") == {}
+        assert extract_bio_facts("Their sound, as he says, is loud.") == {}
+
+    @pytest.mark.parametrize("bio", [
+        "Formerly half of the duo Night Drive, Sam now records alone.",
+        "An ex-member of the quartet Bloom, Robin makes ambient music.",
+        "Part of the trio Loma, Emily releases her solo debut.",
+    ])
+    def test_other_groups_do_not_set_group_size(self, bio):
+        """Test that a group the artist was or is part of does not count as the act's size."""
+        assert "Number of People in Act" not in extract_bio_facts(bio)
+
+    def test_stray_pronouns_do_not_set_gender(self):
+        """Test that a few pronouns about someone else do not set a gender."""
+        assert extract_bio_facts("The band toured with Anna Lee, and she joined them on her last night.") == {}
+        assert extract_bio_facts("Produced by Jane Doe, she says the record is raw.") == {}
+
+
+class TestFillFactsFromBio:
+    """Tests for fill_facts_from_bio function."""
+
+    def test_only_empty_fields_are_filled(self):
+        """Test that existing values are kept and only empty columns are filled."""
+        rows = [
+            {"Artist": "A", "Bio": "A Berlin trio making krautrock.", "Number of People in Act": "",
+             "Gender of Front Person": "Mixed"},
+            {"Artist": "B", "Bio": "A Berlin trio making krautrock.", "Number of People in Act": "4",
+             "Gender of Front Person": ""},
+        ]
+        assert fill_facts_from_bio(rows) == 1
+        assert rows[0]["Number of People in Act"] == "3"
+        assert rows[0]["Gender of Front Person"] == "Mixed"
+        assert rows[1]["Number of People in Act"] == "4"
+
+
+class TestEnrichArtistsBatch:
+    """Tests for enrich_artists_batch function."""
+
+    def test_mismatched_echoed_name_falls_back(self, monkeypatch):
+        """Test that a batch answer for another artist is neither used nor cached."""
+        answer = '{"artists": [{"Artist": "A", "Genre": "Rock"}, {"Artist": "A", "Genre": "Jazz"}]}'
+        stored, single = [], []
+        monkeypatch.setattr(enrich_artists, "resolve_ai_credentials", lambda: ("https://x", {}, "model", True))
+        monkeypatch.setattr(enrich_artists, "get_cached_response", lambda key: None)
+        monkeypatch.setattr(enrich_artists, "store_response", lambda key, value: stored.append(value))
+        monkeypatch.setattr(enrich_artists, "post_chat_completion",
+                            lambda *args: {"choices": [{"message": {"content": answer}}]})
+        monkeypatch.setattr(enrich_artists, "finalize_artist_data", lambda name, data, boost, provider: data)
+        monkeypatch.setattr(enrich_artists, "enrich_artist_with_ai",
+                            lambda name, *args: single.append(name) or {"Genre": "Pop"})
+
+        results = enrich_artists_batch([("a ", "", ""), ("B", "", "")])
+
+        assert results == [{"Genre": "Rock"}, {"Genre": "Pop"}]
+        assert stored == ['{"Genre":"Rock"}']
+        assert single == ["B"]
@@ -0,0 +1,92 @@
+"""
+Tests for helpers/rate_limiter.py
+"""
+import threading
+import time
+import pytest
+from helpers.rate_limiter import RateLimiter, parse_duration
+
+
+class TestParseDuration:
+    """Tests for parse_duration function."""
+
+    @pytest.mark.parametrize("value,expected", [
+        ("20", 20.0),
+        ("1.5s", 1.5),
+        ("6m0s", 360.0),
+        ("250ms", 0.25),
+        ("1h", 3600.0),
+    ])
+    def test_valid_durations(self, value, expected):
+        """Test plain seconds and unit-suffixed durations."""
+        assert parse_duration(value) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("value", ["", None, "soon"])
+    def test_invalid_durations(self, value):
+        """Test unparseable values return None."""
+        assert parse_duration(value) is None
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter class."""
+
+    def test_burst_then_throttle(self):
+        """Test that requests beyond the bucket size are delayed."""
+        limiter = RateLimiter(rate=20, period=1.0)
+        start = time.monotonic()
+        for _ in range(22):
+            limiter.acquire()
+        assert time.monotonic() - start >= 0.08
+
+    def test_rate_below_one_per_period(self):
+        """Test that a rate below 1 per period still lets requests through."""
+        limiter = RateLimiter(rate=0.5, period=0.1)  # One request per 0.2s
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start < 0.05
+        limiter.acquire()
+        assert 0.19 <= time.monotonic() - start < 0.5
+
+    @pytest.mark.parametrize("rate,period", [(0, 1.0), (-1, 1.0), (1, 0)])
+    def test_rejects_non_positive_values(self, rate, period):
+        """Test that a zero or negative rate or period is rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate, period)
+
+    def test_pause_from_exhausted_headers(self):
+        """Test that zero remaining requests pauses until the reset time."""
+        limiter = RateLimiter(rate=100, period=1.0)
+        limiter.update_from_headers({
+            'x-ratelimit-remaining-requests': '0',
+            'x-ratelimit-reset-requests': '100ms'
+        })
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start >= 0.09
+
+    def test_no_pause_when_requests_remain(self):
+        """Test that remaining requests do not pause the limiter."""
+        limiter = RateLimiter(rate=100, period=1.0)
+        limiter.update_from_headers({'x-ratelimit-remaining-requests': '5'})
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start < 0.05
+
+    def test_pause_applies_to_other_threads(self):
+        """Test that a pause set by one worker holds back the others."""
+        limiter = RateLimiter(rate=100, period=1.0)
+        limiter.pause(0.1)
+        waited = []
+
+        def worker():
+            start = time.monotonic()
+            limiter.acquire()
+            waited.append(time.monotonic() - start)
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(waited) == 3
+        assert min(waited) >= 0.09